@@ -0,0 +1,312 @@
+"""
+Parser benchmark suite.
+
+Generates deterministic synthetic logs for every format the universal parser
+supports, parses each with parse_universal_log in a fresh process and reports
+lines/s, MB/s, peak memory and the time spent in each parse stage. Results can
+be saved as a baseline and later runs compared against it.
+
+    python benchmark_parser.py --lines 10K,1M --save-baseline before.json
+    python benchmark_parser.py --lines 10K,1M --compare before.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+from universal_log_parser import ParseReport, parse_universal_log, PARSE_ENGINES
+
+# Optional imports
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:
+    HAS_RESOURCE = False
+
+
+GENERATOR_BLOCK_LINES = 100_000  # Lines formatted per write when generating a log
+DEFAULT_SCALES = "10K,100K,1M"
+DEFAULT_DATA_DIR = os.path.join(tempfile.gettempdir(), 'clan_benchmark_logs')
+REGRESSION_TOLERANCE = 0.10  # Slowdown (fraction of lines/s) reported as a regression
+BASE_TIME = datetime(2024, 1, 15, 10, 30)
+
+
+# ============ Synthetic log generators ============
+
+def write_lines(path: str, n_lines: int, make_line: Callable[[int], str], header: List[str] = ()):
+    """Write the header lines and make_line(i) for i < n_lines, in blocks."""
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        for line in header:
+            f.write(line + '\n')
+        for start in range(0, n_lines, GENERATOR_BLOCK_LINES):
+            block = [make_line(i) for i in range(start, min(start + GENERATOR_BLOCK_LINES, n_lines))]
+            f.write('\n'.join(block) + '\n')
+
+
+def timestamp_text(i: int, step_ms: int = 10) -> str:
+    return (BASE_TIME + timedelta(milliseconds=i * step_ms)).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+
+
+def generate_interleaved(path: str, n_lines: int, seed: int = 0):
+    """Message-type log with a header line per type, as written by mavros/ROS nodes."""
+    rng = random.Random(seed)
+    header = [f"{timestamp_text(0)},mavros,INFO,GPS_DATA,lat,lon,alt(m),fix",
+              f"{timestamp_text(0)},mavros,INFO,IMU_DATA,ax,ay,az,mode",
+              f"{timestamp_text(0)},fcu,INFO,RC_CHANNELS,ch1,ch2,ch3,ch4,rssi"]
+
+    def make_line(i):
+        kind = rng.random()
+        prefix = timestamp_text(i)
+        if kind < 0.4:
+            return f"{prefix},mavros,INFO,GPS_DATA,{28.6 + i * 1e-7:.7f},{77.2 - i * 1e-7:.7f},{500 + i % 50},3"
+        if kind < 0.8:
+            return (f"{prefix},mavros,WARN,IMU_DATA,{rng.uniform(-1, 1):.4f},{rng.uniform(-1, 1):.4f},"
+                    f"{9.81 + rng.uniform(-0.1, 0.1):.4f},{rng.choice(('LOITER', 'AUTO', 'RTL'))}")
+        channels = ','.join(str(rng.randint(1000, 2000)) for _ in range(4))
+        return f"{prefix},fcu,INFO,RC_CHANNELS,{channels},{rng.randint(0, 255)}"
+
+    write_lines(path, n_lines - len(header), make_line, header)
+
+
+def generate_standard_header(path: str, n_lines: int, seed: int = 0):
+    """CSV with a header row and a datetime first column (lowercase text, so no column looks like a message type)."""
+    rng = random.Random(seed)
+
+    def make_line(i):
+        return (f"{timestamp_text(i)},{100 + rng.uniform(-5, 5):.3f},{rng.uniform(0, 15):.2f},"
+                f"{rng.choice(('manual', 'auto'))},{i % 2}")
+
+    write_lines(path, n_lines - 1, make_line, ["time,altitude,speed,mode,armed"])
+
+
+def generate_standard_no_header(path: str, n_lines: int, seed: int = 0):
+    """TSV without a header row, time of day in the first column."""
+    rng = random.Random(seed)
+
+    def make_line(i):
+        return f"{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}\t{i}\t{rng.uniform(0, 100):.2f}\tok"
+
+    write_lines(path, n_lines, make_line)
+
+
+def generate_mixed(path: str, n_lines: int, seed: int = 0):
+    """Semicolon-separated log whose lines have different column counts."""
+    rng = random.Random(seed)
+
+    def make_line(i):
+        if i % 3:
+            return f"{timestamp_text(i, 1000)[:19]};{i};{rng.uniform(0, 10):.2f}"
+        return f"{timestamp_text(i, 1000)[:19]};{i};{rng.uniform(0, 10):.2f};ev{i % 20};{i * 3}"
+
+    write_lines(path, n_lines, make_line)
+
+
+def generate_mmss_elapsed(path: str, n_lines: int, seed: int = 0):
+    """CSV whose time column is elapsed MM:SS.s (converted to seconds by the parser)."""
+    rng = random.Random(seed)
+
+    def make_line(i):
+        tenths = i % 600000
+        return (f"{tenths // 600:02d}:{tenths // 10 % 60:02d}.{tenths % 10},{rng.randint(0, 4000)},"
+                f"{rng.uniform(0, 30):.2f},{i % 2},{rng.choice(('true', 'false'))}")
+
+    write_lines(path, n_lines - 1, make_line, ["time,height,speed,flag,ok"])
+
+
+def generate_datetime_prefixed(path: str, n_lines: int, seed: int = 0):
+    """Pipe-separated log lines starting with an ISO date/time, no header."""
+    rng = random.Random(seed)
+
+    def make_line(i):
+        return (f"{timestamp_text(i).replace(' ', 'T')}|{rng.choice(('baro', 'mag', 'gps'))}|"
+                f"{rng.uniform(-50, 50):.3f}|{rng.randint(0, 3)}")
+
+    write_lines(path, n_lines, make_line)
+
+
+GENERATORS = {
+    'interleaved': generate_interleaved,
+    'standard_header': generate_standard_header,
+    'standard_no_header': generate_standard_no_header,
+    'mixed': generate_mixed,
+    'mmss_elapsed': generate_mmss_elapsed,
+    'datetime_prefixed': generate_datetime_prefixed,
+}
+
+
+def synthetic_log(data_dir: str, fmt: str, n_lines: int, seed: int = 0) -> str:
+    """Path of the generated log, generating it unless it already exists."""
+    extension = '.tsv' if fmt == 'standard_no_header' else '.log'
+    path = os.path.join(data_dir, f"{fmt}_{n_lines}_{seed}{extension}")
+    if not os.path.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        print(f"Generating {os.path.basename(path)}...", flush=True)
+        tmp_path = path + '.tmp'
+        GENERATORS[fmt](tmp_path, n_lines, seed)
+        os.replace(tmp_path, path)
+    return path
+
+
+# ============ Measurement ============
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident memory of this process, if the platform reports it."""
+    if not HAS_RESOURCE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_case(path: str, fmt: str, n_lines: int, engine: str, workers: Optional[int], trace_memory: bool) -> Dict:
+    """Parse one log and measure it; meant to run in a fresh process so memory peaks are its own."""
+    rss_before = peak_rss_mb()
+    report = ParseReport(trace_memory=trace_memory)
+    with contextlib.redirect_stdout(io.StringIO()):
+        dataframes, _ = parse_universal_log(path, use_cache=False, engine=engine, workers=workers, report=report)
+    seconds = report.wall_seconds
+    stages = {name: stats.to_dict() for name, stats in report.stage_totals().items()}
+    traced_peaks = [stats['peak_traced_bytes'] for stats in stages.values() if stats['peak_traced_bytes'] is not None]
+
+    size_mb = os.path.getsize(path) / (1024 * 1024)
+    return {
+        'format': fmt,
+        'lines': n_lines,
+        'engine': engine,
+        'workers': workers,
+        'trace_memory': trace_memory,
+        'size_mb': round(size_mb, 3),
+        'rows': sum(len(df) for df in dataframes.values()),
+        'frames': len(dataframes),
+        'seconds': round(seconds, 4),
+        'cpu_seconds': round(report.cpu_seconds, 4),
+        'lines_per_sec': round(n_lines / seconds),
+        'mb_per_sec': round(size_mb / seconds, 3),
+        'rss_before_mb': rss_before,
+        'peak_rss_mb': peak_rss_mb(),
+        'peak_worker_rss_mb': (report.peak_worker_rss_bytes / (1024 * 1024)
+                               if report.peak_worker_rss_bytes is not None else None),
+        'traced_peak_mb': max(traced_peaks) / (1024 * 1024) if traced_peaks else None,
+        'stages': stages,
+    }
+
+
+def run_isolated(*args) -> Dict:
+    """Run run_case in a new interpreter (spawned, so nothing is inherited from earlier cases)."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+        return executor.submit(run_case, *args).result()
+
+
+# ============ Reporting ============
+
+def case_key(result: Dict) -> tuple:
+    # Traced runs are much slower, so they are only compared with traced runs
+    return result['format'], result['lines'], result['engine'], result['workers'], result.get('trace_memory', False)
+
+
+def format_result(result: Dict) -> str:
+    memory = f"RSS {result['peak_rss_mb']:.0f} MB" if result['peak_rss_mb'] is not None else "RSS n/a"
+    if result.get('peak_worker_rss_mb'):
+        memory += f", workers {result['peak_worker_rss_mb']:.0f} MB"
+    if result['traced_peak_mb'] is not None:
+        memory += f", traced {result['traced_peak_mb']:.1f} MB"
+    stages = ', '.join(f"{name} {stats['wall_seconds']:.2f}s" for name, stats in result['stages'].items())
+    return (f"{result['format']:<20} {result['lines']:>11,} lines {result['size_mb']:>9.1f} MB "
+            f"{result['seconds']:>8.2f}s {result['lines_per_sec']:>11,} lines/s {result['mb_per_sec']:>7.1f} MB/s  "
+            f"{memory}\n{'':<22}{stages}")
+
+
+def compare_results(results: List[Dict], baseline: Dict, tolerance: float) -> int:
+    """Print each case's speed relative to the baseline; returns the number of regressions."""
+    baseline_cases = {case_key(case): case for case in baseline['cases']}
+    regressions = 0
+    print(f"\nCompared with baseline from {baseline.get('created', '?')}:")
+    for result in results:
+        before = baseline_cases.get(case_key(result))
+        if before is None:
+            print(f"  {result['format']:<20} {result['lines']:>11,}  (not in baseline)")
+            continue
+        ratio = result['lines_per_sec'] / before['lines_per_sec']
+        flag = ''
+        if ratio < 1 - tolerance:
+            flag = '  REGRESSION'
+            regressions += 1
+        memory = ''
+        if result['peak_rss_mb'] is not None and before.get('peak_rss_mb'):
+            memory = f", peak RSS {result['peak_rss_mb'] / before['peak_rss_mb']:.2f}x"
+        print(f"  {result['format']:<20} {result['lines']:>11,}  speed {ratio:.2f}x{memory}{flag}")
+    return regressions
+
+
+def parse_scale(text: str) -> int:
+    """'10K', '1M' or '50000' -> number of lines."""
+    text = text.strip().upper()
+    multiplier = {'K': 1_000, 'M': 1_000_000}.get(text[-1:], 1)
+    return int(float(text.rstrip('KM')) * multiplier)
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    arg_parser = argparse.ArgumentParser(description="Benchmark parse_universal_log on synthetic logs.")
+    arg_parser.add_argument('--formats', default='all',
+                            help=f"Comma-separated formats or 'all' ({', '.join(GENERATORS)})")
+    arg_parser.add_argument('--lines', default=DEFAULT_SCALES,
+                            help="Comma-separated log sizes in lines, e.g. 10K,1M,50M (default: %(default)s)")
+    arg_parser.add_argument('--engine', choices=PARSE_ENGINES, default='pandas')
+    arg_parser.add_argument('-w', '--workers', type=int, help="Parser processes (default: automatic)")
+    arg_parser.add_argument('--seed', type=int, default=0, help="Seed of the generated data")
+    arg_parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR,
+                            help="Where generated logs are kept for reuse (default: %(default)s)")
+    arg_parser.add_argument('--trace-memory', action='store_true',
+                            help="Also measure Python allocations per stage with tracemalloc (slows parsing)")
+    arg_parser.add_argument('--save-baseline', metavar='JSON', help="Write the results to this file")
+    arg_parser.add_argument('--compare', metavar='JSON', help="Compare with results saved by --save-baseline")
+    arg_parser.add_argument('--tolerance', type=float, default=REGRESSION_TOLERANCE,
+                            help="Slowdown reported as a regression (default: %(default)s)")
+    return arg_parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    formats = list(GENERATORS) if args.formats == 'all' else [name.strip() for name in args.formats.split(',')]
+    unknown = [name for name in formats if name not in GENERATORS]
+    if unknown:
+        print(f"Unknown formats: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    scales = [parse_scale(scale) for scale in args.lines.split(',') if scale.strip()]
+
+    results = []
+    for n_lines in scales:
+        for fmt in formats:
+            path = synthetic_log(args.data_dir, fmt, n_lines, args.seed)
+            result = run_isolated(path, fmt, n_lines, args.engine, args.workers, args.trace_memory)
+            results.append(result)
+            print(format_result(result), flush=True)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({'created': datetime.now().isoformat(timespec='seconds'),
+                       'python': platform.python_version(), 'pandas': pd.__version__,
+                       'cpu_count': os.cpu_count(), 'cases': results}, f, indent=2)
+        print(f"\nSaved baseline to {args.save_baseline}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if compare_results(results, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,19 +6,49 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Set, Tuple
 import re
+import os
 import math
 import difflib
+import queue
+import threading
+import time
+import traceback
 
 # Handle missing log_parser gracefully
 try:
-    from universal_log_parser import parse_log_file, convert_to_polars
+    from universal_log_parser import (parse_log_file, parse_log_files, convert_to_polars, read_raw_line, LazyDataFrames,
+                                      ParseProgress, ParseCancelled, ParseReport, LogTailer, latest_parse_state)
 except ImportError:
     print("Warning: log_parser module not found. Some functionality may be limited.")
-    def parse_log_file():
+    def parse_log_file(*args, **kwargs):
         messagebox.showerror("Error", "log_parser module not available!")
         return {}, ""
+    def parse_log_files(*args, **kwargs):
+        messagebox.showerror("Error", "log_parser module not available!")
+        return {}, []
     def convert_to_polars(dfs):
         return {}
+    def read_raw_line(file_path, offset, length):
+        return None
+    class LazyDataFrames(dict):
+        pass
+    class ParseCancelled(Exception):
+        pass
+    class ParseProgress:
+        def __init__(self, callback=None):
+            pass
+        def cancel(self):
+            pass
+    class ParseReport:
+        def __init__(self, trace_memory=False):
+            pass
+    class LogTailer:
+        def __init__(self, state, max_poll_bytes=None, keep_lines=None):
+            pass
+        def poll(self):
+            return {}
+    def latest_parse_state(file_path):
+        return None
 
 class Config:
     """Centralized configuration for all application parameters"""
@@ -37,8 +67,12 @@ class Config:
     
     # Button Labels
     BTN_LOAD_LOG = "Load Log File"
+    BTN_LOAD_LOGS = "Load Multiple Logs"
     BTN_PLOT_SELECTED = "Plot Selected"
     BTN_CLEAR_PLOT = "Clear Plot"
+    BTN_LIVE_START = "Start Live Tail"
+    BTN_LIVE_STOP = "Stop Live Tail"
+    BTN_PARSE_REPORT = "Parse Report"
     BTN_SEARCH = "Search"
     BTN_EXPORT_CSV = "Export to CSV"
     BTN_LOAD_ALL_ROWS = "Load All Rows"
@@ -90,6 +124,9 @@ class Config:
     DIALOG_SEARCH_ERROR = "Search Error"
     DIALOG_TABLE_ERROR = "Table Error"
     DIALOG_COMPLETE = "Complete"
+    DIALOG_SELECT_LOG = "Select log file"
+    DIALOG_SELECT_LOGS = "Select log files"
+    DIALOG_PARSE_REPORT = "Parse Report - {}"
     
     # Search Dialog Labels
     SEARCH_LABEL_TITLE = "Search in: {}"
@@ -113,6 +150,13 @@ class Config:
     MSG_LOAD_SUCCESS = "Log file loaded successfully!"
     MSG_LOAD_FAILED = "Failed to load log file: {}"
     MSG_NO_LOG_FILE = "Please load a log file first!"
+    MSG_LOAD_IN_PROGRESS = "A log file is still loading. Cancel it first to load another one."
+    MSG_TIME_AXIS_MISMATCH = ("Cannot plot {} on this time axis: its timestamps are {} but the plotted "
+                              "variables use {}. Clear the plot first.")
+    MSG_LIVE_UNAVAILABLE = ("Live tail needs the log to be loaded with the pandas or bytes engine "
+                            "and INCREMENTAL_RELOAD enabled.")
+    MSG_LIVE_STOPPED = "Live tail stopped:\n\n{}"
+    MSG_NO_PARSE_REPORT = "No parse report yet. Load a log file first!"
     MSG_SELECT_VARIABLES = "Please select variables to plot!"
     MSG_NO_TABLE_DATA = "No table data to export!\nPlease double-click a DataFrame in the variable tree first."
     MSG_EXPORT_SUCCESS = "Data exported successfully to:\n{}"
@@ -155,6 +199,10 @@ class Config:
     PROGRESS_LOADING_ROWS = "Loading all rows..."
     PROGRESS_SEARCH_ROW = "Searching row {:,} of {:,}"
     PROGRESS_LOAD_ROW = "Loading rows {:,} to {:,}"
+    PROGRESS_PARSING = "Loading {}"
+    PROGRESS_PARSING_FILES = "Loading {} files"
+    PROGRESS_PARSE_STATUS = "{}: {:.1f} of {:.1f} MB, {:,} lines"
+    PROGRESS_CANCELLING = "Cancelling..."
     
     # ============ Table & Performance Settings ============
     TABLE_BATCH_SIZE = 500
@@ -195,6 +243,9 @@ class Config:
     SCROLL_CHECK_DELAY = 100
     SCROLL_MONITOR_INTERVAL = 200
     SCROLLBAR_SETTLE_DELAY = 50
+    PARSE_POLL_INTERVAL = 100  # How often the UI picks up progress from the parse thread
+    LIVE_POLL_INTERVAL = 250  # How often live tail checks the log for new lines
+    LIVE_REDRAW_INTERVAL = 1000  # Minimum time between live plot redraws
     
     # ============ Scroll Detection Thresholds ============
     SCROLL_BOTTOM_THRESHOLD = 0.9
@@ -224,12 +275,32 @@ class Config:
     
     # ============ File Settings ============
     CSV_EXTENSIONS = [("CSV files", "*.csv"), ("All files", "*.*")]
+    LOG_FILE_TYPES = [("Log files", "*.log *.txt *.csv *.tsv"),
+                      ("Compressed logs", "*.gz *.bz2 *.xz *.zst"),
+                      ("Converted logs", "clan_manifest.json"), ("All files", "*.*")]
     DEFAULT_EXPORT_NAME = "exported_data"
     
+    # ============ Parse Cache Settings ============
+    PARSE_CACHE_ENABLED = True
+    PARSE_CACHE_DIR = None  # None = parser default (~/.clan_cache or $CLAN_CACHE_DIR)
+    PARSE_ENGINE = "pandas"  # "polars" parses interleaved and standard logs with Polars; "bytes" parses
+    # numeric columns straight from the undecoded file bytes
+    LAZY_MESSAGE_FRAMES = True  # Interleaved logs build each message type's DataFrame when first used
+    INCREMENTAL_RELOAD = True  # Reopening a log that was appended to only parses the new lines
+    COMPACT_DTYPES = False  # Store columns in the smallest dtypes that keep their values (disables INCREMENTAL_RELOAD)
+    MEMORY_BUDGET_MB = None  # With a budget (e.g. 2048), floats are rounded to float32 when a load needs more
+    PARSE_REPORT_TRACE_MEMORY = False  # Also measure Python allocations per parse stage (slows loading)
+    LAZY_NUMERIC_TYPES = {'int': 'Int64', 'float': 'float64', 'mmss_timestamp': 'float64'}  # Plottable parser types and their dtypes
+    
+    # ============ Live Tail Settings ============
+    LIVE_BUFFER_ROWS = 100_000  # Newest rows kept (and plotted) per message type while tailing
+    
     # ============ Dialog Settings ============
     PROGRESS_DIALOG_SIZE = "400x120"
+    PROGRESS_CANCEL_DIALOG_SIZE = "400x160"
     COLUMN_DIALOG_SIZE = "650x550"
     CELL_CONTENT_DIALOG_SIZE = "800x600"
+    PARSE_REPORT_DIALOG_SIZE = "1000x500"
     
     # ============ Sample Sizes for Analysis ============
     COLUMN_SAMPLE_SIZE_SMALL = 10
@@ -283,6 +354,46 @@ class SearchResult:
         self.case_sensitive = case_sensitive
         self.match_count = len(result_df)
 
+class RingBuffer:
+    """Fixed-capacity store of the newest rows of one message type: timestamps plus numeric columns"""
+    def __init__(self, capacity: int, timestamp_dtype, columns: List[str]):
+        self.capacity = capacity
+        # Every row is written twice, capacity apart, so the buffered rows are always one contiguous slice
+        self.timestamps = np.empty(2 * capacity, dtype=timestamp_dtype)
+        self.values = {col: np.full(2 * capacity, np.nan) for col in columns}
+        self.end = 0
+        self.count = 0
+        
+    def __contains__(self, col_name) -> bool:
+        return col_name in self.values
+    
+    def append(self, df: pd.DataFrame):
+        """Append a frame's rows, overwriting the oldest ones once full"""
+        df = df.iloc[-self.capacity:]
+        n_rows = len(df)
+        if n_rows == 0:
+            return
+        
+        positions = (self.end + np.arange(n_rows)) % self.capacity
+        columns = [(self.timestamps, df['timestamp'].to_numpy(dtype=self.timestamps.dtype))]
+        for col, buffer in self.values.items():
+            if col in df.columns:
+                columns.append((buffer, df[col].to_numpy(dtype='float64', na_value=np.nan)))
+            else:
+                columns.append((buffer, np.nan))
+        for buffer, data in columns:
+            buffer[positions] = data
+            buffer[positions + self.capacity] = data
+        
+        self.end = (self.end + n_rows) % self.capacity
+        self.count = min(self.count + n_rows, self.capacity)
+    
+    def series(self, col_name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Timestamps and values of one column, oldest first (views, no copy)"""
+        start = (self.end - self.count) % self.capacity
+        window = slice(start, start + self.count)
+        return self.timestamps[window], self.values[col_name][window]
+
 class LogDataPlotter:
     def __init__(self):
         self.root = tk.Tk()
@@ -297,6 +408,22 @@ class LogDataPlotter:
         self.current_log_filename: str = ""
         self.pandas_dfs: Dict[str, pd.DataFrame] = {}
         self.polars_dfs = {}
+        self.lazy_dfs: Optional[LazyDataFrames] = None  # Message types not yet moved into pandas_dfs
+        
+        # Background parsing state (see load_log_file)
+        self.parse_thread: Optional[threading.Thread] = None
+        self.parse_progress: Optional[ParseProgress] = None
+        self.parse_queue: Optional[queue.Queue] = None
+        self.parse_progress_dialog = None
+        self.current_log_path: str = ""
+        self.last_parse_report: Optional[ParseReport] = None  # Stage timings of the last load
+        
+        # Live tail state (see start_live_tail)
+        self.live_tailer: Optional[LogTailer] = None
+        self.live_buffers: Dict[str, Optional[RingBuffer]] = {}
+        self.live_timer = None
+        self.live_last_draw = 0.0
+        self.live_pending_redraw = False
         self.selected_variables: List[str] = []
         self.plotted_variables: Set[str] = set()
         self.plotted_variables_right: Set[str] = set()
@@ -366,6 +493,20 @@ class LogDataPlotter:
         
         print("Cleaning up resources...")
         
+        # Stop a parse that is still running in the background
+        if self.parse_progress is not None:
+            self.parse_progress.cancel()
+        
+        # Stop following the log file
+        if self.live_timer is not None:
+            try:
+                self.root.after_cancel(self.live_timer)
+            except tk.TclError:
+                pass
+            self.live_timer = None
+        self.live_tailer = None
+        self.live_buffers.clear()
+        
         # Cancel timers using proper attribute names with race condition protection
         for timer_attr in ['table1_scroll_timer', 'table2_scroll_timer', 'search_scroll_timer']:
             if hasattr(self, timer_attr):
@@ -386,13 +527,14 @@ class LogDataPlotter:
         # Clear data structures
         self.pandas_dfs.clear()
         self.polars_dfs.clear()
+        self.lazy_dfs = None
         
         print("Cleanup completed")
 
     @staticmethod
     def is_raw_data_column(col_name: str) -> bool:
-        """Check if a column name is the parser's raw data column"""
-        return col_name == '__parser_raw_line__'
+        """Check if a column name is one of the parser's raw line index columns"""
+        return col_name in ('__parser_line_offset__', '__parser_line_length__')
     
     def _get_timer_attr_name(self, table_state: TableState) -> str:
         """Get proper timer attribute name for table state"""
@@ -487,10 +629,17 @@ class LogDataPlotter:
         
         ttk.Button(control_frame, text=Config.BTN_LOAD_LOG, 
                   command=self.load_log_file).pack(fill=tk.X, pady=2)
+        ttk.Button(control_frame, text=Config.BTN_LOAD_LOGS,
+                  command=self.load_log_files).pack(fill=tk.X, pady=2)
         ttk.Button(control_frame, text=Config.BTN_PLOT_SELECTED, 
                   command=self.plot_selected).pack(fill=tk.X, pady=2)
         ttk.Button(control_frame, text=Config.BTN_CLEAR_PLOT, 
                   command=self.clear_plot).pack(fill=tk.X, pady=2)
+        self.live_button = ttk.Button(control_frame, text=Config.BTN_LIVE_START,
+                                      command=self.toggle_live_tail)
+        self.live_button.pack(fill=tk.X, pady=2)
+        ttk.Button(control_frame, text=Config.BTN_PARSE_REPORT,
+                  command=self.show_parse_report).pack(fill=tk.X, pady=2)
 
     def _setup_variable_tree(self, parent):
         """Setup variable tree with scrollbar"""
@@ -1942,9 +2091,9 @@ class LogDataPlotter:
                 # Check if ANY column in the DataFrame has a real name (not auto-generated)
                 import re
                 all_columns = table_state.current_table_df.columns
-                # Check if at least one column is NOT auto-generated and NOT the raw line column
+                # Check if at least one column is NOT auto-generated and NOT a raw line index column
                 for col in all_columns:
-                    if col == '__parser_raw_line__':
+                    if self.is_raw_data_column(col):
                         continue
                     if not re.match(r'^column_\d+$', col):
                         # Found at least one real column name
@@ -2226,19 +2375,17 @@ class LogDataPlotter:
                 messagebox.showwarning(Config.DIALOG_WARNING, "Raw data not available for this table.")
                 return
             
-            # Find the parser's raw data column
-            raw_col = None
-            for col in df.columns:
-                if self.is_raw_data_column(col):
-                    raw_col = col
-                    break
-            
-            if raw_col is None:
+            # The parser keeps a byte-offset index instead of the raw lines themselves
+            source_file = df.attrs.get('__parser_source_file__')
+            if (source_file is None or '__parser_line_offset__' not in df.columns
+                    or '__parser_line_length__' not in df.columns):
                 messagebox.showwarning(Config.DIALOG_WARNING, "Raw data not available for this table.")
                 return
             
             if actual_df_row < len(df):
-                raw_data = df.iloc[actual_df_row][raw_col]
+                row = df.iloc[actual_df_row]
+                raw_data = read_raw_line(source_file, int(row['__parser_line_offset__']),
+                                         int(row['__parser_line_length__']))
                 self.show_raw_data_dialog(actual_df_row, raw_data)
             else:
                 messagebox.showwarning(Config.DIALOG_ERROR, Config.MSG_ROW_OUT_OF_BOUNDS.format(actual_df_row))
@@ -2320,13 +2467,13 @@ class LogDataPlotter:
         except Exception as e:
             messagebox.showerror(Config.DIALOG_EXPORT_ERROR, Config.MSG_EXPORT_FAILED.format(str(e)))
 
-    def show_progress_dialog(self, title, max_value):
-        """Show a simple progress dialog"""
+    def show_progress_dialog(self, title, max_value, on_cancel=None):
+        """Show a simple progress dialog, with a Cancel button if on_cancel is given"""
         class ProgressDialog:
             def __init__(self, parent, title, max_value):
                 self.dialog = tk.Toplevel(parent)
                 self.dialog.title(title)
-                self.dialog.geometry(Config.PROGRESS_DIALOG_SIZE)
+                self.dialog.geometry(Config.PROGRESS_CANCEL_DIALOG_SIZE if on_cancel else Config.PROGRESS_DIALOG_SIZE)
                 self.dialog.transient(parent)
                 self.dialog.grab_set()
                 
@@ -2338,6 +2485,10 @@ class LogDataPlotter:
                 
                 self.status_label = tk.Label(self.dialog, text="Starting...")
                 self.status_label.pack(pady=10)
+                
+                if on_cancel is not None:
+                    ttk.Button(self.dialog, text=Config.BTN_CANCEL, command=on_cancel).pack(pady=5)
+                    self.dialog.protocol("WM_DELETE_WINDOW", on_cancel)
             
             def update_progress(self, value, text):
                 try:
@@ -2367,9 +2518,147 @@ class LogDataPlotter:
         return sanitized if sanitized else Config.DEFAULT_EXPORT_NAME
 
     def load_log_file(self):
-        """Load and parse log file"""
+        """Pick a log file and parse it on a background thread"""
+        if self.parse_thread is not None:
+            messagebox.showwarning(Config.DIALOG_WARNING, Config.MSG_LOAD_IN_PROGRESS)
+            return
+        
+        # Ask for the file here - dialogs must stay on the Tk thread
+        file_path = filedialog.askopenfilename(title=Config.DIALOG_SELECT_LOG, filetypes=Config.LOG_FILE_TYPES)
+        if not file_path:
+            return
+        
+        self._start_parse(Config.PROGRESS_PARSING.format(os.path.basename(file_path)),
+                          self._parse_log_worker, file_path)
+    
+    def load_log_files(self):
+        """Pick several log files and parse them side by side into one session"""
+        if self.parse_thread is not None:
+            messagebox.showwarning(Config.DIALOG_WARNING, Config.MSG_LOAD_IN_PROGRESS)
+            return
+        
+        file_paths = filedialog.askopenfilenames(title=Config.DIALOG_SELECT_LOGS, filetypes=Config.LOG_FILE_TYPES)
+        if not file_paths:
+            return
+        
+        self._start_parse(Config.PROGRESS_PARSING_FILES.format(len(file_paths)),
+                          self._parse_log_files_worker, list(file_paths))
+    
+    def _start_parse(self, title, worker, source):
+        """Show the progress dialog and run worker(source, progress, result_queue) on a background thread"""
+        self.parse_queue = queue.Queue()
+        self.parse_progress = ParseProgress(lambda *status: self.parse_queue.put(('progress', status)))
+        self.parse_progress_dialog = self.show_progress_dialog(title, 100, on_cancel=self.cancel_log_load)
+        
+        self.parse_thread = threading.Thread(target=worker,
+                                             args=(source, self.parse_progress, self.parse_queue),
+                                             daemon=True)
+        self.parse_thread.start()
+        self.root.after(Config.PARSE_POLL_INTERVAL, self._poll_parse_queue)
+    
+    def _parse_log_worker(self, file_path, progress, result_queue):
+        """Run the parser off the Tk thread and hand the outcome back through the queue"""
+        try:
+            report = ParseReport(Config.PARSE_REPORT_TRACE_MEMORY)
+            raw_dataframes, filename = parse_log_file(file_path, use_cache=Config.PARSE_CACHE_ENABLED,
+                                    cache_dir=Config.PARSE_CACHE_DIR,
+                                    engine=Config.PARSE_ENGINE,
+                                    lazy=Config.LAZY_MESSAGE_FRAMES,
+                                    incremental=Config.INCREMENTAL_RELOAD,
+                                    compact=Config.COMPACT_DTYPES,
+                                    memory_budget_mb=Config.MEMORY_BUDGET_MB,
+                                    progress=progress, report=report)
+            result_queue.put(('done', (raw_dataframes, filename, file_path, report)))
+        except ParseCancelled:
+            result_queue.put(('cancelled', None))
+        except Exception as e:
+            print(f"Parse error details: {e}")
+            traceback.print_exc()
+            result_queue.put(('error', e))
+    
+    def _parse_log_files_worker(self, file_paths, progress, result_queue):
+        """Parse several files in worker processes; their frames are named '<file>:<message type>'"""
+        try:
+            report = ParseReport(Config.PARSE_REPORT_TRACE_MEMORY)
+            raw_dataframes, filenames = parse_log_files(file_paths, use_cache=Config.PARSE_CACHE_ENABLED,
+                                                        cache_dir=Config.PARSE_CACHE_DIR,
+                                                        engine=Config.PARSE_ENGINE,
+                                                        compact=Config.COMPACT_DTYPES,
+                                                        memory_budget_mb=Config.MEMORY_BUDGET_MB,
+                                                        progress=progress, report=report)
+            # Live tail follows a single file, so no path is kept
+            result_queue.put(('done', (raw_dataframes, ", ".join(filenames), "", report)))
+        except ParseCancelled:
+            result_queue.put(('cancelled', None))
+        except Exception as e:
+            print(f"Parse error details: {e}")
+            traceback.print_exc()
+            result_queue.put(('error', e))
+    
+    def _poll_parse_queue(self):
+        """Apply progress updates and the final result from the parse thread"""
+        if self.parse_queue is None:
+            return
+        
+        latest_progress = None
+        while True:
+            try:
+                kind, payload = self.parse_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                latest_progress = payload
+            else:
+                self._finish_parse(kind, payload)
+                return
+        
+        # Only the newest status matters, older ones would be overdrawn anyway
+        if latest_progress is not None:
+            self._show_parse_progress(*latest_progress)
+        self.root.after(Config.PARSE_POLL_INTERVAL, self._poll_parse_queue)
+    
+    def _show_parse_progress(self, stage, bytes_read, total_bytes, lines):
+        """Update the progress dialog from a ParseProgress report"""
+        dialog = self.parse_progress_dialog
+        if dialog is None or self.parse_progress.cancelled:
+            return
+        
+        percent = 100 * bytes_read / total_bytes if total_bytes else 0
+        dialog.update_progress(min(percent, 100), Config.PROGRESS_PARSE_STATUS.format(
+            stage, bytes_read / 1e6, total_bytes / 1e6, lines))
+    
+    def cancel_log_load(self):
+        """Ask the running parse to stop; the parse thread drops its buffers on the way out"""
+        if self.parse_progress is None:
+            return
+        self.parse_progress.cancel()
+        if self.parse_progress_dialog is not None:
+            self.parse_progress_dialog.update_progress(self.parse_progress_dialog.progress['value'],
+                                              Config.PROGRESS_CANCELLING)
+    
+    def _finish_parse(self, kind, payload):
+        """Close the progress dialog and apply the outcome of a background parse"""
+        if self.parse_progress_dialog is not None:
+            self.parse_progress_dialog.close()
+        self.parse_progress_dialog = None
+        self.parse_thread = None
+        self.parse_progress = None
+        self.parse_queue = None
+        
+        if kind == 'done':
+            self._apply_parsed_log(*payload)
+        elif kind == 'cancelled':
+            print("Log file loading cancelled")
+        else:
+            # Show error without updating the title bar
+            error_msg = f"Failed to parse log file:\n\n{str(payload)}\n\nPlease check the log file format."
+            messagebox.showerror(Config.DIALOG_ERROR, error_msg)
+    
+    def _apply_parsed_log(self, raw_dataframes, filename, file_path="", report=None):
+        """Replace the loaded data with freshly parsed message-type frames"""
         try:
-            raw_dataframes, filename = parse_log_file()
+            # Kept even for a load without data, whose report shows where the lines went
+            self.last_parse_report = report
             
             if not raw_dataframes:
                 messagebox.showwarning(Config.DIALOG_WARNING, "No data was loaded from the file.")
@@ -2379,9 +2668,21 @@ class LogDataPlotter:
             self.clear_plot()
             self._clear_all_tables()
             
+            self.stop_live_tail()
             self.current_log_filename = filename
+            self.current_log_path = file_path
             self.update_title_bar()
             
+            self.lazy_dfs = None
+            if isinstance(raw_dataframes, LazyDataFrames):
+                if any('timestamp' in raw_dataframes.column_types(name) for name in raw_dataframes):
+                    # Message-type frames are built when first plotted or opened in a table
+                    self.lazy_dfs = raw_dataframes
+                    raw_dataframes = {}
+                else:
+                    # The timestamp selection dialog needs every frame's data
+                    raw_dataframes = dict(raw_dataframes)
+            
             self.pandas_dfs = self.split_mixed_dataframes(raw_dataframes)
             self.polars_dfs = convert_to_polars(self.pandas_dfs)
             
@@ -2424,7 +2725,6 @@ class LogDataPlotter:
             error_msg = f"Failed to parse log file:\n\n{str(e)}\n\nPlease check the log file format."
             messagebox.showerror(Config.DIALOG_ERROR, error_msg)
             print(f"Parse error details: {e}")
-            import traceback
             traceback.print_exc()
 
     def _clear_all_tables(self):
@@ -2534,7 +2834,7 @@ class LogDataPlotter:
             list_index += 1
             
             for col in df.columns:
-                if col == '__parser_raw_line__':
+                if self.is_raw_data_column(col):
                     continue
                 
                 # Check if column is numeric (likely to be timestamp)
@@ -2659,6 +2959,112 @@ class LogDataPlotter:
         
         self.root.title(title)
 
+    def toggle_live_tail(self):
+        """Start or stop following the loaded log file"""
+        if self.live_tailer is not None:
+            self.stop_live_tail()
+        else:
+            self.start_live_tail()
+    
+    def start_live_tail(self):
+        """Follow the loaded log: parse appended lines and extend the plotted lines in place"""
+        if not self.current_log_path:
+            messagebox.showwarning(Config.DIALOG_WARNING, Config.MSG_NO_LOG_FILE)
+            return
+        
+        state = latest_parse_state(self.current_log_path)
+        if state is None:
+            messagebox.showwarning(Config.DIALOG_WARNING, Config.MSG_LIVE_UNAVAILABLE)
+            return
+        
+        self.live_tailer = LogTailer(state, keep_lines=Config.LIVE_BUFFER_ROWS)
+        self.live_buffers.clear()
+        self.live_last_draw = 0.0
+        self.live_pending_redraw = False
+        self.live_button.config(text=Config.BTN_LIVE_STOP)
+        self.live_timer = self.root.after(Config.LIVE_POLL_INTERVAL, self._poll_live_tail)
+        print(f"Live tail started: {self.current_log_path}")
+    
+    def stop_live_tail(self):
+        """Stop following the log; plotted lines keep their last data"""
+        if self.live_timer is not None:
+            self.root.after_cancel(self.live_timer)
+            self.live_timer = None
+        if self.live_tailer is not None:
+            print("Live tail stopped")
+        self.live_tailer = None
+        self.live_buffers.clear()
+        self.live_button.config(text=Config.BTN_LIVE_START)
+    
+    def _poll_live_tail(self):
+        """Parse newly appended lines into the ring buffers and redraw at most every LIVE_REDRAW_INTERVAL"""
+        self.live_timer = None
+        try:
+            new_frames = self.live_tailer.poll()
+        except Exception as e:
+            self.stop_live_tail()
+            messagebox.showerror(Config.DIALOG_ERROR, Config.MSG_LIVE_STOPPED.format(e))
+            return
+        
+        for df_name, df in new_frames.items():
+            buffer = self._get_live_buffer(df_name, df)
+            if buffer is not None:
+                buffer.append(df)
+                self.live_pending_redraw = True
+        
+        now = time.monotonic()
+        if self.live_pending_redraw and (now - self.live_last_draw) * 1000 >= Config.LIVE_REDRAW_INTERVAL:
+            self._redraw_live_lines()
+            self.live_last_draw = now
+            self.live_pending_redraw = False
+        
+        self.live_timer = self.root.after(Config.LIVE_POLL_INTERVAL, self._poll_live_tail)
+    
+    def _get_live_buffer(self, df_name, df):
+        """Ring buffer for a message type, seeded with the rows that were already loaded"""
+        if df_name in self.live_buffers:
+            return self.live_buffers[df_name]
+        
+        buffer = None
+        timestamps = df['timestamp'] if 'timestamp' in df.columns else None
+        if timestamps is not None and (pd.api.types.is_numeric_dtype(timestamps) or
+                                       pd.api.types.is_datetime64_any_dtype(timestamps)):
+            columns = [col for col in df.columns
+                       if col != 'timestamp' and not self.is_raw_data_column(col)
+                       and pd.api.types.is_numeric_dtype(df[col])]
+            buffer = RingBuffer(Config.LIVE_BUFFER_ROWS, timestamps.dtype, columns)
+            
+            # Seed from the frames that are already loaded so the plot keeps its history
+            loaded_df = self.pandas_dfs.get(f"{df_name}_ALL", self.pandas_dfs.get(df_name))
+            if loaded_df is not None and 'timestamp' in loaded_df.columns:
+                buffer.append(loaded_df)
+        
+        self.live_buffers[df_name] = buffer
+        return buffer
+    
+    def _redraw_live_lines(self):
+        """Point every plotted line at its buffered data and schedule a canvas redraw"""
+        for target_ax in (self.ax, self.ax2):
+            if target_ax is None:
+                continue
+            updated = False
+            for line in target_ax.get_lines():
+                var_name = line.get_label()
+                if var_name.startswith("[R] "):
+                    var_name = var_name[len("[R] "):]
+                if "." not in var_name:
+                    continue
+                df_name, col_name = var_name.split(".", 1)
+                buffer = self.live_buffers.get(df_name)
+                if buffer is None or col_name not in buffer:
+                    continue
+                line.set_data(*buffer.series(col_name))
+                updated = True
+            if updated:
+                target_ax.relim()
+                target_ax.autoscale_view()
+        self.canvas.draw_idle()
+    
     def split_mixed_dataframes(self, dataframes: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
         """Split DataFrames into numerical (for plotting) and complete _ALL (for table viewing)"""
         split_dataframes = {}
@@ -2705,7 +3111,7 @@ class LogDataPlotter:
         non_numerical_cols = []
         
         for col in df.columns:
-            if col == 'timestamp':
+            if col == 'timestamp' or self.is_raw_data_column(col):
                 continue
             
             if pd.api.types.is_numeric_dtype(df[col]):
@@ -2740,6 +3146,49 @@ class LogDataPlotter:
             
             ordered_columns = self._get_ordered_columns(df_name, df)
             self._populate_tree_columns(parent, df_name, ordered_columns)
+        
+        # Message types that are not built yet are listed from the parser's index
+        if self.lazy_dfs is not None:
+            for df_name in self.lazy_dfs:
+                if df_name in self.pandas_dfs:
+                    continue
+                parent = self.variable_tree.insert("", "end", text=df_name,
+                                                values=("DataFrame", self.lazy_dfs.row_count(df_name), ""))
+                self._populate_lazy_tree_columns(parent, df_name)
+
+    def _populate_lazy_tree_columns(self, parent, df_name):
+        """Populate tree with the numeric columns of a message type that is not built yet"""
+        row_count = self.lazy_dfs.row_count(df_name)
+        ordered_columns = []
+        for col, col_type in self.lazy_dfs.column_types(df_name).items():
+            if col == 'timestamp' or col_type not in Config.LAZY_NUMERIC_TYPES:
+                continue
+            ordered_columns.append(col)
+            self.variable_tree.insert(parent, "end",
+                                    text=col,
+                                    values=(Config.LAZY_NUMERIC_TYPES[col_type], row_count, f"{df_name}.{col}"))
+        
+        print(f"  {df_name}: {len(ordered_columns)} columns (built on first use)")
+
+    def _ensure_dataframe(self, df_name: str) -> bool:
+        """Build a lazily parsed message type (and its _ALL frame) on first use"""
+        base_name = df_name[:-len('_ALL')] if df_name.endswith('_ALL') else df_name
+        if self.lazy_dfs is None or base_name in self.pandas_dfs or base_name not in self.lazy_dfs:
+            return df_name in self.pandas_dfs
+        
+        print(f"Building {base_name} on first use...")
+        split_dataframes = self.split_mixed_dataframes({base_name: self.lazy_dfs[base_name]})
+        self.pandas_dfs.update(split_dataframes)
+        self.polars_dfs.update(convert_to_polars(split_dataframes))
+        return df_name in self.pandas_dfs
+
+    def _has_dataframe(self, df_name: str) -> bool:
+        """Check whether a DataFrame is loaded or can be built from the lazy index"""
+        return df_name in self.pandas_dfs or (self.lazy_dfs is not None and df_name in self.lazy_dfs)
+
+    def _has_loaded_log(self) -> bool:
+        """Check whether a log file has been loaded"""
+        return bool(self.pandas_dfs) or bool(self.lazy_dfs)
 
     def _get_ordered_columns(self, df_name, df):
         """Get columns in original order from reference dataframe"""
@@ -2926,6 +3375,7 @@ class LogDataPlotter:
 
     def _get_dataframe_for_plotting(self, df_name, col_name):
         """Get appropriate dataframe for plotting"""
+        self._ensure_dataframe(df_name)
         if df_name in self.pandas_dfs and col_name in self.pandas_dfs[df_name].columns:
             return self.pandas_dfs[df_name]
         elif f"{df_name}_ALL" in self.pandas_dfs and col_name in self.pandas_dfs[f"{df_name}_ALL"].columns:
@@ -2937,6 +3387,9 @@ class LogDataPlotter:
 
     def _plot_data_on_axis(self, x_data, y_data, var_name, axis):
         """Plot data on the specified axis"""
+        if not self._matches_time_axis(x_data, var_name):
+            return False
+        
         target_ax, colors, color_idx = self._get_plot_settings(axis)
         legend_name = f"[R] {var_name}" if axis == "right" else var_name
         
@@ -2952,6 +3405,23 @@ class LogDataPlotter:
         
         return True
 
+    def _matches_time_axis(self, x_data, var_name):
+        """Check that timestamps are of the same kind as the plotted ones (e.g. from another file)"""
+        plotted_lines = self.ax.get_lines() + (self.ax2.get_lines() if self.ax2 is not None else [])
+        if not plotted_lines:
+            return True
+        
+        def time_kind(values):
+            return "date/times" if pd.api.types.is_datetime64_any_dtype(values) else "numbers"
+        
+        new_kind = time_kind(x_data)
+        plotted_kind = time_kind(np.asarray(plotted_lines[0].get_xdata()))
+        if new_kind != plotted_kind:
+            messagebox.showwarning(Config.DIALOG_WARNING,
+                                   Config.MSG_TIME_AXIS_MISMATCH.format(var_name, new_kind, plotted_kind))
+            return False
+        return True
+
     def _get_plot_settings(self, axis):
         """Get plot settings for axis"""
         if axis == "right":
@@ -3001,7 +3471,7 @@ class LogDataPlotter:
     
     def plot_selected(self):
         """Plot selected variables on left axis"""
-        if not self.pandas_dfs:
+        if not self._has_loaded_log():
             messagebox.showwarning(Config.DIALOG_WARNING, Config.MSG_NO_LOG_FILE)
             return
         
@@ -3126,12 +3596,12 @@ class LogDataPlotter:
         
         if full_name and "." in full_name:
             self._handle_variable_double_click(full_name)
-        elif "." not in item_text and item_text in self.pandas_dfs:
+        elif "." not in item_text and self._has_dataframe(item_text):
             self._handle_dataframe_double_click(item_text, target_table=Config.TAB_TABLE1)
 
     def _handle_variable_double_click(self, full_name):
         """Handle double-click on variable"""
-        if not self.pandas_dfs:
+        if not self._has_loaded_log():
             messagebox.showwarning(Config.DIALOG_WARNING, Config.MSG_NO_LOG_FILE)
             return
         
@@ -3145,6 +3615,7 @@ class LogDataPlotter:
 
     def _handle_dataframe_double_click(self, item_text, target_table=Config.TAB_TABLE1):
         """Handle double-click on dataframe - specify target table"""
+        self._ensure_dataframe(item_text)
         all_version_name = f"{item_text}_ALL"
         if all_version_name in self.pandas_dfs:
             df_name = all_version_name
@@ -3169,12 +3640,12 @@ class LogDataPlotter:
         
         if full_name and "." in full_name:
             self._handle_variable_right_double_click(full_name)
-        elif "." not in item_text and item_text in self.pandas_dfs:
+        elif "." not in item_text and self._has_dataframe(item_text):
             self._handle_dataframe_double_click(item_text, target_table=Config.TAB_TABLE2)
 
     def _handle_variable_right_double_click(self, full_name):
         """Handle right double-click on variable"""
-        if not self.pandas_dfs:
+        if not self._has_loaded_log():
             messagebox.showwarning(Config.DIALOG_WARNING, Config.MSG_NO_LOG_FILE)
             return
         
@@ -3188,7 +3659,7 @@ class LogDataPlotter:
 
     def show_dataframe_in_table(self, df_name: str, table_state: TableState, tab_name: str):
         """Display DataFrame in the specified table tab - OPTIMIZED"""
-        if df_name not in self.pandas_dfs:
+        if not self._ensure_dataframe(df_name):
             return
         
         # FAST PATH: Check if same dataframe is already displayed
@@ -3453,6 +3924,21 @@ class LogDataPlotter:
         ttk.Button(button_frame, text=Config.BTN_CLOSE, 
                 command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
 
+    def show_parse_report(self):
+        """Show the time, lines and memory of each parse stage of the last load"""
+        if self.last_parse_report is None:
+            messagebox.showinfo(Config.DIALOG_WARNING, Config.MSG_NO_PARSE_REPORT)
+            return
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title(Config.DIALOG_PARSE_REPORT.format(os.path.basename(self.last_parse_report.file_path)))
+        dialog.geometry(Config.PARSE_REPORT_DIALOG_SIZE)
+        dialog.transient(self.root)
+        
+        text_widget = self._setup_cell_content_display(dialog)
+        text_widget.configure(wrap=tk.NONE)
+        self._finalize_cell_content_dialog(dialog, text_widget, self.last_parse_report.format_text())
+
     def copy_to_clipboard(self, content: str):
         """Copy content to clipboard"""
         self.root.clipboard_clear()
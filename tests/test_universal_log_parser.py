@@ -0,0 +1,162 @@
+"""Consistency checks of universal_log_parser on small synthetic logs."""
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import universal_log_parser as ulp
+
+BASE_TIME = datetime(2024, 1, 15, 10, 30)
+
+
+def timestamp_text(i: int) -> str:
+    return (BASE_TIME + timedelta(milliseconds=i * 250)).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+
+
+def interleaved_lines(start: int, stop: int):
+    for i in range(start, stop):
+        prefix = f"{timestamp_text(i)},mavros,INFO"
+        if i % 3 == 0:
+            yield f"{prefix},GPS_DATA,{28.6 + i * 1e-4:.5f},{77.2 - i * 1e-4:.5f},{500 + i % 7}"
+        elif i % 3 == 1:
+            yield f"{prefix},IMU_DATA,{(i % 13) / 10:.2f},{i % 5},{('LOITER', 'AUTO', 'RTL')[i % 7 % 3]}"
+        else:
+            yield f'{prefix},STATUS_TEXT,{i % 2},"armed, mode {i % 4}"'
+
+
+def standard_lines(start: int, stop: int):
+    for i in range(start, stop):
+        yield f"{timestamp_text(i)},{100 + (i % 17) / 4:.2f},{i % 9},{('manual', 'auto')[i % 2]},{i % 2}"
+
+
+LOGS = {
+    'interleaved.log': lambda: ["2024-01-15 10:30:00.000,mavros,INFO,GPS_DATA,lat,lon,alt(m)",
+                                "2024-01-15 10:30:00.000,mavros,INFO,IMU_DATA,ax,ay,mode",
+                                *interleaved_lines(0, 600)],
+    'standard.csv': lambda: ["time,altitude,speed,mode,armed", *standard_lines(0, 300), "",
+                             *standard_lines(300, 500)],
+    'no_header.tsv': lambda: [f"{i // 60 % 60:02d}:{i % 60:02d}.{i % 10}\t{i}\t{(i % 11) * 0.5:.1f}\tok"
+                              for i in range(400)],
+    'mixed.log': lambda: [f"{timestamp_text(i)[:19]};{i};{i % 7 / 2:.1f}" + (f";ev{i % 4};{i * 3}" if i % 3 else "")
+                          for i in range(300)],
+}
+
+
+def write_log(directory, name: str, lines) -> str:
+    path = os.path.join(directory, name)
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('\n'.join(lines) + '\n')
+    return path
+
+
+def parse(path: str, **options):
+    options.setdefault('use_cache', False)
+    dataframes, _ = ulp.parse_universal_log(path, **options)
+    return {name: dataframes[name] for name in dataframes}
+
+
+def assert_same_frames(actual, expected):
+    assert list(actual) == list(expected)
+    for name in expected:
+        pd.testing.assert_frame_equal(actual[name], expected[name])
+
+
+@pytest.fixture(params=sorted(LOGS))
+def log_path(request, tmp_path):
+    return write_log(tmp_path, request.param, LOGS[request.param]())
+
+
+def test_parse_finds_every_data_row(tmp_path):
+    dataframes = parse(write_log(tmp_path, 'interleaved.log', LOGS['interleaved.log']()))
+    assert {name: len(df) for name, df in dataframes.items()} == {'GPS_DATA': 200, 'IMU_DATA': 200,
+                                                                  'STATUS_TEXT': 200}
+    status = dataframes['STATUS_TEXT']
+    assert status['column_4'].iloc[0] == 'armed, mode 2'
+    offset, length = status[ulp.LINE_OFFSET_COLUMN].iloc[0], status[ulp.LINE_LENGTH_COLUMN].iloc[0]
+    assert ulp.read_raw_line(status.attrs[ulp.SOURCE_FILE_ATTR], offset, length) == next(interleaved_lines(2, 3))
+
+    dataframes = parse(write_log(tmp_path, 'standard.csv', LOGS['standard.csv']()))
+    assert len(dataframes['DATA']) == 500
+    assert list(dataframes['DATA'].columns[:5]) == ['timestamp', 'altitude', 'speed', 'mode', 'armed']
+
+
+def test_worker_processes_match_single_process(log_path):
+    assert_same_frames(parse(log_path, workers=4), parse(log_path, workers=1))
+
+
+def test_cache_round_trip(log_path, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    parsed = parse(log_path, use_cache=True, cache_dir=cache_dir)
+    cached = parse(log_path, use_cache=True, cache_dir=cache_dir)
+    assert_same_frames(cached, parsed)
+
+
+@pytest.mark.parametrize('engine', ['pandas', 'bytes'])
+def test_incremental_append_matches_full_parse(tmp_path, engine):
+    path = write_log(tmp_path, 'interleaved.log', LOGS['interleaved.log']())
+    parse(path, engine=engine, incremental=True)
+    with open(path, 'a', encoding='utf-8', newline='\n') as f:
+        f.write('\n'.join(interleaved_lines(600, 750)) + '\n')
+
+    extended = parse(path, engine=engine, incremental=True)
+    assert_same_frames(extended, parse(path, engine=engine))
+
+
+def test_bytes_engine_matches_pandas(log_path):
+    assert_same_frames(parse(log_path, engine='bytes'), parse(log_path, engine='pandas'))
+
+
+def test_polars_engine_matches_pandas(log_path):
+    pytest.importorskip('polars')
+    pytest.importorskip('pyarrow')
+    polars_frames = parse(log_path, engine='polars')
+    pandas_frames = parse(log_path, engine='pandas')
+    assert list(polars_frames) == list(pandas_frames)
+    for name, expected in pandas_frames.items():
+        actual = polars_frames[name]
+        assert list(actual.columns) == list(expected.columns)
+        for col in expected.columns:
+            # Engines keep different dtypes (Arrow-backed, category order); the values must agree
+            assert actual[col].astype(object).tolist() == expected[col].astype(object).tolist(), col
+
+
+def test_chunks_concatenate_to_full_parse(log_path):
+    chunks = list(ulp.iter_universal_log(log_path, chunk_rows=64))
+    assert len(chunks) > len(parse(log_path))
+    assert_same_frames(ulp.collect_chunks(chunks), parse(log_path))
+
+
+def test_filter_keeps_selected_frames_columns_and_window(tmp_path):
+    path = write_log(tmp_path, 'interleaved.log', LOGS['interleaved.log']())
+    window = (datetime(2024, 1, 15, 16, 0, 30), datetime(2024, 1, 15, 16, 0, 59))
+    dataframes = parse(path, filter=ulp.ParseFilter(message_types={'gps_data'}, columns={'lat'}, time_range=window))
+
+    assert list(dataframes) == ['GPS_DATA']
+    df = dataframes['GPS_DATA']
+    assert [col for col in df.columns if not col.startswith('__parser')] == ['timestamp', 'lat']
+    assert df['timestamp'].between(*window).all()
+    full = parse(path)['GPS_DATA']
+    assert len(df) == full['timestamp'].between(*window).sum()
+
+
+def test_tailer_polls_in_bounded_steps(tmp_path):
+    path = write_log(tmp_path, 'interleaved.log', LOGS['interleaved.log']())
+    parse(path, incremental=True)
+    state = ulp.latest_parse_state(path)
+    with open(path, 'a', encoding='utf-8', newline='\n') as f:
+        f.write('\n'.join(interleaved_lines(600, 2600)) + '\n')
+
+    expected = ulp.LogTailer(state, max_poll_bytes=1 << 30).poll()
+    tailer = ulp.LogTailer(state, max_poll_bytes=4096)
+    polls = list(iter(tailer.poll, {}))
+    assert len(polls) > 10
+    assert_same_frames(ulp.collect_chunks((name, df) for rows in polls for name, df in rows.items()), expected)
+
+    rows = ulp.collect_chunks((name, df) for rows in iter(ulp.LogTailer(state, keep_lines=300).poll, {})
+                              for name, df in rows.items())
+    assert 250 < sum(len(df) for df in rows.values()) < 350
+    assert all(rows[name]['timestamp'].iloc[-1] == expected[name]['timestamp'].iloc[-1] for name in expected)
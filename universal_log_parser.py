@@ -1,9 +1,36 @@
 import pandas as pd
+from pandas.api.types import union_categoricals
+import numpy as np
+from array import array
 from datetime import datetime, timedelta
 import re
-from typing import Dict, List, Any, Optional, Tuple, Set
+import sys
+from typing import Dict, List, Any, Optional, Tuple, Set, Iterator, Sequence, Callable
 import os
-from collections import defaultdict, Counter
+import mmap
+import gzip
+import bz2
+import lzma
+import queue
+import json
+import shutil
+import hashlib
+import tempfile
+import threading
+import multiprocessing
+import copy
+import time
+import tracemalloc
+import io
+import glob
+import argparse
+import csv
+import contextlib
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, wait as wait_futures
+from collections import defaultdict, Counter, OrderedDict
+from collections.abc import Mapping
+from itertools import zip_longest
 
 # Optional imports
 try:
@@ -18,20 +45,479 @@ try:
 except ImportError:
     HAS_EASYGUI = False
 
+try:
+    import pyarrow
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import zstandard as zstd
+    HAS_ZSTANDARD = True
+except ImportError:
+    HAS_ZSTANDARD = False
+
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:
+    HAS_RESOURCE = False
+
+
+class LogFileReader:
+    """
+    Single open, memory-mapped view of a log file.
+    
+    Delimiter detection, sampling, the raw header line and the full parse all
+    read from the same mapping, so the file is opened once and the bytes used
+    for detection are already in memory when the full parse starts.
+    """
+    
+    random_access = True  # Byte ranges can be read directly (and by worker processes)
+    READ_CHUNK_SIZE = 16 * 1024 * 1024  # Bytes decoded per block when streaming lines
+    
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._file = open(file_path, 'rb')
+        self.size = os.fstat(self._file.fileno()).st_size
+        # Zero-length files cannot be memory-mapped
+        self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+    
+    def __enter__(self) -> 'LogFileReader':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Release the memory map and file handle."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._buffer = b''
+        self._file.close()
+    
+    @staticmethod
+    def _decode(data: bytes) -> str:
+        return data.decode('utf-8', errors='ignore')
+    
+    def head_lines(self, n_lines: int) -> List[str]:
+        """Return the first N lines (without line terminators)."""
+        lines = []
+        pos = 0
+        while len(lines) < n_lines and pos < self.size:
+            end = self._buffer.find(b'\n', pos)
+            if end == -1:
+                end = self.size
+            lines.append(self._decode(self._buffer[pos:end]).rstrip('\r'))
+            pos = end + 1
+        return lines
+    
+    def header_line(self) -> str:
+        """Return the first line of the file."""
+        lines = self.head_lines(1)
+        return lines[0] if lines else ''
+    
+    def offset_after_lines(self, n_lines: int) -> int:
+        """Return the byte offset just past the first N lines."""
+        pos = 0
+        for _ in range(n_lines):
+            newline = self._buffer.find(b'\n', pos)
+            if newline == -1:
+                return self.size
+            pos = newline + 1
+        return pos
+    
+    def split_ranges(self, start: int, n_ranges: int) -> List[Tuple[int, int]]:
+        """Split [start, size) into up to N byte ranges that each begin at a line start."""
+        bounds = [start]
+        step = max(1, (self.size - start) // max(1, n_ranges))
+        for i in range(1, n_ranges):
+            newline = self._buffer.find(b'\n', max(start + i * step, bounds[-1]))
+            if newline == -1 or newline + 1 >= self.size:
+                break
+            if newline + 1 > bounds[-1]:
+                bounds.append(newline + 1)
+        bounds.append(self.size)
+        return [(a, b) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+    
+    def _iter_blocks(self, start: int, end: Optional[int]) -> Iterator[Tuple[int, bytes]]:
+        """Yield (offset, bytes) blocks of whole lines covering the byte range."""
+        limit = self.size if end is None else min(end, self.size)
+        pos = start
+        while pos < limit:
+            block_end = min(pos + self.READ_CHUNK_SIZE, limit)
+            if block_end < limit:
+                # Cut the block at the last complete line
+                newline = self._buffer.rfind(b'\n', pos, block_end)
+                if newline == -1:
+                    newline = self._buffer.find(b'\n', block_end, limit)
+                block_end = limit if newline == -1 else newline + 1
+            yield pos, self._buffer[pos:block_end]
+            pos = block_end
+    
+    def iter_lines(self, start: int = 0, end: Optional[int] = None) -> Iterator[str]:
+        """
+        Yield every line in the byte range without its terminator, decoding in large blocks.
+        The range must start at a line boundary (see split_ranges).
+        """
+        for _, block in self._iter_blocks(start, end):
+            lines = self._decode(block).split('\n')
+            if block.endswith(b'\n'):
+                lines.pop()  # Block ended on a line terminator
+            yield from lines
+    
+    def iter_indexed_lines(self, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, int, str]]:
+        """Like iter_lines, but yield (byte_offset, byte_length, line) so the line can be re-read later."""
+        for pos, block in self._iter_blocks(start, end):
+            if block.isascii():
+                # Character and byte positions agree, so decode the whole block at once
+                lines = block.decode('ascii').split('\n')
+                lengths = list(map(len, lines))
+            else:
+                raw_lines = block.split(b'\n')
+                lengths = list(map(len, raw_lines))
+                lines = [self._decode(raw_line) for raw_line in raw_lines]
+            if block.endswith(b'\n'):
+                lines.pop()
+                lengths.pop()
+            
+            offset = pos
+            for line, length in zip(lines, lengths):
+                yield offset, length, line
+                offset += length + 1
+    
+    def iter_indexed_raw_lines(self, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, int, bytes]]:
+        """Like iter_indexed_lines, but yield each line as undecoded bytes (see split_raw_line)."""
+        for pos, block in self._iter_blocks(start, end):
+            raw_lines = block.split(b'\n')
+            if block.endswith(b'\n'):
+                raw_lines.pop()
+            
+            offset = pos
+            for raw_line in raw_lines:
+                length = len(raw_line)
+                yield offset, length, raw_line
+                offset += length + 1
+    
+    def line_index(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Byte offsets and lengths of every line (as iter_indexed_lines counts them), found with numpy."""
+        newline_blocks = []
+        for pos in range(0, self.size, self.READ_CHUNK_SIZE):
+            count = min(self.READ_CHUNK_SIZE, self.size - pos)
+            block = np.frombuffer(self._buffer, dtype=np.uint8, count=count, offset=pos)
+            newline_blocks.append(np.flatnonzero(block == ord('\n')) + pos)
+        ends = np.concatenate(newline_blocks) if newline_blocks else np.empty(0, dtype=np.int64)
+        if self.size and (len(ends) == 0 or ends[-1] != self.size - 1):
+            ends = np.append(ends, self.size)  # Last line has no terminator
+        starts = np.concatenate(([0], ends[:-1] + 1)).astype(np.int64) if len(ends) else ends
+        return starts, (ends - starts).astype(np.int32)
+    
+    def read_raw_line(self, offset: int, length: int) -> bytes:
+        """Return the undecoded bytes stored at a byte offset/length recorded by iter_indexed_lines."""
+        return self._buffer[offset:offset + length]
+    
+    def read_line(self, offset: int, length: int) -> str:
+        """Return the line stored at a byte offset/length recorded by iter_indexed_lines."""
+        return self._decode(self.read_raw_line(offset, length)).rstrip('\r\n')
+    
+    def ends_with_newline(self) -> bool:
+        """True if the last line is complete (or the file is empty)."""
+        return not self.size or self._buffer[self.size - 1:self.size] == b'\n'
+    
+    def complete_lines_end(self, start: int = 0, limit: Optional[int] = None) -> int:
+        """
+        Byte offset just past the last line terminator at or after start (start if there is none).
+        With a limit, stop at the last terminator before start + limit, or after the first line if it is longer.
+        """
+        newline = self._buffer.rfind(b'\n', start)
+        if limit is not None and newline >= start + limit:
+            cut = self._buffer.rfind(b'\n', start, start + limit)
+            newline = cut if cut != -1 else self._buffer.find(b'\n', start)
+        return start if newline == -1 else newline + 1
+    
+    def line_start_before(self, pos: int, start: int = 0) -> int:
+        """Byte offset of the line that pos falls in (not before start)."""
+        newline = self._buffer.rfind(b'\n', start, pos)
+        return start if newline == -1 else newline + 1
+    
+    def average_line_length(self, start: int, end: int, sample_size: int = 1024 * 1024) -> float:
+        """Bytes per line in the last sample_size bytes before end (not before start)."""
+        sample_start = max(start, end - sample_size)
+        lines = self._buffer[sample_start:end].count(b'\n')
+        return (end - sample_start) / max(lines, 1)
+    
+    def next_line_start(self, pos: int) -> Optional[int]:
+        """Byte offset of the first line that begins after pos, or None if that line has not been written yet."""
+        newline = self._buffer.find(b'\n', pos)
+        return None if newline == -1 else newline + 1
+    
+    def prefix_digest(self, end: int, block_size: int = 1024 * 1024) -> str:
+        """Hash of the first and last block_size bytes before end, to tell whether that part of the file changed."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self._buffer[:min(end, block_size)])
+        if end > block_size:
+            digest.update(self._buffer[max(block_size, end - block_size):end])
+        return digest.hexdigest()
+
+
+# Leading bytes of each supported compression format
+COMPRESSION_MAGIC = {
+    'gzip': b'\x1f\x8b',
+    'bz2': b'BZh',
+    'xz': b'\xfd7zXZ\x00',
+    'zstd': b'\x28\xb5\x2f\xfd',
+}
+
+
+def detect_compression(file_path: str) -> Optional[str]:
+    """Return the compression format of a file from its magic bytes, or None for plain text."""
+    with open(file_path, 'rb') as f:
+        magic = f.read(6)
+    for compression, prefix in COMPRESSION_MAGIC.items():
+        if magic.startswith(prefix):
+            return compression
+    return None
+
+
+class CompressedLogReader(LogFileReader):
+    """
+    Streaming view of a gzip, bz2, xz or zstd compressed log.
+    
+    Offsets are positions in the decompressed data. Detection and sampling read
+    only the start of the stream; iter_lines/iter_indexed_lines decompress the
+    whole file once, on a background thread (threaded=True) that stays up to
+    DECOMPRESS_QUEUE_BLOCKS blocks ahead of the tokenizer, so decompression
+    overlaps parsing and nothing is written to disk. There is no random access:
+    read_line re-decompresses up to the requested offset.
+    """
+    
+    random_access = False
+    HEAD_READ_SIZE = 1024 * 1024  # Decompressed bytes read first for detection and sampling
+    DECOMPRESS_QUEUE_BLOCKS = 2  # Decompressed blocks buffered ahead of the tokenizer
+    
+    def __init__(self, file_path: str, compression: Optional[str] = None, threaded: bool = True):
+        self.file_path = file_path
+        self.compression = compression or detect_compression(file_path)
+        if self.compression not in COMPRESSION_MAGIC:
+            raise ValueError(f"{os.path.basename(file_path)} is not a supported compressed file")
+        if self.compression == 'zstd' and not HAS_ZSTANDARD:
+            raise ImportError("Reading zstd compressed logs requires the zstandard package")
+        self.threaded = threaded
+        self._head = b''
+        self._head_complete = False
+        # Used for progress only: the decompressed size if the format records it, else 0
+        self.size = self._recorded_size()
+    
+    def close(self):
+        self._head = b''
+    
+    def _open_stream(self):
+        """Open a fresh decompressing file object positioned at the start of the data."""
+        if self.compression == 'zstd':
+            return zstd.ZstdDecompressor().stream_reader(open(self.file_path, 'rb'), read_across_frames=True,
+                                                         closefd=True)
+        opener = {'gzip': gzip.open, 'bz2': bz2.open, 'xz': lzma.open}[self.compression]
+        return opener(self.file_path, 'rb')
+    
+    def _recorded_size(self) -> int:
+        with open(self.file_path, 'rb') as f:
+            if self.compression == 'gzip':
+                # ISIZE trailer: decompressed size modulo 2**32 (of the last member)
+                f.seek(0, os.SEEK_END)
+                if f.tell() < 18:
+                    return 0
+                f.seek(-4, os.SEEK_END)
+                return int.from_bytes(f.read(4), 'little')
+            if self.compression == 'zstd':
+                return max(0, zstd.frame_content_size(f.read(18)))
+        return 0
+    
+    def _read_range(self, offset: int, length: int) -> bytes:
+        """Decompress from the start and return up to length bytes at offset."""
+        with self._open_stream() as stream:
+            stream.seek(offset)
+            parts = []
+            while length > 0:
+                data = stream.read(length)
+                if not data:
+                    break
+                parts.append(data)
+                length -= len(data)
+        return b''.join(parts)
+    
+    def _head_for(self, n_lines: int) -> bytes:
+        """Decompressed start of the file holding at least N lines (or the whole file)."""
+        while self._head.count(b'\n') < n_lines and not self._head_complete:
+            read_size = max(self.HEAD_READ_SIZE, 2 * len(self._head))
+            self._head = self._read_range(0, read_size)
+            self._head_complete = len(self._head) < read_size
+        return self._head
+    
+    def head_lines(self, n_lines: int) -> List[str]:
+        """Return the first N lines (without line terminators)."""
+        head = self._head_for(n_lines)
+        raw_lines = head.split(b'\n')
+        if head.endswith(b'\n') or not self._head_complete:
+            raw_lines.pop()  # Empty after the last terminator, or a line cut by the head read
+        return [self._decode(raw_line).rstrip('\r') for raw_line in raw_lines[:n_lines]]
+    
+    def offset_after_lines(self, n_lines: int) -> int:
+        """Return the byte offset just past the first N lines."""
+        head = self._head_for(n_lines)
+        pos = 0
+        for _ in range(n_lines):
+            newline = head.find(b'\n', pos)
+            if newline == -1:
+                return len(head)
+            pos = newline + 1
+        return pos
+    
+    def split_ranges(self, start: int, n_ranges: int) -> List[Tuple[int, int]]:
+        """The stream cannot be split, so the whole rest of the file is one range."""
+        return [(start, sys.maxsize)]
+    
+    def _iter_decompressed(self) -> Iterator[bytes]:
+        """Yield decompressed blocks, produced on a background thread when threaded."""
+        if not self.threaded:
+            with self._open_stream() as stream:
+                while True:
+                    data = stream.read(self.READ_CHUNK_SIZE)
+                    if not data:
+                        return
+                    yield data
+        
+        blocks = queue.Queue(maxsize=self.DECOMPRESS_QUEUE_BLOCKS)
+        stop = threading.Event()
+        
+        def put(item):
+            # Give up once the consumer has gone away, so the thread never blocks on a full queue
+            while not stop.is_set():
+                try:
+                    blocks.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+        
+        def decompress():
+            try:
+                with self._open_stream() as stream:
+                    while not stop.is_set():
+                        data = stream.read(self.READ_CHUNK_SIZE)
+                        put(data)
+                        if not data:
+                            return
+            except Exception as e:
+                put(e)
+        
+        thread = threading.Thread(target=decompress, name=f"decompress-{os.path.basename(self.file_path)}",
+                                  daemon=True)
+        thread.start()
+        try:
+            while True:
+                data = blocks.get()
+                if isinstance(data, Exception):
+                    raise data
+                if not data:
+                    return
+                yield data
+        finally:
+            stop.set()
+            thread.join()
+    
+    def _iter_blocks(self, start: int, end: Optional[int]) -> Iterator[Tuple[int, bytes]]:
+        """Yield (offset, bytes) blocks of whole lines covering the byte range."""
+        pos = 0  # Offset of the first byte in pending
+        pending = b''
+        for data in self._iter_decompressed():
+            pending += data
+            if pos < start:
+                skip = min(start - pos, len(pending))
+                pending = pending[skip:]
+                pos += skip
+                if pos < start:
+                    continue
+            if end is not None and pos + len(pending) >= end:
+                if end > pos:
+                    yield pos, pending[:end - pos]
+                return
+            # Hold back the partial last line until the next block completes it
+            newline = pending.rfind(b'\n')
+            if newline != -1:
+                yield pos, pending[:newline + 1]
+                pos += newline + 1
+                pending = pending[newline + 1:]
+        if pending:
+            yield pos, pending
+    
+    def line_index(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Byte offsets and lengths of every line (as iter_indexed_lines counts them)."""
+        newline_blocks = []
+        size = 0
+        for pos, block in self._iter_blocks(0, None):
+            newline_blocks.append(np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == ord('\n')) + pos)
+            size = pos + len(block)
+        ends = np.concatenate(newline_blocks) if newline_blocks else np.empty(0, dtype=np.int64)
+        if size and (len(ends) == 0 or ends[-1] != size - 1):
+            ends = np.append(ends, size)  # Last line has no terminator
+        starts = np.concatenate(([0], ends[:-1] + 1)).astype(np.int64) if len(ends) else ends
+        return starts, (ends - starts).astype(np.int32)
+    
+    def read_raw_line(self, offset: int, length: int) -> bytes:
+        """Return the undecoded bytes stored at a byte offset/length recorded by iter_indexed_lines."""
+        if offset + length <= len(self._head):
+            return self._head[offset:offset + length]
+        return self._read_range(offset, length)
+
+
+def open_log_reader(file_path: str, reader: Optional[LogFileReader] = None):
+    """Context manager yielding the shared reader if given, else a new one for file_path."""
+    if reader is not None:
+        return nullcontext(reader)
+    compression = detect_compression(file_path)
+    if compression is not None:
+        return CompressedLogReader(file_path, compression)
+    return LogFileReader(file_path)
+
+
+# Each parsed row keeps only where its original line lives in the source file
+LINE_OFFSET_COLUMN = '__parser_line_offset__'
+LINE_LENGTH_COLUMN = '__parser_line_length__'
+SOURCE_FILE_ATTR = '__parser_source_file__'
+
+
+def attach_line_index(df: pd.DataFrame, offsets: array, lengths: array, source_path: str) -> pd.DataFrame:
+    """Add the byte offset/length columns that locate each row's original line."""
+    if len(offsets) == len(df):
+        df[LINE_OFFSET_COLUMN] = np.frombuffer(offsets, dtype=np.int64)
+        df[LINE_LENGTH_COLUMN] = np.frombuffer(lengths, dtype=np.int32)
+        df.attrs[SOURCE_FILE_ATTR] = os.path.abspath(source_path)
+    return df
+
 
-def detect_delimiter(file_path: str, sample_lines: int = 50) -> str:
+def read_raw_line(file_path: str, offset: int, length: int) -> str:
+    """Fetch one original log line on demand from the memory-mapped source file."""
+    with open_log_reader(file_path) as reader:
+        return reader.read_line(int(offset), int(length))
+
+
+# Quoted fields, whose delimiters do not separate columns
+QUOTED_FIELD_PATTERN = re.compile(r'"[^"]*"')
+
+
+def detect_delimiter(file_path: str, sample_lines: int = 50, reader: Optional[LogFileReader] = None) -> str:
     """Detect the delimiter used in the file."""
     common_delimiters = [',', '\t', '|', ';']
     delimiter_counts = defaultdict(int)
     
-    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        for i, line in enumerate(f):
-            if i >= sample_lines:
-                break
-            line = line.strip()
+    with report_stage('detect_delimiter') as stats, open_log_reader(file_path, reader) as log_reader:
+        for line in log_reader.head_lines(sample_lines):
+            stats.count(1, len(line))
+            line = QUOTED_FIELD_PATTERN.sub('', line.strip())
             if line:
                 for delim in common_delimiters:
                     delimiter_counts[delim] += line.count(delim)
+            else:
+                stats.count(skipped_lines=1)
     
     if delimiter_counts:
         detected = max(delimiter_counts.items(), key=lambda x: x[1])[0]
@@ -42,6 +528,10 @@ def detect_delimiter(file_path: str, sample_lines: int = 50) -> str:
     return ','
 
 
+MESSAGE_TYPE_PATTERN = re.compile(r'^[A-Za-z0-9_-]+$')
+DATE_PREFIX_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
 def is_message_type(value: str) -> bool:
     """Check if a value looks like a message type identifier."""
     if not value or not isinstance(value, str):
@@ -54,7 +544,7 @@ def is_message_type(value: str) -> bool:
         return False
     
     # Pattern check: alphanumeric with underscore/dash
-    if not re.match(r'^[A-Za-z0-9_-]+$', value):
+    if not MESSAGE_TYPE_PATTERN.match(value):
         return False
     
     # Not a pure number
@@ -65,12 +555,24 @@ def is_message_type(value: str) -> bool:
         pass
     
     # Not a timestamp
-    if ':' in value or re.match(r'\d{4}-\d{2}-\d{2}', value):
+    if ':' in value or DATE_PREFIX_PATTERN.match(value):
         return False
     
     return True
 
 
+DATE_VALUE_PATTERN = re.compile(r'\d{4}[-/]\d{2}[-/]\d{2}')
+
+# Time patterns - must be proper time format, not just any string with colon
+# Matches: HH:MM:SS.mmm, HH:MM:SS, HH:MM, MM:SS.mmm, MM:SS
+# Does NOT match: "FLOWMETER: message" or "key: value" patterns
+TIME_VALUE_PATTERNS = [re.compile(pattern) for pattern in (
+    r'^\d{1,2}:\d{2}:\d{2}(\.\d+)?$',  # HH:MM:SS or HH:MM:SS.mmm
+    r'^\d{1,2}:\d{2}(\.\d+)?$',         # HH:MM or MM:SS.m
+    r'^\d{4}-\d{2}-\d{2}[T\s]\d{1,2}:\d{2}',  # ISO format with time
+)]
+
+
 def is_timestamp_value(value: str) -> bool:
     """Check if a value looks like a timestamp."""
     if not value or not isinstance(value, str):
@@ -79,23 +581,10 @@ def is_timestamp_value(value: str) -> bool:
     value = value.strip()
     
     # Date pattern (YYYY-MM-DD or YYYY/MM/DD)
-    if re.match(r'\d{4}[-/]\d{2}[-/]\d{2}', value):
+    if DATE_VALUE_PATTERN.match(value):
         return True
     
-    # Time patterns - must be proper time format, not just any string with colon
-    # Matches: HH:MM:SS.mmm, HH:MM:SS, HH:MM, MM:SS.mmm, MM:SS
-    # Does NOT match: "FLOWMETER: message" or "key: value" patterns
-    time_patterns = [
-        r'^\d{1,2}:\d{2}:\d{2}(\.\d+)?$',  # HH:MM:SS or HH:MM:SS.mmm
-        r'^\d{1,2}:\d{2}(\.\d+)?$',         # HH:MM or MM:SS.m
-        r'^\d{4}-\d{2}-\d{2}[T\s]\d{1,2}:\d{2}',  # ISO format with time
-    ]
-    
-    for pattern in time_patterns:
-        if re.match(pattern, value):
-            return True
-    
-    return False
+    return any(pattern.match(value) for pattern in TIME_VALUE_PATTERNS)
 
 
 def parse_mmss_timestamp(value: str) -> Optional[float]:
@@ -159,6 +648,46 @@ def is_mmss_timestamp(value: str) -> bool:
     return parse_mmss_timestamp(value) is not None
 
 
+# Common header keywords - expanded for drone/flight data
+HEADER_KEYWORDS = frozenset({
+    # Data types
+    'int', 'float', 'string', 'bool', 'datetime',
+    # Units
+    'm', 'cm', 'mm', 's', 'ms', 'deg', 'rad', 'meter', 'second', 'degree',
+    'unit', 'type', 'v', 'a', 'c', 'hz', 'khz', 'mhz',
+    # Position/navigation
+    'lat', 'latitude', 'lon', 'longitude', 'height', 'altitude', 'alt',
+    'yaw', 'pitch', 'roll', 'heading', 'bearing',
+    # Speed/motion
+    'speed', 'velocity', 'climb_rate', 'descent_rate', 'groundspeed',
+    # Flight state
+    'mode', 'armed', 'flying', 'landed', 'disarmed',
+    # Waypoints
+    'wp', 'waypoint', 'mission', 'seq', 'sequence',
+    # Spray/agriculture
+    'spray', 'flow', 'flowrate', 'dosage', 'pump', 'nozzle',
+    # RC channels
+    'rc1', 'rc2', 'rc3', 'rc4', 'rc5', 'rc6', 'rc7', 'rc8', 'rc9', 'rc10',
+    'rc11', 'rc12', 'rc13', 'rc14', 'rc15', 'rc16',
+    # Sensors
+    'gps', 'accel', 'gyro', 'mag', 'baro', 'compass',
+    # Battery/power
+    'voltage', 'current', 'battery', 'power',
+})
+
+# Fields with units in parentheses are headers (e.g., "height(m)", "speed(m/s)")
+HEADER_UNIT_PATTERN = re.compile(r'.*\([^)]+\)$')
+
+# Special patterns that indicate data, not headers
+DATA_VALUE_PATTERNS = [re.compile(pattern) for pattern in (
+    r'^-?\d+\.\d+$',  # Float numbers
+    r'^-?\d+$',        # Integer numbers
+    r'^(true|false)$', # Boolean
+    r'^[A-Z]+$',       # All caps (likely enum values like "LOITER", "ARMED")
+    r'^not-',          # Negation prefix (like "not-flying")
+)]
+
+
 def is_likely_header_row(parts: List[str]) -> bool:
     """Determine if a row is likely a header."""
     if len(parts) == 0:
@@ -168,36 +697,6 @@ def is_likely_header_row(parts: List[str]) -> bool:
     if parts[0] and is_timestamp_value(parts[0]):
         return False
     
-    # Common header keywords - expanded for drone/flight data
-    header_keywords = {
-        # Data types
-        'int', 'float', 'string', 'bool', 'datetime',
-        # Units
-        'm', 'cm', 'mm', 's', 'ms', 'deg', 'rad', 'meter', 'second', 'degree',
-        'unit', 'type', 'v', 'a', 'c', 'hz', 'khz', 'mhz',
-        # Position/navigation
-        'lat', 'latitude', 'lon', 'longitude', 'height', 'altitude', 'alt',
-        'yaw', 'pitch', 'roll', 'heading', 'bearing',
-        # Speed/motion
-        'speed', 'velocity', 'climb_rate', 'descent_rate', 'groundspeed',
-        # Flight state
-        'mode', 'armed', 'flying', 'landed', 'disarmed',
-        # Waypoints
-        'wp', 'waypoint', 'mission', 'seq', 'sequence',
-        # Spray/agriculture
-        'spray', 'flow', 'flowrate', 'dosage', 'pump', 'nozzle',
-        # RC channels
-        'rc1', 'rc2', 'rc3', 'rc4', 'rc5', 'rc6', 'rc7', 'rc8', 'rc9', 'rc10',
-        'rc11', 'rc12', 'rc13', 'rc14', 'rc15', 'rc16',
-        # Sensors
-        'gps', 'accel', 'gyro', 'mag', 'baro', 'compass',
-        # Battery/power
-        'voltage', 'current', 'battery', 'power',
-    }
-    
-    # Fields with units in parentheses are headers (e.g., "height(m)", "speed(m/s)")
-    unit_pattern = re.compile(r'.*\([^)]+\)$')
-    
     header_count = 0
     data_count = 0
     
@@ -208,12 +707,12 @@ def is_likely_header_row(parts: List[str]) -> bool:
             continue
         
         # Check for unit notation like "height(m)", "speed(m/s)"
-        if unit_pattern.match(part_clean):
+        if HEADER_UNIT_PATTERN.match(part_clean):
             header_count += 1
             continue
         
         # Check against header keywords
-        if part_clean in header_keywords:
+        if part_clean in HEADER_KEYWORDS:
             header_count += 1
             continue
         
@@ -230,16 +729,7 @@ def is_likely_header_row(parts: List[str]) -> bool:
             data_count += 1
             continue
         
-        # Special patterns that indicate data, not headers
-        data_patterns = [
-            r'^-?\d+\.\d+$',  # Float numbers
-            r'^-?\d+$',        # Integer numbers
-            r'^(true|false)$', # Boolean
-            r'^[A-Z]+$',       # All caps (likely enum values like "LOITER", "ARMED")
-            r'^not-',          # Negation prefix (like "not-flying")
-        ]
-        
-        is_data = any(re.match(pattern, part_clean) for pattern in data_patterns)
+        is_data = any(pattern.match(part_clean) for pattern in DATA_VALUE_PATTERNS)
         if is_data:
             data_count += 1
         else:
@@ -310,21 +800,19 @@ def detect_message_type_column(sample_rows: List[List[str]], max_col: int = 10)
     return None
 
 
-def sample_file(file_path: str, delimiter: str, n_lines: int = 50) -> List[List[str]]:
+def sample_file(file_path: str, delimiter: str, n_lines: int = 50, reader: Optional[LogFileReader] = None) -> List[List[str]]:
     """Sample first N lines from file."""
     sample = []
-    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        for i, line in enumerate(f):
-            if i >= n_lines:
-                break
+    with report_stage('sample_file') as stats, open_log_reader(file_path, reader) as log_reader:
+        for line in log_reader.head_lines(n_lines):
+            stats.count(1, len(line))
             line = line.strip()
             if line:
-                parts = [p.strip() for p in line.split(delimiter)]
-                # Strip trailing empty columns
-                while parts and not parts[-1]:
-                    parts.pop()
+                parts = split_line(line, delimiter)
                 if parts:  # Only add if there's actual content
                     sample.append(parts)
+                    continue
+            stats.count(skipped_lines=1)
     return sample
 
 
@@ -362,16 +850,61 @@ def generate_column_names(n_cols: int, sample_values: List[List[str]], msg_type_
     return columns
 
 
+# Value vocabularies shared by per-cell inference and columnar conversion
+NULL_TOKENS = ('none', 'null', 'nan', '')
+TRUE_TOKENS = ('true', 'yes')
+FALSE_TOKENS = ('false', 'no')
+
+# Datetime formats tried in order (includes time-only formats)
+DATETIME_FORMATS = ['%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d %H:%M:%S',
+                    '%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S',
+                    '%Y/%m/%d %H:%M:%S.%f', '%Y/%m/%d %H:%M:%S',
+                    '%Y-%m-%d', '%Y/%m/%d', '%m/%d/%Y', '%d/%m/%Y',
+                    '%H:%M:%S.%f', '%H:%M:%S']
+
+# Vectorized equivalents of is_timestamp_value() and parse_mmss_timestamp()
+TIMESTAMP_VALUE_PATTERN = (r'^(?:\d{4}[-/]\d{2}[-/]\d{2}'
+                           r'|\d{1,2}:\d{2}:\d{2}(?:\.\d+)?$'
+                           r'|\d{1,2}:\d{2}(?:\.\d+)?$)')
+MMSS_VALUE_PATTERN = r'^(?:(\d+):)?(\d+):(\d+\.?\d*|\.\d+)$'
+
+# String columns whose sampled values repeat this much are stored as pd.Categorical
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+CATEGORY_MIN_SAMPLE = 10  # Too few values to judge repetition below this
+
+
+def match_datetime_format(value: str) -> Optional[str]:
+    """Return the first of DATETIME_FORMATS that parses the value exactly, or None."""
+    for fmt in DATETIME_FORMATS:
+        try:
+            datetime.strptime(value, fmt)
+            return fmt
+        except (ValueError, TypeError):
+            continue
+    return None
+
+
+def parse_datetime_value(value: str) -> Optional[datetime]:
+    """Parse a single timestamp string with any known format, falling back to pandas' parser."""
+    fmt = match_datetime_format(value)
+    if fmt is not None:
+        return datetime.strptime(value, fmt)
+    try:
+        return pd.Timestamp(value)
+    except (ValueError, TypeError):
+        return None
+
+
 def infer_value_type(value: str) -> Tuple[str, Any]:
     """Infer the data type of a string value and convert it."""
     value = value.strip()
     
-    if not value or value.lower() in ('none', 'null', 'nan', ''):
+    if not value or value.lower() in NULL_TOKENS:
         return ('null', None)
     
     # Try boolean
-    if value.lower() in ('true', 'false', 'yes', 'no'):
-        bool_val = value.lower() in ('true', 'yes')
+    if value.lower() in TRUE_TOKENS + FALSE_TOKENS:
+        bool_val = value.lower() in TRUE_TOKENS
         return ('bool', bool_val)
     
     # Try MM:SS.s format (like 00:00.0) - check before full datetime
@@ -387,18 +920,9 @@ def infer_value_type(value: str) -> Tuple[str, Any]:
     
     # Try datetime (includes HH:MM:SS format)
     if is_timestamp_value(value):
-        try:
-            # Try various datetime formats
-            for fmt in ['%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d %H:%M:%S', 
-                       '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y',
-                       '%H:%M:%S.%f', '%H:%M:%S']:  # Added time-only formats
-                try:
-                    dt = datetime.strptime(value, fmt)
-                    return ('datetime', dt)
-                except (ValueError, TypeError):
-                    continue
-        except (ValueError, TypeError, AttributeError):
-            pass
+        fmt = match_datetime_format(value)
+        if fmt is not None:
+            return ('datetime', datetime.strptime(value, fmt))
     
     # Try numeric
     try:
@@ -427,7 +951,7 @@ def infer_column_types_from_data(data_rows: List[List[str]], headers: List[str])
                 type_samples[headers[i]].append(inferred_type)
     
     # Determine type by majority vote
-    for header in headers:
+    for col_idx, header in enumerate(headers):
         samples = type_samples[header]
         if not samples:
             continue
@@ -450,446 +974,3067 @@ def infer_column_types_from_data(data_rows: List[List[str]], headers: List[str])
         # Use most common type
         most_common = Counter(non_null_types).most_common(1)[0][0]
         column_types[header] = most_common
+        
+        # Strings that keep repeating (modes, process names, log levels) become categories
+        if most_common == 'string' and is_low_cardinality(data_rows[:sample_size], col_idx):
+            column_types[header] = 'category'
     
     return column_types
 
 
-def convert_row_values(row: List[str], column_types: Dict[str, str], headers: List[str]) -> List[Any]:
-    """Convert row values based on inferred types."""
-    converted = []
-    for i, value in enumerate(row):
-        # Only process values up to the number of headers
-        # This ensures output matches header length
-        if i >= len(headers):
-            break  # Truncate extra columns
-        
-        header = headers[i]
-        target_type = column_types.get(header, 'string')
+def infer_datetime_formats(data_rows: List[List[str]], headers: List[str],
+                           column_types: Dict[str, str]) -> Dict[str, str]:
+    """Pick the datetime format most sampled values of each datetime column use."""
+    column_formats = {}
+    sample = data_rows[:100]
+    for col_idx, header in enumerate(headers):
+        if column_types.get(header) != 'datetime':
+            continue
         
-        _, converted_value = infer_value_type(value)
-        converted.append(converted_value)
-    
-    # Pad with None if row is shorter than headers
-    while len(converted) < len(headers):
-        converted.append(None)
+        formats = Counter()
+        for row in sample:
+            if col_idx < len(row):
+                value = row[col_idx].strip()
+                if is_timestamp_value(value):
+                    formats[match_datetime_format(value)] += 1
+        formats.pop(None, None)
+        if formats:
+            column_formats[header] = formats.most_common(1)[0][0]
     
-    return converted
+    return column_formats
 
 
-def apply_timestamp_offset(df: pd.DataFrame, offset: timedelta) -> pd.DataFrame:
-    """Apply timestamp offset to datetime columns."""
-    if offset == timedelta(0):
-        return df
+def is_low_cardinality(data_rows: List[List[str]], col_idx: int) -> bool:
+    """Check whether the non-null values of one column repeat enough to store it as categorical."""
+    values = [row[col_idx].strip() for row in data_rows if col_idx < len(row)]
+    values = [v for v in values if v.lower() not in NULL_TOKENS]
+    if len(values) < CATEGORY_MIN_SAMPLE:
+        return False
+    return len(set(values)) / len(values) <= CATEGORY_MAX_UNIQUE_RATIO
+
+
+def concat_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate frames built separately from one file in order, keeping the dtypes a
+    single build would give: categoricals get the sorted union of their categories
+    and an integer column becomes float if any frame had fractional values.
+    """
+    if len(frames) == 1:
+        return frames[0]
     
-    for col in df.columns:
-        if pd.api.types.is_datetime64_any_dtype(df[col]):
-            df[col] = df[col] + offset
+    # Wider rows in later frames add columns; they go before the line index columns
+    line_index_columns = [col for col in (LINE_OFFSET_COLUMN, LINE_LENGTH_COLUMN) if col in frames[0].columns]
+    columns = [col for col in dict.fromkeys(col for frame in frames for col in frame.columns)
+               if col not in line_index_columns] + line_index_columns
+    for i, frame in enumerate(frames):
+        missing = [col for col in columns if col not in frame.columns]
+        if missing:
+            # Empty columns of the type the other frames have (None, NaN or NaT, as a single build pads)
+            dtypes = {col: next(f[col].dtype for f in frames if col in f.columns) for col in missing}
+            frames[i] = frame.assign(**{col: pd.Series([None] * len(frame), index=frame.index, dtype=dtype)
+                                        for col, dtype in dtypes.items()})[columns]
     
+    for col in columns:
+        dtypes = [frame[col].dtype for frame in frames]
+        if all(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes):
+            # Frames built separately (or read back from the cache) have different categories; give them all the union
+            categories_dtype = dtypes[0].categories.dtype
+            for frame, dtype in zip(frames, dtypes):
+                if dtype.categories.dtype != categories_dtype:
+                    frame[col] = frame[col].cat.rename_categories(dtype.categories.astype(categories_dtype))
+            categories = union_categoricals([frame[col] for frame in frames], sort_categories=True).categories
+            for frame in frames:
+                frame[col] = frame[col].cat.set_categories(categories)
+        elif pd.Int64Dtype() in dtypes and any(pd.api.types.is_float_dtype(dtype) for dtype in dtypes):
+            for frame in frames:
+                frame[col] = frame[col].astype('float64')
+    
+    df = pd.concat(frames, ignore_index=True)
+    df.attrs = dict(frames[0].attrs)
     return df
 
 
-def parse_universal_log(file_path: str = None, timestamp_offset: timedelta = timedelta(hours=5, minutes=30)) -> Tuple[Dict[str, pd.DataFrame], str]:
-    """Universal log parser that handles various formats."""
+def convert_datetime_column(values: pd.Series, fmt: Optional[str] = None) -> pd.Series:
+    """
+    Convert a column of timestamp strings to datetime64.
     
-    # File selection
-    if file_path is None:
-        if HAS_EASYGUI:
-            file_path = easygui.fileopenbox(
-                msg="Select log file",
-                title="File Selection",
-                filetypes=["*.log", "*.txt", "*.csv", "*.tsv", "*.*"]
-            )
-        else:
-            print("Error: easygui not available and no file path provided")
-            return {}, ""
+    With the column's format known, the whole column is converted in one call and
+    only the rows that don't match it are parsed one by one. Otherwise each known
+    format is tried in bulk on the rows still unparsed.
+    """
+    converted = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+    
+    if fmt is not None:
+        parsed = pd.to_datetime(values, format=fmt, errors='coerce')
+        matched = parsed.notna()
+        converted[matched] = parsed[matched]
         
-        if not file_path:
-            print("No file selected")
-            return {}, ""
+        # Only values that look like timestamps are candidates (same rule as is_timestamp_value)
+        remaining = values[~matched]
+        remaining = remaining[remaining.str.match(TIMESTAMP_VALUE_PATTERN, na=False)]
+        if not remaining.empty:
+            row_parsed = remaining.map(parse_datetime_value)
+            try:
+                row_parsed = pd.to_datetime(row_parsed, errors='coerce')
+                matched = row_parsed.notna()
+                converted[matched.index[matched]] = row_parsed[matched]
+            except (ValueError, TypeError):
+                pass  # e.g. timezone-aware leftovers, which the column can't hold
+        return converted
     
-    if not os.path.exists(file_path):
-        print(f"Error: File not found: {file_path}")
-        return {}, ""
+    # Only values that look like timestamps are candidates (same rule as is_timestamp_value)
+    remaining = values[values.str.match(TIMESTAMP_VALUE_PATTERN, na=False)]
     
-    # Check file size and warn for large files
-    file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
-    if file_size_mb > 100:
-        print(f"⚠️  Large file detected ({file_size_mb:.1f} MB)")
-        print(f"    Loading may take significant time and memory...")
+    for fmt in DATETIME_FORMATS:
+        if remaining.empty:
+            break
+        parsed = pd.to_datetime(remaining, format=fmt, errors='coerce')
+        matched = parsed.notna()
+        converted[matched.index[matched]] = parsed[matched]
+        remaining = remaining[~matched]
     
-    filename = os.path.basename(file_path)
-    print(f"Parsing: {filename}")
-    print("="*70)
+    # Timestamp-like leftovers (e.g. ISO 'T' separator) go through pandas' flexible parser
+    if not remaining.empty:
+        parsed = pd.to_datetime(remaining, format='mixed', errors='coerce')
+        matched = parsed.notna()
+        converted[matched.index[matched]] = parsed[matched]
     
-    # Detect delimiter
-    delimiter = detect_delimiter(file_path)
+    return converted
+
+
+def convert_mmss_column(values: pd.Series) -> pd.Series:
+    """Convert a column of MM:SS.s / HH:MM:SS.sss values to seconds; plain numbers pass through."""
+    seconds = pd.to_numeric(values, errors='coerce')
     
-    # Sample file
-    sample = sample_file(file_path, delimiter, n_lines=100)
-    if not sample:
-        print("Error: Empty or invalid file")
-        return {}, filename
+    parts = values.str.extract(MMSS_VALUE_PATTERN)
+    hours = pd.to_numeric(parts[0], errors='coerce')
+    minutes = pd.to_numeric(parts[1], errors='coerce')
+    secs = pd.to_numeric(parts[2], errors='coerce')
     
-    print(f"Sample: {len(sample)} lines")
+    # Same validation ranges as parse_mmss_timestamp
+    has_hours = hours.notna()
+    valid = minutes.notna() & secs.notna() & (secs < 60)
+    valid &= ~has_hours | ((hours <= 99) & (minutes <= 59))
+    valid &= has_hours | (minutes <= 9999)
     
-    # Detect message type column
-    msg_type_col = detect_message_type_column(sample)
+    elapsed = hours.fillna(0) * 3600 + minutes * 60 + secs
+    return seconds.mask(valid, elapsed)
+
+
+def convert_bool_column(values: pd.Series) -> pd.Series:
+    """Convert a column of boolean-like strings to bool (nulls become False)."""
+    lowered = values.str.lower()
+    is_true = lowered.isin(TRUE_TOKENS)
+    # Anything else that isn't false/null is truthy unless it is a zero number
+    other = ~is_true & ~lowered.isin(FALSE_TOKENS + NULL_TOKENS) & values.notna()
+    numeric = pd.to_numeric(values, errors='coerce')
+    return (is_true | (other & (numeric.isna() | (numeric != 0)))).astype('bool')
+
+
+def integer_or_float_column(numeric: pd.Series) -> pd.Series:
+    """An 'int' column's parsed numbers as Int64, or as floats if any value has a fractional part."""
+    if (numeric.dropna() % 1 == 0).all():
+        return numeric.astype('Int64')
+    return numeric
+
+
+def convert_column(values: pd.Series, col_type: str, fmt: Optional[str] = None) -> pd.Series:
+    """Convert a whole column of raw string values to the inferred column type (and datetime format)."""
+    if col_type == 'datetime':
+        return convert_datetime_column(values, fmt)
+    elif col_type == 'mmss_timestamp':
+        return convert_mmss_column(values)
+    elif col_type == 'int':
+        return integer_or_float_column(pd.to_numeric(values, errors='coerce'))
+    elif col_type == 'float':
+        return pd.to_numeric(values, errors='coerce')
+    elif col_type == 'bool':
+        return convert_bool_column(values)
     
-    if msg_type_col is not None:
-        # Interleaved format
-        dataframes = parse_interleaved_format(file_path, delimiter, msg_type_col, timestamp_offset)
-    else:
-        # Check for mixed format (different column counts)
-        col_counts = Counter(len(row) for row in sample)
-        if len(col_counts) > 1:
-            print(f"  Mixed format detected: {len(col_counts)} different column counts")
-            dataframes = parse_mixed_format(file_path, delimiter, timestamp_offset)
-        else:
-            # Standard CSV/TSV
-            dataframes = parse_standard_format(file_path, delimiter, sample, timestamp_offset)
+    # String columns keep the raw text, with null markers normalized to None
+    is_null = values.isna() | values.str.lower().isin(NULL_TOKENS)
+    values = values.astype(object).where(~is_null, None)
+    if col_type == 'category':
+        return pd.Series(pd.Categorical(values), index=values.index)
+    return values
+
+
+def convert_raw_numbers(values: Sequence[Optional[bytes]], col_type: str) -> Optional[pd.Series]:
+    """
+    convert_column for an 'int' or 'float' column of undecoded fields (see split_raw_line),
+    parsed in bulk by NumPy; None if a value is missing or not a plain number, in which
+    case the decoded column has to go through convert_column.
+    """
+    if not values or None in values:
+        return None
+    # NumPy reads 1_000 as a number where pandas does not, and drops trailing NUL bytes
+    joined = b''.join(values)
+    if b'_' in joined or b'\x00' in joined:
+        return None
     
-    print("\n" + "="*70)
-    print(f"Parsing complete: {len(dataframes)} DataFrames created")
-    for name, df in dataframes.items():
-        print(f"  {name}: {len(df)} rows, {len(df.columns)} columns")
+    raw = np.array(values, dtype='S')
+    try:
+        try:
+            # Like pd.to_numeric, a column of integers stays int64
+            numeric = raw.astype(np.int64)
+        except ValueError:
+            numeric = raw.astype(np.float64)
+    except (ValueError, OverflowError):
+        # Text, or integers beyond int64 that pandas reads as uint64
+        return None
+    numeric = pd.Series(numeric)
+    return integer_or_float_column(numeric) if col_type == 'int' else numeric
+
+
+def join_column_blocks(parts: List[pd.Series]) -> pd.Series:
+    """
+    Join the separately converted blocks of one column into the Series converting all
+    of its values at once gives: categoricals get the sorted union of their categories
+    and an integer column becomes float if any block had fractional values.
+    """
+    if len(parts) == 1:
+        return parts[0]
     
-    return dataframes, filename
+    dtypes = [part.dtype for part in parts]
+    if all(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes):
+        # Blocks without values have categories of another dtype, and the union infers its own
+        categories_dtype = next((dtype.categories.dtype for dtype in dtypes if len(dtype.categories)),
+                                dtypes[0].categories.dtype)
+        parts = [part.cat.rename_categories(dtype.categories.astype(categories_dtype))
+                 if dtype.categories.dtype != categories_dtype else part
+                 for part, dtype in zip(parts, dtypes)]
+        joined = union_categoricals(parts, sort_categories=True)
+        if joined.categories.dtype != categories_dtype:
+            joined = joined.rename_categories(joined.categories.astype(categories_dtype))
+        return pd.Series(joined)
+    if pd.Int64Dtype() in dtypes and any(pd.api.types.is_float_dtype(dtype) for dtype in dtypes):
+        parts = [part.astype('float64') for part in parts]
+    return pd.concat(parts, ignore_index=True)
 
 
-def parse_interleaved_format(file_path: str, delimiter: str, msg_type_col: int, timestamp_offset: timedelta) -> Dict[str, pd.DataFrame]:
-    """Parse interleaved format with message types - FIXED VERSION."""
-    message_headers = {}
-    message_data = defaultdict(list)
-    message_raw_data = defaultdict(list)
-    message_raw_headers = {}  # Store raw header lines
+def apply_timestamp_offset(df: pd.DataFrame, offset: timedelta) -> pd.DataFrame:
+    """Apply timestamp offset to datetime columns."""
+    if offset == timedelta(0):
+        return df
     
-    print("\nParsing interleaved format...")
+    with report_stage('timestamp_offset') as stats:
+        stats.count(len(df))
+        for col in df.columns:
+            if pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = df[col] + offset
     
-    # Determine how many columns before message type (common prefix)
-    common_prefix_cols = msg_type_col  # Columns before message type (timestamp, process, loglevel, etc.)
+    return df
+
+
+class ParseFilter:
+    """
+    DataFrames (message types, 'DATA' or 'DATA_MISC_<n>COLS'), columns and (start, end) time window
+    a parse keeps; the rest is dropped while tokenizing. Datetimes compare with the parser's output
+    timestamps, numbers with elapsed seconds. The timestamp column is always kept.
+    """
     
-    try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line_num, line in enumerate(f, 1):
-                original_line = line.rstrip('\n\r')
-                line = line.strip()
-                if not line:
-                    continue
-                
-                parts = [p.strip() for p in line.split(delimiter)]
-                
-                # Strip trailing empty columns
-                while parts and not parts[-1]:
-                    parts.pop()
-                
-                if len(parts) <= msg_type_col:
-                    continue
-                
-                message_type = parts[msg_type_col].strip().upper()
-                
-                if not is_message_type(message_type):
-                    continue
-                
-                # Extract prefix (timestamp, process, log level) and message-specific data
-                prefix = parts[:msg_type_col]
-                message_specific = parts[msg_type_col+1:]  # Data after message type
-                
-                # Check if header or data BY LOOKING ONLY AT MESSAGE-SPECIFIC COLUMNS
-                if message_type not in message_headers:
-                    # First occurrence - check if it's header or data
-                    # IMPORTANT: Only check message-specific columns, not the prefix
-                    if is_likely_header_row(message_specific):
-                        # Generate names for prefix columns, use actual names for message-specific
-                        prefix_names = generate_column_names(len(prefix), [prefix])
-                        # Store combined header names
-                        message_headers[message_type] = prefix_names + message_specific
-                        # Store the raw header line for later reference
-                        message_raw_headers[message_type] = original_line
-                        print(f"  Header for '{message_type}': {message_specific}")
-                    else:
-                        # First row is data, generate column names for all
-                        full_row = prefix + message_specific
-                        message_headers[message_type] = generate_column_names(len(full_row), [full_row])
-                        message_data[message_type].append(full_row)
-                        message_raw_data[message_type].append(original_line)
-                        print(f"  '{message_type}': No header, generated {len(full_row)} column names")
-                elif is_likely_header_row(message_specific):
-                    # Skip subsequent header rows (metadata)
-                    continue
-                else:
-                    # Data row - reconstruct full row with prefix
-                    full_row = prefix + message_specific
-                    message_data[message_type].append(full_row)
-                    message_raw_data[message_type].append(original_line)
-    except Exception as e:
-        raise RuntimeError(f"Critical parsing error at line {line_num}: {e}")
+    def __init__(self, message_types: Optional[Set[str]] = None, columns: Optional[Set[str]] = None,
+                 time_range: Optional[Tuple[Any, Any]] = None, timestamp_offset: timedelta = timedelta(0)):
+        self.message_types = {name.upper() for name in message_types} if message_types else None
+        self.columns = set(columns) if columns else None
+        self.time_range = time_range
+        self.time_field = None  # Position of the timestamp in a data row, see locate_time_field
+        self.time_format = None
+        
+        self.start = self.end = None
+        self.numeric_window = False
+        if time_range is not None:
+            self.start, self.end = time_range
+            self.numeric_window = not isinstance(self.start or self.end, datetime)
+            if not self.numeric_window:
+                # Compare raw timestamps, before the offset is added
+                self.start = self.start - timestamp_offset if self.start is not None else None
+                self.end = self.end - timestamp_offset if self.end is not None else None
     
-    # Create DataFrames - FIXED: Properly use headers as column names
-    dataframes = {}
+    def __repr__(self) -> str:
+        return (f"ParseFilter(message_types={sorted(self.message_types or [])}, "
+                f"columns={sorted(self.columns or [])}, time_range={self.time_range})")
     
-    for msg_type, headers in message_headers.items():
-        if msg_type not in message_data or not message_data[msg_type]:
-            print(f"  Warning: No data found for '{msg_type}' (only header)")
-            continue
-        
-        data_rows = message_data[msg_type]
-        
-        # Ensure consistent column count
-        max_cols = max(len(row) for row in data_rows)
-        if len(headers) < max_cols:
-            # Extend headers if needed
-            for i in range(len(headers), max_cols):
-                headers.append(f'column_{i}')
-        elif len(headers) > max_cols:
-            # Trim headers if needed
-            headers = headers[:max_cols]
-        
-        # Pad rows to match header length
-        padded_data = []
-        for row in data_rows:
-            if len(row) < len(headers):
-                padded_row = row + [''] * (len(headers) - len(row))
-            else:
-                padded_row = row[:len(headers)]
-            padded_data.append(padded_row)
-        
-        # Infer types
-        column_types = infer_column_types_from_data(padded_data, headers)
+    def keeps_name(self, name: str) -> bool:
+        """Check whether a DataFrame (or message type) is wanted."""
+        return self.message_types is None or name.upper() in self.message_types
+    
+    def locate_time_field(self, sample: List[List[str]], msg_type_col: Optional[int] = None):
+        """Find the timestamp position in the sampled rows (same rule as generate_column_names) and its format."""
+        if self.time_range is None:
+            return
         
-        # Convert data with proper types
-        converted_data = []
-        for row in padded_data:
-            converted_row = convert_row_values(row, column_types, headers)
-            converted_data.append(converted_row)
+        # Interleaved logs only share the prefix columns before the message type
+        data_rows = [row[:msg_type_col] for row in sample] if msg_type_col is not None else sample
+        if not data_rows:
+            return
         
-        # Create DataFrame with explicit column names - THIS IS THE FIX
-        df = pd.DataFrame(converted_data, columns=headers)
+        sample = data_rows[:20]
+        n_cols = max((len(row) for row in sample), default=0)
+        for col_idx in range(n_cols):
+            values = [row[col_idx] for row in sample if col_idx < len(row) and is_timestamp_value(row[col_idx])]
+            if sample and len(values) >= len(sample) * 0.5:
+                self.time_field = col_idx
+                formats = Counter(match_datetime_format(value.strip()) for value in values)
+                formats.pop(None, None)
+                self.time_format = formats.most_common(1)[0][0] if formats else None
+                return
         
-        # Add raw data column
-        raw_col_name = '__parser_raw_line__'
-        if msg_type in message_raw_data and len(message_raw_data[msg_type]) == len(df):
-            df[raw_col_name] = message_raw_data[msg_type]
+        # Elapsed seconds are plain numbers; find them by the header name instead
+        if self.numeric_window and is_likely_header_row(data_rows[0]):
+            time_col = find_timestamp_column(data_rows[0], set(data_rows[0]))
+            if time_col is not None:
+                self.time_field = data_rows[0].index(time_col)
+                return
         
-        # Store raw header line if it exists (for context menu display)
-        if msg_type in message_raw_headers:
-            df.attrs['__parser_raw_header__'] = message_raw_headers[msg_type]
+        print("  Warning: No timestamp column found, time window ignored")
+    
+    def parse_time(self, value: str) -> Any:
+        """Parse one raw timestamp (text or undecoded bytes) for the window check; None if it can't be read."""
+        if isinstance(value, bytes):
+            value = value.decode('utf-8', errors='ignore')
+        value = value.strip()
+        if self.numeric_window:
+            if ':' in value:
+                return parse_mmss_timestamp(value)
+            try:
+                return float(value)
+            except ValueError:
+                return None
         
-        # Apply proper data types
-        for col_name, col_type in column_types.items():
-            if col_name in df.columns:
-                try:
-                    if col_type == 'datetime':
-                        df[col_name] = pd.to_datetime(df[col_name], errors='coerce')
-                    elif col_type == 'mmss_timestamp':
-                        # Convert to float (seconds) for plotting
-                        df[col_name] = pd.to_numeric(df[col_name], errors='coerce')
-                        print(f"  Converted '{col_name}' from MM:SS.s format to seconds")
-                    elif col_type == 'int':
-                        df[col_name] = pd.to_numeric(df[col_name], errors='coerce').astype('Int64')
-                    elif col_type == 'float':
-                        df[col_name] = pd.to_numeric(df[col_name], errors='coerce')
-                    elif col_type == 'bool':
-                        df[col_name] = df[col_name].astype('bool')
-                except Exception as e:
-                    print(f"  Warning: Could not convert column '{col_name}' to {col_type}: {e}")
-        
-        # Apply timestamp offset
-        df = apply_timestamp_offset(df, timestamp_offset)
+        if self.time_format is not None:
+            try:
+                return datetime.strptime(value, self.time_format)
+            except ValueError:
+                pass
+        return parse_datetime_value(value) if is_timestamp_value(value) else None
+    
+    def keeps_row(self, row: List[str]) -> bool:
+        """Check a tokenized data row against the time window."""
+        if self.time_field is None:
+            return True
+        if self.time_field >= len(row):
+            return False
         
-        dataframes[msg_type] = df
-        print(f"  Created DataFrame for '{msg_type}': {len(df)} rows × {len(df.columns)} columns")
+        time_value = self.parse_time(row[self.time_field])
+        if time_value is None:
+            return False
+        return ((self.start is None or time_value >= self.start)
+                and (self.end is None or time_value <= self.end))
     
-    return dataframes
+    def project(self, headers: List[str], column_types: Dict[str, str]) -> Optional[Set[str]]:
+        """Names of the columns to convert, or None for all of them."""
+        if self.columns is None:
+            return None
+        
+        keep = self.columns | {'timestamp'}
+        if self.time_field is not None and self.time_field < len(headers):
+            keep.add(headers[self.time_field])
+        # The column a standard log renames to 'timestamp'
+        numeric_columns = {name for name, col_type in column_types.items()
+                           if col_type in ('int', 'float', 'mmss_timestamp')}
+        time_col = find_timestamp_column(headers, numeric_columns)
+        if time_col is not None:
+            keep.add(time_col)
+        return keep
 
 
-def parse_standard_format(file_path: str, delimiter: str, sample: List[List[str]], timestamp_offset: timedelta) -> Dict[str, pd.DataFrame]:
-    """Parse standard CSV/TSV format."""
-    print("\nParsing standard CSV/TSV format...")
+def make_parse_filter(selection: Optional[ParseFilter], timestamp_offset: timedelta) -> Optional[ParseFilter]:
+    """Fresh copy of a caller's ParseFilter for one parse with timestamp_offset, or None when nothing is filtered."""
+    if selection is None or (not selection.message_types and not selection.columns and selection.time_range is None):
+        return None
+    return ParseFilter(selection.message_types, selection.columns, selection.time_range, timestamp_offset)
+
+
+class ParseCancelled(Exception):
+    """Raised inside the parser once its ParseProgress has been cancelled."""
+
+
+class ParseProgress:
+    """
+    Progress reporting and cooperative cancellation for a parse running on another thread.
     
-    # Check if first row is header
-    first_row = sample[0]
-    has_header = is_likely_header_row(first_row)
-    raw_header_line = None
+    The parser calls stage() when it starts a new step and advance() every
+    PROGRESS_REPORT_LINES lines; both pass (stage, bytes_read, total_bytes, lines)
+    to callback on the parsing thread and raise ParseCancelled once cancel() has
+    been called, unwinding the parse and dropping its partial buffers.
+    """
     
-    if has_header:
-        print("  Detected header row")
-        headers = first_row
-        skip_rows = 1
-        # Get the raw header line
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            raw_header_line = f.readline().rstrip('\n\r')
-    else:
-        print("  No header detected, generating column names...")
-        headers = generate_column_names(len(first_row), sample)
-        skip_rows = 0
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.cancel_event = threading.Event()
+        self.stage_name = ''
+        self.total_bytes = 0
+        self.bytes_read = 0
+        self.lines = 0
     
-    # Read all data
-    all_data = []
-    all_raw_data = []
+    def cancel(self):
+        """Ask the parser to stop at its next progress report (safe to call from any thread)."""
+        self.cancel_event.set()
     
-    try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line_num, line in enumerate(f):
-                if line_num < skip_rows:
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+    
+    def check(self):
+        if self.cancelled:
+            raise ParseCancelled("Parsing cancelled")
+    
+    def report(self):
+        self.check()
+        if self.callback is not None:
+            self.callback(self.stage_name, self.bytes_read, self.total_bytes, self.lines)
+    
+    def stage(self, name: str, total_bytes: Optional[int] = None):
+        self.stage_name = name
+        if total_bytes is not None:
+            self.total_bytes = total_bytes
+        self.report()
+    
+    def advance(self, bytes_read: int, lines: Optional[int] = None):
+        self.bytes_read = bytes_read
+        if lines is not None:
+            self.lines = lines
+        self.report()
+
+
+# Worker processes are started from a clean process rather than forked: the parser runs on a
+# background thread of the GUI, and a fork would copy locks held by its other threads
+POOL_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+CANCEL_POLL_SECONDS = 0.1  # How often a wait on worker processes checks for cancel
+
+
+@contextlib.contextmanager
+def worker_pool(workers: int) -> Iterator[ProcessPoolExecutor]:
+    """Process pool for parsing; work still queued is dropped when the block fails or is cancelled."""
+    context = multiprocessing.get_context(POOL_START_METHOD)
+    if POOL_START_METHOD == 'forkserver':
+        # Workers are forked from a server that has already imported pandas and the parser
+        context.set_forkserver_preload(['numpy', 'pandas', __name__])
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+    try:
+        yield executor
+    except ParseCancelled:
+        # Return at once; work already running in the workers is left to finish in the background
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    except BaseException:
+        executor.shutdown(cancel_futures=True)
+        raise
+    executor.shutdown()
+
+
+def wait_for_future(future, progress: Optional[ParseProgress] = None):
+    """Block until a worker future is done, raising ParseCancelled as soon as progress is cancelled."""
+    if progress is None:
+        wait_futures([future])
+        return
+    while not wait_futures([future], timeout=CANCEL_POLL_SECONDS).done:
+        progress.check()
+
+
+def run_in_worker(function: Callable, *args, **kwargs) -> Tuple[Any, Optional[int]]:
+    """Call function in a worker process; returns its result with the worker's peak RSS (see worker_result)."""
+    return function(*args, **kwargs), peak_rss_bytes()
+
+
+def worker_result(future, report: Optional['ParseReport'] = None) -> Any:
+    """Result of a run_in_worker future; the worker's peak RSS goes to report (default: the thread's active one)."""
+    result, peak = future.result()
+    if report is None:
+        report = getattr(active_report, 'report', None)
+    if report is not None:
+        report.add_worker_peak(peak)
+    return result
+
+
+def wait_for_ranges(futures: List, ranges: List[Tuple[int, int]], progress: Optional[ParseProgress] = None) -> List:
+    """Collect per-range worker results in file order, reporting progress and checking for cancel while waiting."""
+    results = []
+    for future, (_, end) in zip(futures, ranges):
+        wait_for_future(future, progress)
+        results.append(worker_result(future))
+        if progress is not None:
+            progress.advance(end)
+    return results
+
+
+# Steps a ParseReport times, in the order they are listed
+REPORT_STAGES = ('file_pool', 'detect_delimiter', 'sample_file', 'message_type_detection', 'parse_cache',
+                 'tokenizing', 'type_inference', 'conversion', 'dtype_application', 'timestamp_offset',
+                 'timestamp_renaming', 'compaction')
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident memory of this process so far, if the platform reports it."""
+    if not HAS_RESOURCE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class StageStats:
+    """Totals of one stage (and message type) of a ParseReport."""
+    
+    def __init__(self):
+        self.calls = 0
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.bytes = 0
+        self.lines = 0
+        self.skipped_lines = 0
+        self.peak_traced_bytes = None
+        self.peak_rss_bytes = None
+    
+    def count(self, lines: int = 0, n_bytes: int = 0, skipped_lines: int = 0):
+        """Add input handled by the stage."""
+        self.lines += lines
+        self.bytes += n_bytes
+        self.skipped_lines += skipped_lines
+    
+    def add(self, other: 'StageStats'):
+        self.calls += other.calls
+        self.wall_seconds += other.wall_seconds
+        self.cpu_seconds += other.cpu_seconds
+        self.count(other.lines, other.bytes, other.skipped_lines)
+        for attr in ('peak_traced_bytes', 'peak_rss_bytes'):
+            peaks = [peak for peak in (getattr(self, attr), getattr(other, attr)) if peak is not None]
+            setattr(self, attr, max(peaks) if peaks else None)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {'calls': self.calls, 'wall_seconds': round(self.wall_seconds, 6),
+                'cpu_seconds': round(self.cpu_seconds, 6), 'bytes': self.bytes, 'lines': self.lines,
+                'skipped_lines': self.skipped_lines, 'peak_traced_bytes': self.peak_traced_bytes,
+                'peak_rss_bytes': self.peak_rss_bytes}
+
+
+# The ParseReport recording on each thread (see ParseReport.activate)
+active_report = threading.local()
+
+
+class ParseReport:
+    """
+    Where a parse spent its time and memory, per stage (REPORT_STAGES) and message type.
+    
+    Pass one to parse_universal_log and read it afterwards (to_dict, to_json,
+    format_text). While it is active on the parsing thread, the parser's steps
+    record themselves through report_stage(): wall and CPU time of the thread,
+    bytes, lines and skipped lines (headers, blank and filtered-out lines), and
+    memory peaks: the process's peak RSS at the end of the step and, with
+    trace_memory, the peak of Python allocations during it (tracemalloc, which
+    slows parsing down). A stage's time excludes the stages nested in it, so the
+    stages add up to the parse. Work done in worker processes is counted as the
+    time spent waiting for it, and worker-process ranges only count their kept
+    lines; each worker process reports its own peak RSS (peak_worker_rss_bytes).
+    LazyDataFrames build their frames after the parse; those builds are recorded
+    only while a report is active on the thread that triggers them.
+    """
+    
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.file_path = ''
+        self.format_name = None
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.peak_worker_rss_bytes = None  # Largest peak RSS a worker process reported for itself
+        self.stats = {}  # (stage, message type or None) -> StageStats
+        self.active = []  # Open stages on the parsing thread, innermost last
+    
+    @contextlib.contextmanager
+    def activate(self):
+        """Record the stages of the parse running on this thread until the block exits."""
+        previous = getattr(active_report, 'report', None)
+        active_report.report = self
+        start_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if start_tracing:
+            tracemalloc.start()
+        start_wall, start_cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield self
+        finally:
+            self.wall_seconds += time.perf_counter() - start_wall
+            self.cpu_seconds += time.thread_time() - start_cpu
+            if start_tracing:
+                tracemalloc.stop()
+            active_report.report = previous
+    
+    def stage_stats(self, name: str, message_type: Optional[str] = None) -> StageStats:
+        stats = self.stats.get((name, message_type))
+        if stats is None:
+            stats = self.stats[(name, message_type)] = StageStats()
+        return stats
+    
+    @contextlib.contextmanager
+    def stage(self, name: str, message_type: Optional[str] = None):
+        """Time the block as one call of a stage; nested stages inherit the message type."""
+        if message_type is None and self.active:
+            message_type = self.active[-1]['message_type']
+        stats = self.stage_stats(name, message_type)
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            # The enclosing stage keeps its peak so far, this one starts from the current usage
+            if self.active:
+                self.active[-1]['peak'] = max(self.active[-1]['peak'], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        frame = {'message_type': message_type, 'nested_wall': 0.0, 'nested_cpu': 0.0, 'peak': 0}
+        self.active.append(frame)
+        start_wall, start_cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield stats
+        finally:
+            wall = time.perf_counter() - start_wall
+            cpu = time.thread_time() - start_cpu
+            self.active.pop()
+            stats.calls += 1
+            stats.wall_seconds += wall - frame['nested_wall']
+            stats.cpu_seconds += cpu - frame['nested_cpu']
+            if self.active:
+                self.active[-1]['nested_wall'] += wall
+                self.active[-1]['nested_cpu'] += cpu
+            if tracing:
+                peak = max(frame['peak'], tracemalloc.get_traced_memory()[1])
+                stats.peak_traced_bytes = max(stats.peak_traced_bytes or 0, peak)
+            stats.peak_rss_bytes = peak_rss_bytes()
+    
+    def add_time(self, name: str, wall: float, cpu: float, lines: int = 0, message_type: Optional[str] = None):
+        """Record time measured outside stage() as one call of a stage nested in the current one."""
+        if message_type is None and self.active:
+            message_type = self.active[-1]['message_type']
+        stats = self.stage_stats(name, message_type)
+        stats.calls += 1
+        stats.wall_seconds += wall
+        stats.cpu_seconds += cpu
+        stats.count(lines)
+        stats.peak_rss_bytes = peak_rss_bytes()
+        if self.active:
+            self.active[-1]['nested_wall'] += wall
+            self.active[-1]['nested_cpu'] += cpu
+    
+    def add_worker_peak(self, peak: Optional[int]):
+        """Record the peak RSS of a worker process, as it measured it before returning its result."""
+        if peak is not None:
+            self.peak_worker_rss_bytes = max(self.peak_worker_rss_bytes or 0, peak)
+    
+    def add_file(self, other: 'ParseReport', label: str):
+        """Add another file's report, its message types prefixed with label (as parse_log_files names frames)."""
+        for (name, message_type), stats in other.stats.items():
+            prefixed = label if message_type is None else f"{label}{FILE_NAMESPACE_SEPARATOR}{message_type}"
+            self.stage_stats(name, prefixed).add(stats)
+        self.wall_seconds += other.wall_seconds
+        self.cpu_seconds += other.cpu_seconds
+        self.add_worker_peak(other.peak_worker_rss_bytes)
+    
+    def entries(self) -> List[Tuple[str, Optional[str], StageStats]]:
+        """(stage, message type, stats) in REPORT_STAGES order, message types in order of appearance."""
+        order = {name: i for i, name in enumerate(REPORT_STAGES)}
+        keys = sorted(self.stats, key=lambda key: order.get(key[0], len(order)))
+        return [(name, message_type, self.stats[(name, message_type)]) for name, message_type in keys]
+    
+    def stage_totals(self) -> Dict[str, StageStats]:
+        """Each stage summed over its message types."""
+        totals = {}
+        for name, _, stats in self.entries():
+            totals.setdefault(name, StageStats()).add(stats)
+        return totals
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {'file': self.file_path, 'format': self.format_name,
+                'wall_seconds': round(self.wall_seconds, 6), 'cpu_seconds': round(self.cpu_seconds, 6),
+                'peak_rss_bytes': peak_rss_bytes(), 'peak_worker_rss_bytes': self.peak_worker_rss_bytes,
+                'trace_memory': self.trace_memory,
+                'totals': {name: stats.to_dict() for name, stats in self.stage_totals().items()},
+                'stages': [dict(stage=name, message_type=message_type, **stats.to_dict())
+                           for name, message_type, stats in self.entries()]}
+    
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+    
+    def format_text(self) -> str:
+        """Plain-text table of the report, one line per stage and message type."""
+        mb = 1024 * 1024
+        title = f"Parse report: {self.file_path}" + (f" ({self.format_name})" if self.format_name else "")
+        lines = [title, f"Total: {self.wall_seconds:.3f} s wall, {self.cpu_seconds:.3f} s CPU", "",
+                 f"{'Stage':<24}{'Message type':<28}{'Wall s':>9}{'CPU s':>9}{'Lines':>12}"
+                 f"{'Skipped':>10}{'MB':>9}{'Peak MB':>9}"]
+        for name, message_type, stats in self.entries():
+            peak = stats.peak_traced_bytes if stats.peak_traced_bytes is not None else stats.peak_rss_bytes
+            lines.append(f"{name:<24}{(message_type or '-')[:27]:<28}{stats.wall_seconds:>9.3f}"
+                         f"{stats.cpu_seconds:>9.3f}{stats.lines:>12,}{stats.skipped_lines:>10,}"
+                         f"{stats.bytes / mb:>9.1f}{(peak / mb if peak is not None else 0):>9.1f}")
+        if self.peak_worker_rss_bytes is not None:
+            lines.append(f"\nLargest worker process peak RSS: {self.peak_worker_rss_bytes / mb:.1f} MB")
+        if self.trace_memory:
+            lines.append("\nPeak MB: Python allocations during the stage (tracemalloc)")
+        else:
+            lines.append("\nPeak MB: peak resident memory of the process at the end of the stage")
+        return "\n".join(lines)
+
+
+def report_stage(name: str, message_type: Optional[str] = None):
+    """Context manager timing a parser step in the thread's active ParseReport; gives its StageStats."""
+    report = getattr(active_report, 'report', None)
+    if report is None:
+        return nullcontext(StageStats())
+    return report.stage(name, message_type)
+
+
+def report_count(name: str, lines: int = 0, n_bytes: int = 0, skipped_lines: int = 0,
+                 message_type: Optional[str] = None):
+    """Add input handled by a stage to the thread's active ParseReport, if any."""
+    report = getattr(active_report, 'report', None)
+    if report is not None:
+        report.stage_stats(name, message_type).count(lines, n_bytes, skipped_lines)
+
+
+def report_time(name: str, wall: float, cpu: float, lines: int = 0, message_type: Optional[str] = None):
+    """Add time spent in a stage, measured by the caller, to the thread's active ParseReport, if any."""
+    report = getattr(active_report, 'report', None)
+    if report is not None:
+        report.add_time(name, wall, cpu, lines, message_type)
+
+
+# Parse cache settings (the location can also be set with the CLAN_CACHE_DIR environment variable)
+PARSE_CACHE_DIR = os.environ.get('CLAN_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.clan_cache')
+PARSE_CACHE_MAX_MB = 4096
+PARSE_CACHE_VERSION = 4  # Bump when parser output changes so stale entries are ignored
+
+
+def text_columns(df: pd.DataFrame) -> List[str]:
+    """Columns of Python strings (object dtype, or categories of them), which Feather reads back as str dtype."""
+    text = []
+    for col in df.columns:
+        dtype = df[col].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            dtype = dtype.categories.dtype
+        if dtype == object:
+            text.append(col)
+    return text
+
+
+def restore_text_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Turn text columns read through Arrow (Feather, Polars) back into Python strings, with None for nulls."""
+    for col in columns:
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            df[col] = values.cat.set_categories(values.cat.categories.astype(object))
+        else:
+            df[col] = values.astype(object).where(values.notna(), None)
+    return df
+
+
+class ParseCache:
+    """
+    Size-bounded on-disk cache of parsed DataFrames, keyed by file identity.
+    
+    Each entry is a directory holding one Feather file per DataFrame and a
+    manifest with the frame names, attrs (raw header line, source file) and
+    text columns. Entries are touched on every hit and the least recently used
+    ones are evicted once the cache grows beyond max_mb.
+    """
+    
+    HASH_BLOCK_SIZE = 1024 * 1024  # Bytes hashed from the start and end of the file
+    MANIFEST_NAME = 'manifest.json'
+    
+    def __init__(self, cache_dir: Optional[str] = None, max_mb: float = PARSE_CACHE_MAX_MB):
+        self.cache_dir = cache_dir or PARSE_CACHE_DIR
+        self.max_bytes = int(max_mb * 1024 * 1024)
+    
+    def file_key(self, file_path: str, options: str = '') -> str:
+        """Key on path, size, mtime, a hash of the first and last blocks and the parse options."""
+        stat = os.stat(file_path)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{PARSE_CACHE_VERSION}|{os.path.abspath(file_path)}|{stat.st_size}|"
+                      f"{stat.st_mtime_ns}|{options}".encode('utf-8'))
+        with open(file_path, 'rb') as f:
+            digest.update(f.read(self.HASH_BLOCK_SIZE))
+            if stat.st_size > self.HASH_BLOCK_SIZE:
+                f.seek(max(self.HASH_BLOCK_SIZE, stat.st_size - self.HASH_BLOCK_SIZE))
+                digest.update(f.read(self.HASH_BLOCK_SIZE))
+        return digest.hexdigest()
+    
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key)
+    
+    def load(self, key: str) -> Optional[Dict[str, pd.DataFrame]]:
+        """Return the cached DataFrames for key, or None on a miss."""
+        entry_dir = self._entry_dir(key)
+        manifest_path = os.path.join(entry_dir, self.MANIFEST_NAME)
+        if not os.path.exists(manifest_path):
+            return None
+        
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            
+            dataframes = {}
+            for frame in manifest['frames']:
+                df = pd.read_feather(os.path.join(entry_dir, frame['file']))
+                df = restore_text_columns(df, frame['text_columns'])
+                df.attrs.update(frame['attrs'])
+                dataframes[frame['name']] = df
+        except (OSError, ValueError, KeyError) as e:
+            print(f"  Warning: Discarding unreadable cache entry {key}: {e}")
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return None
+        
+        # Mark as recently used
+        os.utime(manifest_path)
+        return dataframes
+    
+    def load_parse_layout(self, key: str) -> Optional[Dict]:
+        """Return the parse layout stored with the entry for key (see describe_parse_layout), if any."""
+        try:
+            with open(os.path.join(self._entry_dir(key), self.MANIFEST_NAME), 'r', encoding='utf-8') as f:
+                return json.load(f).get('parse_layout')
+        except (OSError, ValueError):
+            return None
+    
+    def store(self, key: str, dataframes: Dict[str, pd.DataFrame], source_path: str = '',
+              parse_layout: Optional[Dict] = None):
+        """Write DataFrames (and the layout that produced them) for key, then evict old entries if over the size limit."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=f'.{key}.', dir=self.cache_dir)
+        
+        try:
+            frames = []
+            for i, (name, df) in enumerate(dataframes.items()):
+                file_name = f'{i}.feather'
+                df.to_feather(os.path.join(tmp_dir, file_name))
+                frames.append({'name': name, 'file': file_name, 'attrs': df.attrs,
+                               'text_columns': text_columns(df)})
+            
+            with open(os.path.join(tmp_dir, self.MANIFEST_NAME), 'w', encoding='utf-8') as f:
+                json.dump({'source': source_path, 'frames': frames, 'parse_layout': parse_layout}, f)
+            
+            entry_dir = self._entry_dir(key)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(tmp_dir, entry_dir)
+        except Exception as e:
+            # Frames pyarrow can't represent (e.g. duplicate column names) are simply not cached
+            print(f"  Warning: Could not cache parse result: {e}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+        
+        self.evict()
+    
+    def evict(self):
+        """Remove least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            entry_dir = self._entry_dir(name)
+            manifest_path = os.path.join(entry_dir, self.MANIFEST_NAME)
+            if name.startswith('.') or not os.path.exists(manifest_path):
+                continue
+            size = sum(entry.stat().st_size for entry in os.scandir(entry_dir) if entry.is_file())
+            entries.append((os.path.getmtime(manifest_path), size, entry_dir))
+            total += size
+        
+        for _, size, entry_dir in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+            print(f"  Evicted cache entry {os.path.basename(entry_dir)} ({size / (1024 * 1024):.1f} MB)")
+
+
+PARALLEL_MIN_FILE_SIZE = 64 * 1024 * 1024  # Files smaller than this are parsed on one core
+RANGES_PER_WORKER = 4  # More ranges than workers keeps all cores busy until the end
+DEFAULT_CHUNK_ROWS = 250_000  # Rows held in memory at once by the streaming parsers
+PROGRESS_REPORT_LINES = 20_000  # Lines between ParseProgress reports (and cancellation checks)
+
+
+def resolve_worker_count(workers: Optional[int], file_size: int) -> int:
+    """Pick the number of parser processes: None means all cores for large files, one otherwise."""
+    if workers is None:
+        return (os.cpu_count() or 1) if file_size >= PARALLEL_MIN_FILE_SIZE else 1
+    return max(1, int(workers))
+
+
+# Post-parse dtype compaction (see compact_dataframes)
+COMPACT_CATEGORY_RATIO = 0.5  # Text columns with at most this share of distinct values become categories
+COMPACT_INTEGER_DTYPES = [(np.int8, 'Int8'), (np.int16, 'Int16'), (np.int32, 'Int32')]
+
+
+def compact_column(series: pd.Series, lossy_floats: bool = False) -> pd.Series:
+    """
+    Smallest dtype that holds every value of a column unchanged: 0/1 integers
+    without gaps become bool, other integers the narrowest (nullable if there
+    are gaps) integer type, floats float32 if each value round-trips exactly
+    (always, if lossy_floats) and repetitive text becomes a category.
+    """
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+        return series
+    
+    if pd.api.types.is_integer_dtype(dtype):
+        values = series.dropna()
+        if len(values) == 0:
+            return series
+        has_gaps = len(values) < len(series)
+        low, high = values.min(), values.max()
+        if not has_gaps and low >= 0 and high <= 1:
+            return series.astype(bool)
+        for numpy_type, nullable_type in COMPACT_INTEGER_DTYPES:
+            limits = np.iinfo(numpy_type)
+            if limits.min <= low and high <= limits.max:
+                return series.astype(nullable_type if has_gaps else numpy_type)
+        return series
+    
+    if pd.api.types.is_float_dtype(dtype):
+        if dtype == np.float32:
+            return series
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        narrowed = values.astype(np.float32)
+        if lossy_floats or np.array_equal(narrowed.astype(np.float64), values, equal_nan=True):
+            return pd.Series(narrowed, index=series.index, name=series.name)
+        return series
+    
+    if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+        if len(series) and series.nunique() <= COMPACT_CATEGORY_RATIO * len(series):
+            try:
+                return series.astype('category')
+            except TypeError:
+                return series  # Mixed value types that cannot be ordered as categories
+    return series
+
+
+def compact_dataframe(df: pd.DataFrame, lossy_floats: bool = False) -> pd.DataFrame:
+    """Apply compact_column to every data column (the timestamp and parser columns keep their types)."""
+    df = df.copy(deep=False)
+    # By position, as a log's header can repeat a column name
+    for i, col in enumerate(df.columns):
+        if col == 'timestamp' or str(col).startswith('__parser_'):
+            continue
+        df.isetitem(i, compact_column(df.iloc[:, i], lossy_floats))
+    return df
+
+
+def dataframes_memory(dataframes: Dict[str, pd.DataFrame]) -> int:
+    """Bytes held by the DataFrames, including the contents of text columns."""
+    return sum(int(df.memory_usage(deep=True).sum()) for df in dataframes.values())
+
+
+def compact_dataframes(dataframes: Dict[str, pd.DataFrame],
+                       memory_budget_mb: Optional[float] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Store each column in the smallest dtype that keeps its values (see compact_column).
+    If the frames still need more than memory_budget_mb, floats are stored as float32
+    even where that rounds them (to about 7 significant digits).
+    """
+    before = dataframes_memory(dataframes)
+    compacted = {name: compact_dataframe(df) for name, df in dataframes.items()}
+    after = dataframes_memory(compacted)
+    print(f"  Compacted dtypes: {before / (1024 * 1024):.1f} MB -> {after / (1024 * 1024):.1f} MB")
+    
+    if memory_budget_mb is not None and after > memory_budget_mb * 1024 * 1024:
+        compacted = {name: compact_dataframe(df, lossy_floats=True) for name, df in compacted.items()}
+        after = dataframes_memory(compacted)
+        print(f"  Over the {memory_budget_mb:g} MB budget: float columns rounded to float32 "
+              f"({after / (1024 * 1024):.1f} MB)")
+        if after > memory_budget_mb * 1024 * 1024:
+            print(f"  Warning: Parsed data still exceeds the {memory_budget_mb:g} MB budget")
+    return compacted
+
+
+def detect_log_layout(file_path: str, reader: LogFileReader) -> Tuple[str, List[List[str]], Optional[int]]:
+    """Detect the delimiter, sample the file and find the message type column (None if not interleaved)."""
+    # Detect delimiter
+    delimiter = detect_delimiter(file_path, reader=reader)
+    
+    # Sample file
+    sample = sample_file(file_path, delimiter, n_lines=100, reader=reader)
+    if not sample:
+        return delimiter, sample, None
+    
+    print(f"Sample: {len(sample)} lines")
+    
+    # Detect message type column
+    with report_stage('message_type_detection') as stats:
+        stats.count(len(sample))
+        return delimiter, sample, detect_message_type_column(sample)
+
+
+def iter_universal_log(file_path: str, timestamp_offset: timedelta = timedelta(hours=5, minutes=30),
+                       chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                       filter: Optional[ParseFilter] = None) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """
+    Parse a log as (DataFrame name, chunk) batches of at most chunk_rows rows. Each name's schema
+    is fixed by its first chunk, so collect_chunks gives the same frames as parse_universal_log.
+    """
+    with open_log_reader(file_path) as reader:
+        print(f"Streaming: {os.path.basename(file_path)}")
+        print("="*70)
+        
+        delimiter, sample, msg_type_col = detect_log_layout(file_path, reader)
+        if not sample:
+            print("Error: Empty or invalid file")
+            return
+        
+        parse_filter = make_parse_filter(filter, timestamp_offset)
+        if parse_filter is not None:
+            parse_filter.locate_time_field(sample, msg_type_col)
+        
+        if msg_type_col is not None:
+            print("\nParsing interleaved format in chunks...")
+            yield from iter_interleaved_chunks(file_path, delimiter, msg_type_col, timestamp_offset,
+                                               reader=reader, chunk_rows=chunk_rows, parse_filter=parse_filter)
+        elif len(Counter(len(row) for row in sample)) > 1:
+            print("\nParsing mixed format in chunks...")
+            yield from iter_mixed_chunks(file_path, delimiter, timestamp_offset, reader=reader,
+                                         chunk_rows=chunk_rows, parse_filter=parse_filter)
+        else:
+            print("\nParsing standard CSV/TSV format in chunks...")
+            layout = prepare_standard_format(sample, reader)
+            yield from iter_standard_chunks(file_path, delimiter, layout, timestamp_offset,
+                                            reader=reader, chunk_rows=chunk_rows, parse_filter=parse_filter)
+
+
+def parse_universal_log(file_path: str = None, timestamp_offset: timedelta = timedelta(hours=5, minutes=30),
+                        workers: Optional[int] = None, use_cache: bool = True,
+                        cache_dir: Optional[str] = None, engine: str = 'pandas',
+                        filter: Optional[ParseFilter] = None, lazy: bool = False,
+                        progress: Optional[ParseProgress] = None,
+                        incremental: bool = False, compact: bool = False,
+                        memory_budget_mb: Optional[float] = None,
+                        report: Optional[ParseReport] = None) -> Tuple[Dict[str, pd.DataFrame], str]:
+    """
+    Universal log parser that handles various formats (plain or gzip/bz2/xz/zstd compressed,
+    or a clan_manifest.json written by convert_log_files).
+    
+    workers: parser processes (None = all cores for large files). use_cache: reuse the frames
+    of an earlier parse of the unchanged file (pyarrow). engine: 'pandas', 'polars' or 'bytes'
+    (numeric columns parsed from undecoded bytes; text columns are still decoded per block, so
+    it only helps mostly numeric logs). filter: a ParseFilter. lazy: build interleaved frames on
+    first access. progress: a ParseProgress, which can cancel the parse. incremental: parse only
+    lines appended since the last parse. compact/memory_budget_mb: see compact_dataframes.
+    report: a ParseReport that receives the time and memory of each stage.
+    """
+    if engine not in PARSE_ENGINES:
+        raise ValueError(f"Unknown parse engine '{engine}', expected one of {PARSE_ENGINES}")
+    if engine == 'polars' and not (HAS_POLARS and HAS_PYARROW):
+        print("Warning: Polars engine needs polars and pyarrow, using the pandas engine")
+        engine = 'pandas'
+    
+    # File selection
+    if file_path is None:
+        if HAS_EASYGUI:
+            file_path = easygui.fileopenbox(
+                msg="Select log file",
+                title="File Selection",
+                filetypes=["*.log", "*.txt", "*.csv", "*.tsv", "*.gz", "*.bz2", "*.xz", "*.zst", "*.*"]
+            )
+        else:
+            print("Error: easygui not available and no file path provided")
+            return {}, ""
+        
+        if not file_path:
+            print("No file selected")
+            return {}, ""
+    
+    if not os.path.exists(file_path):
+        print(f"Error: File not found: {file_path}")
+        return {}, ""
+    
+    if report is not None:
+        report.file_path = file_path
+    with report.activate() if report is not None else nullcontext():
+        # Output of the command-line converter is loaded as is
+        if os.path.basename(file_path) == CONVERTED_MANIFEST_NAME:
+            dataframes, filename = load_columnar(file_path)
+            if compact:
+                with report_stage('compaction'):
+                    dataframes = compact_dataframes(dataframes, memory_budget_mb)
+            return dataframes, filename
+        
+        filename = os.path.basename(file_path)
+        if incremental and detect_compression(file_path) is not None:
+            incremental = False  # A compressed log cannot have grown in place
+        compact = compact or memory_budget_mb is not None
+        if compact:
+            incremental = False  # The full-width frames would have to stay in memory to be extended
+        parse_filter = make_parse_filter(filter, timestamp_offset)
+        options = f"offset={timestamp_offset.total_seconds()};engine={engine}"
+        if parse_filter is not None:
+            options += f";filter={parse_filter!r}"
+        
+        # A log that only grew since its last parse needs just the appended lines parsed
+        incremental_key = (os.path.abspath(file_path), options, lazy)
+        state = incremental_states.get(incremental_key) if incremental else None
+        if state is not None:
+            with open_log_reader(file_path) as reader:
+                if state.can_extend(reader):
+                    incremental_states.move_to_end(incremental_key)
+                    if reader.size > state.end_offset:
+                        print(f"Parsing {reader.size - state.end_offset:,} appended bytes of {filename}")
+                        if progress is not None:
+                            progress.stage("Parsing appended lines", reader.size)
+                        try:
+                            with report_stage('tokenizing') as stats:
+                                stats.count(n_bytes=reader.size - state.end_offset)
+                                parse_appended_lines(file_path, state, timestamp_offset, reader, parse_filter,
+                                                     progress)
+                        except BaseException:
+                            # A half-applied tail would leave the frames and frozen schema out of step
+                            del incremental_states[incremental_key]
+                            raise
+                    else:
+                        print(f"{filename} is unchanged since its last parse")
+                    return state.result(), filename
+            print(f"{filename} changed before the end of its last parse, parsing it in full")
+            del incremental_states[incremental_key]
+        
+        # Reopening an unchanged file loads the stored frames directly
+        cache = ParseCache(cache_dir) if use_cache and HAS_PYARROW else None
+        if cache is not None:
+            cache_key = cache.file_key(file_path, options=options)
+            if progress is not None:
+                progress.stage("Checking parse cache")
+            with report_stage('parse_cache'):
+                cached = cache.load(cache_key)
+            if cached is not None:
+                print(f"Loaded {filename} from parse cache ({len(cached)} DataFrames)")
+                parse_layout = cache.load_parse_layout(cache_key) if incremental else None
+                if parse_layout is not None:
+                    with open_log_reader(file_path) as reader:
+                        state = restore_parse_state(file_path, parse_layout, timestamp_offset, parse_filter,
+                                                    cached, reader)
+                    remember_parse(incremental_key, state)
+                    cached = state.result()
+                if compact:
+                    with report_stage('compaction'):
+                        cached = compact_dataframes(cached, memory_budget_mb)
+                return cached, filename
+        
+        # One reader serves detection, sampling and the full parse
+        with open_log_reader(file_path) as reader:
+            # Check file size and warn for large files
+            file_size_mb = reader.size / (1024 * 1024)
+            if file_size_mb > 100:
+                print(f"⚠️  Large file detected ({file_size_mb:.1f} MB)")
+                print(f"    Loading may take significant time and memory...")
+            
+            print(f"Parsing: {filename}")
+            print("="*70)
+            
+            if not reader.random_access:
+                # A compressed stream is read front to back once, so it is tokenized as it is decompressed
+                print(f"  {reader.compression} compressed, decompressing while parsing")
+                workers, lazy = 1, False
+                if engine == 'polars':
+                    print("  Polars engine needs an uncompressed file, using the pandas engine")
+                    engine = 'pandas'
+            
+            if progress is not None:
+                progress.stage("Detecting format", reader.size)
+            delimiter, sample, msg_type_col = detect_log_layout(file_path, reader)
+            if not sample:
+                print("Error: Empty or invalid file")
+                return {}, filename
+            
+            if parse_filter is not None:
+                parse_filter.locate_time_field(sample, msg_type_col)
+            
+            if progress is not None:
+                progress.stage("Indexing" if lazy and msg_type_col is not None else "Parsing")
+            
+            # Reading and splitting lines; the typing steps nested in it are timed on their own
+            with report_stage('tokenizing') as stats:
+                stats.count(n_bytes=reader.size)
+                # Polars handles interleaved and standard logs; mixed ones always use the pandas path
+                dataframes = None
+                if engine == 'polars':
+                    dataframes = parse_with_polars(file_path, delimiter, sample, msg_type_col, timestamp_offset, reader,
+                                                   parse_filter, progress)
+                
+                # The pandas parsers record their headers and schemas for incremental reloads
+                frozen = FrozenSchema()
+                format_name = None
+                raw_bytes = engine == 'bytes'
+                if dataframes is not None:
+                    print("  Parsed with the Polars engine")
+                elif msg_type_col is not None:
+                    # Interleaved format
+                    format_name = 'interleaved'
+                    n_workers = resolve_worker_count(workers, reader.size)
+                    dataframes = parse_interleaved_format(file_path, delimiter, msg_type_col, timestamp_offset,
+                                                          reader=reader, workers=n_workers, parse_filter=parse_filter,
+                                                          lazy=lazy, progress=progress, frozen=frozen,
+                                                          raw_bytes=raw_bytes)
+                else:
+                    # Check for mixed format (different column counts)
+                    col_counts = Counter(len(row) for row in sample)
+                    if len(col_counts) > 1:
+                        print(f"  Mixed format detected: {len(col_counts)} different column counts")
+                        format_name = 'mixed'
+                        dataframes = parse_mixed_format(file_path, delimiter, timestamp_offset, reader=reader,
+                                                        parse_filter=parse_filter, progress=progress, frozen=frozen,
+                                                        raw_bytes=raw_bytes)
+                    else:
+                        # Standard CSV/TSV
+                        format_name = 'standard'
+                        n_workers = resolve_worker_count(workers, reader.size)
+                        dataframes = parse_standard_format(file_path, delimiter, sample, timestamp_offset,
+                                                           reader=reader, workers=n_workers, parse_filter=parse_filter,
+                                                           progress=progress, frozen=frozen, raw_bytes=raw_bytes)
+            
+            if report is not None:
+                report.format_name = format_name or ('interleaved' if msg_type_col is not None else 'standard')
+            if incremental and format_name is not None:
+                state = IncrementalParseState(file_path, format_name, delimiter, msg_type_col, timestamp_offset,
+                                              parse_filter, frozen, dataframes, reader, raw_bytes)
+                remember_parse(incremental_key, state)
+                dataframes = state.result()
+        
+        print("\n" + "="*70)
+        if isinstance(dataframes, LazyDataFrames):
+            # Frames are built on first access, so there is nothing to cache yet
+            dataframes.compact = compact
+            print(f"Indexing complete: {len(dataframes)} DataFrames available")
+            for name in dataframes:
+                print(f"  {name}: {dataframes.row_count(name)} rows")
+            return dataframes, filename
+        
+        print(f"Parsing complete: {len(dataframes)} DataFrames created")
+        for name, df in dataframes.items():
+            print(f"  {name}: {len(df)} rows, {len(df.columns)} columns")
+        
+        if cache is not None and dataframes:
+            if progress is not None:
+                progress.stage("Writing parse cache")
+            parse_layout = None
+            if format_name is not None:
+                parse_layout = describe_parse_layout(format_name, delimiter, msg_type_col, frozen, parse_filter,
+                                                     raw_bytes)
+            with report_stage('parse_cache'):
+                cache.store(cache_key, dataframes, source_path=os.path.abspath(file_path),
+                            parse_layout=parse_layout)
+        
+        if compact and dataframes:
+            if progress is not None:
+                progress.stage("Compacting dtypes")
+            with report_stage('compaction'):
+                dataframes = compact_dataframes(dataframes, memory_budget_mb)
+        
+        return dataframes, filename
+
+
+QUOTE_CHAR = '"'
+
+
+def split_quoted_line(line: str, delimiter: str) -> List[str]:
+    """
+    Split a line containing quotes with the csv module, so delimiters inside quoted
+    fields stay in their field and doubled quotes ("") unescape. Quotes that do not
+    open a field are kept as text.
+    """
+    try:
+        return next(csv.reader((line,), delimiter=delimiter, quotechar=QUOTE_CHAR, skipinitialspace=True))
+    except csv.Error:
+        return line.split(delimiter)
+
+
+def split_line(line: str, delimiter: str) -> List[str]:
+    """Strip a line, split it on the delimiter (honouring quoted fields) and drop trailing empty fields."""
+    line = line.strip()
+    if QUOTE_CHAR in line and len(delimiter) == 1:
+        parts = [p.strip() for p in split_quoted_line(line, delimiter)]
+    else:
+        parts = [p.strip() for p in line.split(delimiter)]
+    while parts and not parts[-1]:
+        parts.pop()
+    return parts
+
+
+RAW_WHITESPACE = b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'  # The ASCII characters str.strip() removes
+RAW_FIELD_SEPARATOR = b'\x00'  # Joins a column's raw fields so they are decoded in one call
+
+
+def split_raw_line(line: bytes, delimiter: bytes) -> List[bytes]:
+    """
+    split_line for an undecoded line (see LogFileReader.iter_indexed_raw_lines). The
+    fields are left unstripped: NumPy reads numbers with surrounding whitespace and
+    text is stripped as it is decoded (see decode_raw_fields). Lines with quotes or
+    non-ASCII bytes are decoded and split by split_line instead.
+    """
+    if b'"' in line or not line.isascii():
+        return [part.encode() for part in split_line(line.decode('utf-8', errors='ignore'), delimiter.decode())]
+    parts = line.strip(RAW_WHITESPACE).split(delimiter)
+    while parts and not parts[-1].strip(RAW_WHITESPACE):
+        parts.pop()
+    return parts
+
+
+def decode_raw_fields(fields: List[bytes]) -> List[str]:
+    """The fields of split_raw_line as split_line gives them."""
+    return [field.decode('utf-8', errors='ignore').strip() for field in fields]
+
+
+def decode_raw_rows(rows: List[List[bytes]]) -> List[List[str]]:
+    """decode_raw_fields for each row, e.g. of the first rows a schema is inferred from."""
+    return [decode_raw_fields(row) for row in rows]
+
+
+def decode_raw_column(values: Sequence[Optional[bytes]]) -> List[Optional[str]]:
+    """decode_raw_fields for one column's values (None for short rows), decoded in one call where possible."""
+    if None not in values:
+        joined = RAW_FIELD_SEPARATOR.join(values)
+        # Unless a value contains the separator itself
+        if joined.count(RAW_FIELD_SEPARATOR) == len(values) - 1:
+            return list(map(str.strip, joined.decode('utf-8', errors='ignore').split('\x00')))
+    return [value.decode('utf-8', errors='ignore').strip() if value is not None else None for value in values]
+
+
+def split_interleaved_line(line: str, delimiter: str, msg_type_col: int) -> Optional[Tuple[str, List[str], List[str]]]:
+    """Split an interleaved-format line into (message_type, prefix, message_specific), or None if it has no message type."""
+    parts = split_line(line, delimiter)
+    if len(parts) <= msg_type_col:
+        return None
+    
+    message_type = parts[msg_type_col].strip().upper()
+    if not is_message_type(message_type):
+        return None
+    
+    # Prefix (timestamp, process, log level) and message-specific data after the message type
+    return message_type, parts[:msg_type_col], parts[msg_type_col+1:]
+
+
+def numeric_positions(values: List[str]) -> List[int]:
+    """Positions of the values that parse as numbers."""
+    positions = []
+    for i, value in enumerate(values):
+        try:
+            float(value)
+            positions.append(i)
+        except ValueError:
+            pass
+    return positions
+
+
+MESSAGE_TOKEN_CACHE_SIZE = 4096  # Distinct message-type column values whose is_message_type outcome is kept
+HEADER_DECISIONS_PER_TYPE = 1024  # Distinct lines per message type whose is_likely_header_row outcome is kept
+
+
+class MessageTypeRecord:
+    """What an InterleavedLineClassifier has learned about one message type's lines."""
+    
+    def __init__(self):
+        self.numeric_fields = []  # Message-specific fields that held numbers in its first data row
+        self.decisions = {}  # is_likely_header_row outcome of lines that needed it, by their fields
+
+
+class InterleavedLineClassifier:
+    """
+    Splits interleaved lines and tells header lines from data the way
+    split_interleaved_line and is_likely_header_row do, without re-running the
+    heuristics on every line.
+    
+    Message-type column values are looked up in a dict, so is_message_type runs
+    once per distinct value. A line whose message-specific fields are at least
+    half numbers can never be a header (numbers always count as data), which for
+    a known type is checked by trying float() on the fields that were numbers in
+    its first data row. Only the other lines - a type's first line, headers,
+    repeated headers and text rows - run is_likely_header_row, once per distinct
+    content. With raw_bytes, lines are undecoded bytes split by split_raw_line and
+    fields are only decoded for those checks and a type's first line.
+    """
+    
+    def __init__(self, delimiter: str, msg_type_col: int, raw_bytes: bool = False):
+        self.delimiter = delimiter.encode() if raw_bytes else delimiter
+        self.msg_type_col = msg_type_col
+        self.raw_bytes = raw_bytes
+        self.message_types = {}  # Raw column value -> message type, or None if it is not one
+        self.records = {}  # Message type -> MessageTypeRecord
+    
+    def split(self, line: str) -> Optional[Tuple[str, List[str], List[str]]]:
+        """(message_type, prefix, message_specific) of a line, or None if it has no message type."""
+        parts = split_raw_line(line, self.delimiter) if self.raw_bytes else split_line(line, self.delimiter)
+        msg_type_col = self.msg_type_col
+        if len(parts) <= msg_type_col:
+            return None
+        
+        token = parts[msg_type_col]
+        try:
+            message_type = self.message_types[token]
+        except KeyError:
+            message_type = (token.decode('utf-8', errors='ignore') if self.raw_bytes else token).strip().upper()
+            if not is_message_type(message_type):
+                message_type = None
+            if len(self.message_types) < MESSAGE_TOKEN_CACHE_SIZE:
+                self.message_types[token] = message_type
+        if message_type is None:
+            return None
+        return message_type, parts[:msg_type_col], parts[msg_type_col+1:]
+    
+    def is_header(self, message_type: str, message_specific: List[str]) -> bool:
+        """is_likely_header_row(message_specific), from the fast checks where they decide it."""
+        record = self.records.get(message_type)
+        if record is None:
+            record = self.records[message_type] = MessageTypeRecord()
+        
+        needed = len(message_specific) - len(message_specific) // 2
+        n_fields = len(message_specific)
+        for i in record.numeric_fields:
+            if needed <= 0:
+                break
+            if i < n_fields:
+                try:
+                    float(message_specific[i])
+                    needed -= 1
+                except ValueError:
+                    pass
+        if needed <= 0:
+            return False
+        
+        key = tuple(message_specific)
+        is_header = record.decisions.get(key)
+        if is_header is None:
+            fields = decode_raw_fields(message_specific) if self.raw_bytes else message_specific
+            is_header = is_likely_header_row(fields)
+            if len(record.decisions) < HEADER_DECISIONS_PER_TYPE:
+                record.decisions[key] = is_header
+            if not is_header and not record.numeric_fields:
+                record.numeric_fields = numeric_positions(fields)
+        return is_header
+    
+    def classify(self, line: str,
+                 parse_filter: Optional[ParseFilter] = None) -> Optional[Tuple[str, List[str], List[str], bool]]:
+        """(message_type, prefix, message_specific, is_header) of a line, or None if it has no kept message type."""
+        split = self.split(line)
+        if split is None:
+            return None
+        message_type, prefix, message_specific = split
+        if parse_filter is not None and not parse_filter.keeps_name(message_type):
+            return None
+        # Header or data is decided BY LOOKING ONLY AT MESSAGE-SPECIFIC COLUMNS
+        return message_type, prefix, message_specific, self.is_header(message_type, message_specific)
+    
+    def first_line(self, prefix: List[str], message_specific: List[str],
+                   line: str) -> Tuple[List[str], List[str], str]:
+        """A type's first line as resolve_message_header takes it: decoded fields and line, without the terminator."""
+        if self.raw_bytes:
+            return (decode_raw_fields(prefix), decode_raw_fields(message_specific),
+                    line.decode('utf-8', errors='ignore').rstrip('\r'))
+        return prefix, message_specific, line.rstrip('\r')
+
+
+COLUMN_BLOCK_ROWS = 8192  # Rows a ColumnBuilder holds as strings; at least the 100 types are inferred from
+
+
+class ColumnBuilder:
+    """
+    Assembles a typed DataFrame column by column while its rows are tokenized.
+    
+    Rows are held as strings only until COLUMN_BLOCK_ROWS of them have arrived; the
+    block is then transposed into columns and each column converted to its type (see
+    convert_column), so the rest of the parse holds typed arrays instead of a Python
+    string and list per cell and row. Each row's line offset and length are kept too.
+    Schemas are (headers, column_types, column_formats); a schema may gain columns
+    between blocks, which earlier blocks fill with the values short rows get.
+    With raw_bytes the rows hold undecoded fields from split_raw_line: numeric
+    columns are parsed straight from the bytes (see convert_raw_numbers); the other
+    columns are still decoded, one block at a time.
+    """
+    
+    def __init__(self, rows: Optional[List[List[str]]] = None, line_index: Optional[Tuple[array, array]] = None,
+                 raw_bytes: bool = False):
+        self.rows = rows if rows is not None else []  # Tokenized rows not converted yet
+        self.raw_bytes = raw_bytes
+        self.blocks = []  # (n_rows, {column position: converted values}) per converted block
+        self.n_converted = 0
+        self.offsets, self.lengths = line_index if line_index is not None else (array('q'), array('i'))
+        self.failed = set()  # Column positions whose conversion failed (and was reported)
+        self.conversion_time = [0.0, 0.0, 0]  # Wall and CPU seconds and rows of block conversions not yet reported
+    
+    def __len__(self) -> int:
+        return self.n_converted + len(self.rows)
+    
+    def add(self, row: List[str], offset: int, length: int):
+        self.rows.append(row)
+        self.offsets.append(offset)
+        self.lengths.append(length)
+    
+    @property
+    def block_full(self) -> bool:
+        return len(self.rows) >= COLUMN_BLOCK_ROWS
+    
+    def convert_values(self, values: Sequence, col_idx: int, col_name: str, col_type: str,
+                       fmt: Optional[str]) -> pd.Series:
+        """convert_column, keeping the raw values (with a warning) if the column can't be converted."""
+        if self.raw_bytes:
+            if col_type in ('int', 'float'):
+                numeric = convert_raw_numbers(values, col_type)
+                if numeric is not None:
+                    return numeric
+            values = decode_raw_column(values)
+        values = pd.Series(values, dtype=object)
+        try:
+            return convert_column(values, col_type, fmt)
+        except (ValueError, TypeError, AttributeError) as e:
+            if col_idx not in self.failed:
+                self.failed.add(col_idx)
+                print(f"  Warning: Could not convert column '{col_name}' to {col_type}: {e}")
+            return values
+    
+    def convert_rows(self, schema: Tuple[List[str], Dict[str, str], Dict[str, str]],
+                     parse_filter: Optional[ParseFilter] = None):
+        """
+        Convert the pending rows, a block at a time, to the typed columns of schema that parse_filter keeps.
+        The time is only added up here; report_conversion hands it to the ParseReport at a stage boundary.
+        """
+        headers, column_types, column_formats = schema
+        columns = parse_filter.project(headers, column_types) if parse_filter is not None else None
+        rows, self.rows = self.rows, []
+        if not rows:
+            return
+        
+        start_wall, start_cpu = time.perf_counter(), time.thread_time()
+        for start in range(0, len(rows), COLUMN_BLOCK_ROWS):
+            block_rows = rows[start:start + COLUMN_BLOCK_ROWS]
+            n_rows = len(block_rows)
+            # Short rows are padded with None, values past the last header are dropped
+            raw_columns = list(zip_longest(*block_rows))
+            block = {}
+            for col_idx, col_name in enumerate(headers):
+                if columns is not None and col_name not in columns:
                     continue
+                values = raw_columns[col_idx] if col_idx < len(raw_columns) else [None] * n_rows
+                block[col_idx] = self.convert_values(values, col_idx, col_name,
+                                                     column_types.get(col_name, 'string'),
+                                                     column_formats.get(col_name))
+            self.blocks.append((n_rows, block))
+            self.n_converted += n_rows
+        self.conversion_time[0] += time.perf_counter() - start_wall
+        self.conversion_time[1] += time.thread_time() - start_cpu
+        self.conversion_time[2] += len(rows)
+    
+    def report_conversion(self, message_type: Optional[str] = None):
+        """
+        Record the block conversions since the last call as dtype_application, taken out of the
+        stage they ran in, which must still be the innermost one of the active report.
+        """
+        wall, cpu, n_rows = self.conversion_time
+        if n_rows:
+            report_time('dtype_application', wall, cpu, n_rows, message_type)
+            self.conversion_time = [0.0, 0.0, 0]
+    
+    def to_dataframe(self, schema: Tuple[List[str], Dict[str, str], Dict[str, str]], source_path: str,
+                     parse_filter: Optional[ParseFilter] = None, verbose: bool = True) -> pd.DataFrame:
+        """
+        Convert what is left and join the blocks (short rows padded) into the DataFrame, with the
+        line index columns that locate each row's original line in source_path.
+        """
+        self.convert_rows(schema, parse_filter)
+        self.report_conversion()
+        headers, column_types, column_formats = schema
+        columns = parse_filter.project(headers, column_types) if parse_filter is not None else None
+        
+        converted = {}
+        kept_headers = []
+        for col_idx, col_name in enumerate(headers):
+            if columns is not None and col_name not in columns:
+                continue
+            kept_headers.append(col_name)
+            col_type = column_types.get(col_name, 'string')
+            fmt = column_formats.get(col_name)
+            # Blocks converted before the column existed hold only rows too short for it
+            parts = [block.pop(col_idx) if col_idx in block
+                     else self.convert_values([None] * n_rows, col_idx, col_name, col_type, fmt)
+                     for n_rows, block in self.blocks]
+            if not parts:
+                parts = [self.convert_values([], col_idx, col_name, col_type, fmt)]
+            converted[col_idx] = join_column_blocks(parts)
+            if col_type == 'mmss_timestamp' and verbose:
+                print(f"  Converted '{col_name}' from MM:SS.s format to seconds")
+        self.blocks = []
+        
+        df = pd.DataFrame(converted, index=pd.RangeIndex(self.n_converted))
+        df.columns = kept_headers
+        return attach_line_index(df, self.offsets, self.lengths, source_path)
+
+
+class RowBuffer:
+    """Rows being parsed in a ColumnBuilder per output DataFrame name, counted across all of them."""
+    
+    def __init__(self, raw_bytes: bool = False):
+        self.builders = {}
+        self.total = 0
+        self.raw_bytes = raw_bytes  # Rows are undecoded fields, see ColumnBuilder
+    
+    def add(self, name: str, row: List[str], offset: int, length: int) -> ColumnBuilder:
+        """Add a row to its group's builder and return the builder."""
+        builder = self.builders.get(name)
+        if builder is None:
+            builder = self.builders[name] = ColumnBuilder(raw_bytes=self.raw_bytes)
+        builder.add(row, offset, length)
+        self.total += 1
+        return builder
+    
+    def drain(self) -> Iterator[Tuple[str, ColumnBuilder]]:
+        """Hand out and forget every group, in order of first appearance."""
+        builders = self.builders
+        self.builders = {}
+        self.total = 0
+        yield from builders.items()
+
+
+def collect_chunks(chunks: Iterator[Tuple[str, pd.DataFrame]]) -> Dict[str, pd.DataFrame]:
+    """Concatenate the (name, chunk) batches of a streaming parse into one DataFrame per name."""
+    chunk_lists = defaultdict(list)
+    for name, chunk in chunks:
+        chunk_lists[name].append(chunk)
+    return {name: concat_frames(frames) for name, frames in chunk_lists.items()}
+
+
+class FrozenSchema:
+    """
+    Layout decisions of a parse, kept so more lines of the same file parse the same way.
+    
+    message_headers/raw_headers: interleaved types' column names (and raw header
+    line) from their first line; schemas: (headers, column_types, column_formats)
+    per message type, or per column count for mixed logs; layout: the
+    prepare_standard_format result of a standard log. The parsers fill these in
+    as they go and reuse whatever is already there.
+    """
+    
+    def __init__(self):
+        self.message_headers = {}
+        self.raw_headers = {}
+        self.schemas = {}
+        self.layout = None
+    
+    def to_json(self) -> Dict:
+        """JSON-compatible form (schema keys may be column counts, so schemas become pairs)."""
+        return {'message_headers': self.message_headers, 'raw_headers': self.raw_headers,
+                'schemas': [[name, list(schema)] for name, schema in self.schemas.items()],
+                'layout': list(self.layout) if self.layout is not None else None}
+    
+    @classmethod
+    def from_json(cls, data: Dict) -> 'FrozenSchema':
+        frozen = cls()
+        frozen.message_headers = data['message_headers']
+        frozen.raw_headers = data['raw_headers']
+        frozen.schemas = {name: tuple(schema) for name, schema in data['schemas']}
+        frozen.layout = tuple(data['layout']) if data['layout'] is not None else None
+        return frozen
+
+
+def parse_interleaved_range(file_path: str, start: int, end: int, delimiter: str, msg_type_col: int,
+                            reader: Optional[LogFileReader] = None,
+                            parse_filter: Optional[ParseFilter] = None,
+                            raw_bytes: bool = False) -> Tuple[Dict[str, Tuple], Dict[str, List], Dict[str, List]]:
+    """
+    Split the interleaved-format lines in one byte range into per-message-type buckets.
+    
+    Header-like rows are never data, so a range can be parsed without knowing what
+    earlier ranges saw. Returns (first_seen, message_data, message_line_index) where
+    first_seen maps each message type, in order of appearance, to
+    (is_header, prefix, message_specific, original_line) for its first line, and
+    message_line_index holds (offsets, lengths) arrays of each data row's line.
+    Message types and rows outside parse_filter are dropped here. With raw_bytes the
+    data rows are undecoded fields (see split_raw_line).
+    """
+    first_seen = {}
+    message_data = defaultdict(list)
+    message_line_index = defaultdict(lambda: (array('q'), array('i')))
+    classifier = InterleavedLineClassifier(delimiter, msg_type_col, raw_bytes)
+    
+    try:
+        with open_log_reader(file_path, reader) as log_reader:
+            lines = (log_reader.iter_indexed_raw_lines(start, end) if raw_bytes
+                     else log_reader.iter_indexed_lines(start, end))
+            for offset, length, raw_line in lines:
+                classified = classifier.classify(raw_line, parse_filter)
+                if classified is None:
+                    continue
+                message_type, prefix, message_specific, is_header = classified
+                if message_type not in first_seen:
+                    first_seen[message_type] = (is_header,) + classifier.first_line(prefix, message_specific, raw_line)
                 
-                original_line = line.rstrip('\n\r')
-                line = line.strip()
-                if not line:
+                if not is_header:
+                    # Data row - reconstruct full row with prefix
+                    row = prefix + message_specific
+                    if parse_filter is not None and not parse_filter.keeps_row(row):
+                        continue
+                    message_data[message_type].append(row)
+                    offsets, lengths = message_line_index[message_type]
+                    offsets.append(offset)
+                    lengths.append(length)
+    except Exception as e:
+        raise RuntimeError(f"Critical parsing error in bytes {start}-{end}: {e}")
+    
+    return first_seen, dict(message_data), dict(message_line_index)
+
+
+def resolve_message_header(message_type: str, is_header: bool, prefix: List[str], message_specific: List[str],
+                           original_line: str) -> Tuple[List[str], Optional[str]]:
+    """Column names for a message type from its first line, plus the raw header line if it was one."""
+    if is_header:
+        # Generate names for prefix columns, use actual names for message-specific
+        prefix_names = generate_column_names(len(prefix), [prefix])
+        print(f"  Header for '{message_type}': {message_specific}")
+        # Keep the raw header line for later reference
+        return prefix_names + message_specific, original_line
+    
+    # First row is data, generate column names for all
+    full_row = prefix + message_specific
+    print(f"  '{message_type}': No header, generated {len(full_row)} column names")
+    return generate_column_names(len(full_row), [full_row]), None
+
+
+def fit_headers(headers: List[str], max_cols: int) -> List[str]:
+    """Extend or trim a message type's headers to the widest row seen."""
+    if len(headers) < max_cols:
+        return headers + [f'column_{i}' for i in range(len(headers), max_cols)]
+    return headers[:max_cols]
+
+
+def infer_message_schema(headers: List[str], data_rows: List[List[str]],
+                         max_cols: Optional[int] = None) -> Tuple[List[str], Dict[str, str], Dict[str, str]]:
+    """
+    Fix a message type's (headers, column_types, column_formats) from its first data rows.
+    max_cols is the widest row of the type, if data_rows are only some of them.
+    """
+    # Ensure consistent column count
+    headers = fit_headers(headers, max_cols or max(len(row) for row in data_rows))
+    
+    # Infer types (short rows count as nulls, as in the converted frame)
+    type_sample = [row + [''] * (len(headers) - len(row)) for row in data_rows[:100]]
+    column_types = infer_column_types_from_data(type_sample, headers)
+    column_formats = infer_datetime_formats(type_sample, headers, column_types)
+    return headers, column_types, column_formats
+
+
+def build_message_chunk(schema: Tuple[List[str], Dict[str, str], Dict[str, str]], builder: ColumnBuilder,
+                        source_path: str, raw_header: Optional[str], timestamp_offset: timedelta,
+                        verbose: bool = True, parse_filter: Optional[ParseFilter] = None) -> pd.DataFrame:
+    """Build the typed DataFrame for (a batch of) one message type's rows collected by builder, with a known schema."""
+    df = builder.to_dataframe(schema, source_path, parse_filter, verbose=verbose)
+    
+    # Store raw header line if it exists (for context menu display)
+    if raw_header is not None:
+        df.attrs['__parser_raw_header__'] = raw_header
+    
+    # Apply timestamp offset
+    return apply_timestamp_offset(df, timestamp_offset)
+
+
+def build_message_dataframe(headers: List[str], data_rows: List[List[str]], line_index: Tuple[array, array],
+                            source_path: str, raw_header: Optional[str], timestamp_offset: timedelta,
+                            verbose: bool = True, parse_filter: Optional[ParseFilter] = None) -> pd.DataFrame:
+    """Build the typed DataFrame for one message type from all of its data rows."""
+    return build_message_chunk(infer_message_schema(headers, data_rows), ColumnBuilder(data_rows, line_index),
+                               source_path, raw_header, timestamp_offset, verbose, parse_filter)
+
+
+def iter_interleaved_chunks(file_path: str, delimiter: str, msg_type_col: int, timestamp_offset: timedelta,
+                            reader: Optional[LogFileReader] = None, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                            parse_filter: Optional[ParseFilter] = None,
+                            progress: Optional[ParseProgress] = None, start: int = 0,
+                            frozen: Optional[FrozenSchema] = None,
+                            end: Optional[int] = None, raw_bytes: bool = False) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """
+    Yield (message_type, chunk) batches of an interleaved log, holding at most chunk_rows rows.
+    
+    Each type's schema is fixed by its first batch; later rows wider than any seen
+    before add (string) columns instead of being cut. Message types and rows outside
+    parse_filter are dropped before they are buffered. Only bytes start to end are
+    read; headers and schemas already in frozen are reused and new ones are added to it.
+    With raw_bytes, lines are tokenized without decoding them (see ColumnBuilder).
+    """
+    frozen = frozen if frozen is not None else FrozenSchema()
+    message_headers = frozen.message_headers
+    message_raw_headers = frozen.raw_headers
+    schemas = frozen.schemas
+    new_schemas = set()  # Types whose schema was inferred since their last chunk
+    buffer = RowBuffer(raw_bytes)
+    
+    def resolve_schema(msg_type: str, rows: List[List[str]]) -> Tuple:
+        """The type's schema, inferred from its first rows or widened for longer ones."""
+        schema = schemas.get(msg_type)
+        if schema is None:
+            with report_stage('type_inference', msg_type):
+                # Types are inferred from the first 100 rows, as text
+                sample = decode_raw_rows(rows[:100]) if raw_bytes else rows
+                schema = infer_message_schema(message_headers[msg_type], sample, max(len(row) for row in rows))
+            new_schemas.add(msg_type)
+        elif rows:
+            widest = max(len(row) for row in rows)
+            if widest > len(schema[0]):
+                schema = (fit_headers(message_headers[msg_type], widest),) + schema[1:]
+        schemas[msg_type] = schema
+        return schema
+    
+    def build_buffered_chunks():
+        for msg_type, builder in buffer.drain():
+            schema = resolve_schema(msg_type, builder.rows)
+            builder.report_conversion(msg_type)
+            with report_stage('conversion', msg_type) as stats:
+                stats.count(len(builder), sum(builder.lengths))
+                chunk = build_message_chunk(schema, builder, file_path, message_raw_headers.get(msg_type),
+                                            timestamp_offset, verbose=msg_type in new_schemas,
+                                            parse_filter=parse_filter)
+            new_schemas.discard(msg_type)
+            yield msg_type, chunk
+    
+    known_types = set(message_headers)  # Reported by the parse that froze them
+    classifier = InterleavedLineClassifier(delimiter, msg_type_col, raw_bytes)
+    line_num = 0
+    n_rows = 0
+    try:
+        with open_log_reader(file_path, reader) as log_reader:
+            lines = (log_reader.iter_indexed_raw_lines(start, end) if raw_bytes
+                     else log_reader.iter_indexed_lines(start, end))
+            for line_num, (offset, length, raw_line) in enumerate(lines, 1):
+                if progress is not None and line_num % PROGRESS_REPORT_LINES == 0:
+                    progress.advance(offset, line_num)
+                classified = classifier.classify(raw_line, parse_filter)
+                if classified is None:
+                    continue
+                message_type, prefix, message_specific, is_header = classified
+                if message_type not in message_headers:
+                    # The first line of a type decides its header
+                    headers, raw_header = resolve_message_header(message_type, is_header,
+                                                                 *classifier.first_line(prefix, message_specific,
+                                                                                        raw_line))
+                    message_headers[message_type] = headers
+                    if raw_header is not None:
+                        message_raw_headers[message_type] = raw_header
+                
+                if not is_header:
+                    # Data row - reconstruct full row with prefix
+                    row = prefix + message_specific
+                    if parse_filter is not None and not parse_filter.keeps_row(row):
+                        continue
+                    builder = buffer.add(message_type, row, offset, length)
+                    n_rows += 1
+                    if builder.block_full:
+                        builder.convert_rows(resolve_schema(message_type, builder.rows), parse_filter)
+                    if buffer.total >= chunk_rows:
+                        yield from build_buffered_chunks()
+            
+            report_count('tokenizing', line_num, skipped_lines=line_num - n_rows)
+            yield from build_buffered_chunks()
+    except ParseCancelled:
+        raise
+    except Exception as e:
+        raise RuntimeError(f"Critical parsing error at line {line_num}: {e}")
+    
+    for msg_type in message_headers:
+        if msg_type not in schemas and msg_type not in known_types:
+            print(f"  Warning: No data found for '{msg_type}' (only header)")
+
+
+def parse_interleaved_ranges(file_path: str, ranges: List[Tuple[int, int]], delimiter: str, msg_type_col: int,
+                             timestamp_offset: timedelta, workers: int,
+                             parse_filter: Optional[ParseFilter] = None,
+                             progress: Optional[ParseProgress] = None,
+                             frozen: Optional[FrozenSchema] = None,
+                             raw_bytes: bool = False) -> Dict[str, pd.DataFrame]:
+    """
+    Bucket byte ranges by message type in separate processes, merge the buckets
+    per type in file order and build each type's DataFrame concurrently.
+    The headers and schemas decided on the way are recorded in frozen.
+    """
+    frozen = frozen if frozen is not None else FrozenSchema()
+    message_headers = frozen.message_headers
+    message_raw_headers = frozen.raw_headers  # Store raw header lines
+    
+    print(f"  Parsing {len(ranges)} byte ranges with {workers} worker processes...")
+    with worker_pool(workers) as executor:
+        futures = [executor.submit(run_in_worker, parse_interleaved_range, file_path, start, end, delimiter,
+                                   msg_type_col, parse_filter=parse_filter, raw_bytes=raw_bytes)
+                   for start, end in ranges]
+        range_results = wait_for_ranges(futures, ranges, progress)
+        if progress is not None:
+            progress.stage("Building DataFrames")
+        
+        # The first range that contains a message type decides its header
+        for first_seen, _, _ in range_results:
+            for message_type, first_line in first_seen.items():
+                if message_type in message_headers:
+                    continue
+                headers, raw_header = resolve_message_header(message_type, *first_line)
+                message_headers[message_type] = headers
+                if raw_header is not None:
+                    message_raw_headers[message_type] = raw_header
+        
+        # Merge buckets per type in file order and build DataFrames
+        built = {}
+        for msg_type, headers in message_headers.items():
+            data_rows = [row for _, data, _ in range_results for row in data.get(msg_type, [])]
+            if not data_rows:
+                print(f"  Warning: No data found for '{msg_type}' (only header)")
+                continue
+            line_index = (array('q'), array('i'))
+            for _, _, range_index in range_results:
+                if msg_type in range_index:
+                    line_index[0].extend(range_index[msg_type][0])
+                    line_index[1].extend(range_index[msg_type][1])
+            report_count('tokenizing', len(data_rows))
+            with report_stage('type_inference', msg_type):
+                sample = decode_raw_rows(data_rows[:100]) if raw_bytes else data_rows
+                schema = infer_message_schema(headers, sample, max(len(row) for row in data_rows))
+                frozen.schemas[msg_type] = schema
+            built[msg_type] = executor.submit(run_in_worker, build_message_chunk, schema,
+                                              ColumnBuilder(data_rows, line_index, raw_bytes), file_path,
+                                              message_raw_headers.get(msg_type), timestamp_offset, False,
+                                              parse_filter)
+        
+        dataframes = {}
+        for msg_type, future in built.items():
+            # Frames are converted in the worker processes, so only the wait is timed
+            with report_stage('conversion', msg_type) as stats:
+                wait_for_future(future, progress)
+                dataframes[msg_type] = worker_result(future)
+                stats.count(len(dataframes[msg_type]))
+        return dataframes
+
+
+def parse_interleaved_format(file_path: str, delimiter: str, msg_type_col: int, timestamp_offset: timedelta,
+                             reader: Optional[LogFileReader] = None, workers: int = 1,
+                             parse_filter: Optional[ParseFilter] = None, lazy: bool = False,
+                             progress: Optional[ParseProgress] = None,
+                             frozen: Optional[FrozenSchema] = None,
+                             raw_bytes: bool = False) -> Dict[str, pd.DataFrame]:
+    """
+    Parse interleaved format with message types.
+    
+    With workers > 1, byte ranges are bucketed by message type in separate
+    processes (see parse_interleaved_ranges); otherwise the frames are assembled
+    from the bounded batches of iter_interleaved_chunks. With lazy, only the line
+    index is built and each frame is built on first access (see LazyDataFrames).
+    The headers and schemas used are recorded in frozen. raw_bytes tokenizes
+    without decoding the lines (see ColumnBuilder).
+    """
+    if lazy:
+        return index_interleaved_format(file_path, delimiter, msg_type_col, timestamp_offset,
+                                        reader=reader, parse_filter=parse_filter, progress=progress,
+                                        frozen=frozen, raw_bytes=raw_bytes)
+    
+    print("\nParsing interleaved format...")
+    
+    with open_log_reader(file_path, reader) as log_reader:
+        ranges = log_reader.split_ranges(0, workers * RANGES_PER_WORKER) if workers > 1 else []
+        if len(ranges) > 1:
+            dataframes = parse_interleaved_ranges(file_path, ranges, delimiter, msg_type_col,
+                                                  timestamp_offset, workers, parse_filter, progress, frozen,
+                                                  raw_bytes)
+        else:
+            dataframes = collect_chunks(iter_interleaved_chunks(file_path, delimiter, msg_type_col,
+                                                                timestamp_offset, reader=log_reader,
+                                                                parse_filter=parse_filter, progress=progress,
+                                                                frozen=frozen, raw_bytes=raw_bytes))
+    
+    for msg_type, df in dataframes.items():
+        print(f"  Created DataFrame for '{msg_type}': {len(df)} rows × {len(df.columns)} columns")
+    
+    return dataframes
+
+
+class LazyDataFrames(Mapping):
+    """
+    Message-type DataFrames of an interleaved log, built on first access.
+    
+    Holds only what index_interleaved_format recorded: each type's schema, raw
+    header line and the byte offsets/lengths of its data lines (NumPy arrays).
+    Looking a type up re-reads just those lines and builds the same frame a full
+    parse would; the frame is then kept. Schemas and row counts are available
+    without building anything. With raw_bytes the lines are re-read undecoded
+    (see ColumnBuilder).
+    """
+    
+    def __init__(self, file_path: str, delimiter: str, msg_type_col: int, timestamp_offset: timedelta,
+                 message_index: Dict[str, Tuple], parse_filter: Optional[ParseFilter] = None,
+                 raw_bytes: bool = False):
+        self.file_path = file_path
+        self.delimiter = delimiter
+        self.msg_type_col = msg_type_col
+        self.timestamp_offset = timestamp_offset
+        self.message_index = message_index  # msg_type -> (schema, raw_header, offsets, lengths)
+        self.parse_filter = parse_filter
+        self.raw_bytes = raw_bytes
+        self.compact = False  # Store built frames in the smallest lossless dtypes (see compact_dataframe)
+        self.frames = {}
+        stat = os.stat(file_path)
+        self.file_signature = (stat.st_size, stat.st_mtime_ns)
+    
+    def __getitem__(self, msg_type: str) -> pd.DataFrame:
+        if msg_type not in self.frames:
+            if msg_type not in self.message_index:
+                raise KeyError(msg_type)
+            self.frames[msg_type] = self.build(msg_type)
+        return self.frames[msg_type]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.message_index)
+    
+    def __len__(self) -> int:
+        return len(self.message_index)
+    
+    def __contains__(self, msg_type) -> bool:
+        # Mapping's default would build the frame to answer
+        return msg_type in self.message_index
+    
+    def is_built(self, msg_type: str) -> bool:
+        return msg_type in self.frames
+    
+    def row_count(self, msg_type: str) -> int:
+        return len(self.message_index[msg_type][2])
+    
+    def column_types(self, msg_type: str) -> Dict[str, str]:
+        """Inferred type of each column, in column order (as infer_column_types_from_data names them)."""
+        headers, column_types, _ = self.message_index[msg_type][0]
+        if self.parse_filter is not None:
+            columns = self.parse_filter.project(headers, column_types)
+            if columns is not None:
+                headers = [name for name in headers if name in columns]
+        return {name: column_types.get(name, 'string') for name in headers}
+    
+    def build(self, msg_type: str) -> pd.DataFrame:
+        """Re-read one message type's data lines and build its typed DataFrame."""
+        stat = os.stat(self.file_path)
+        if (stat.st_size, stat.st_mtime_ns) != self.file_signature:
+            raise RuntimeError(f"{os.path.basename(self.file_path)} changed since it was indexed, reload the file")
+        
+        schema, raw_header, offsets, lengths = self.message_index[msg_type]
+        builder = ColumnBuilder(line_index=(offsets, lengths), raw_bytes=self.raw_bytes)
+        classifier = InterleavedLineClassifier(self.delimiter, self.msg_type_col, self.raw_bytes)
+        with report_stage('tokenizing', msg_type) as stats, open_log_reader(self.file_path) as reader:
+            stats.count(len(offsets), int(lengths.sum()))
+            read_line = reader.read_raw_line if self.raw_bytes else reader.read_line
+            for offset, length in zip(offsets.tolist(), lengths.tolist()):
+                _, prefix, message_specific = classifier.split(read_line(offset, length))
+                builder.rows.append(prefix + message_specific)
+                if builder.block_full:
+                    builder.convert_rows(schema, self.parse_filter)
+            builder.report_conversion()
+        
+        with report_stage('conversion', msg_type) as stats:
+            stats.count(len(builder), int(lengths.sum()))
+            df = build_message_chunk(schema, builder, self.file_path, raw_header,
+                                     self.timestamp_offset, verbose=False, parse_filter=self.parse_filter)
+        if self.compact:
+            df = compact_dataframe(df)
+        print(f"  Built DataFrame for '{msg_type}': {len(df)} rows × {len(df.columns)} columns")
+        return df
+
+
+def index_interleaved_format(file_path: str, delimiter: str, msg_type_col: int, timestamp_offset: timedelta,
+                             reader: Optional[LogFileReader] = None,
+                             parse_filter: Optional[ParseFilter] = None,
+                             progress: Optional[ParseProgress] = None, start: int = 0,
+                             frozen: Optional[FrozenSchema] = None, raw_bytes: bool = False) -> LazyDataFrames:
+    """
+    First pass over an interleaved log that records, per message type, only its
+    header, schema and the line offsets of its data rows; see LazyDataFrames.
+    Indexing begins at byte start; types with a schema in frozen keep it (widened
+    if longer rows turn up) and the schemas of new types are added to it.
+    raw_bytes tokenizes without decoding the lines, here and when frames are built.
+    """
+    print("\nIndexing interleaved format...")
+    
+    frozen = frozen if frozen is not None else FrozenSchema()
+    message_headers = frozen.message_headers
+    message_raw_headers = frozen.raw_headers
+    known_types = set(message_headers)  # Reported by the parse that froze them
+    message_samples = defaultdict(list)  # First data rows of each type, for type inference
+    message_widths = defaultdict(int)
+    message_line_index = defaultdict(lambda: (array('q'), array('i')))
+    classifier = InterleavedLineClassifier(delimiter, msg_type_col, raw_bytes)
+    
+    line_num = 0
+    n_rows = 0
+    try:
+        with open_log_reader(file_path, reader) as log_reader:
+            lines = (log_reader.iter_indexed_raw_lines(start) if raw_bytes
+                     else log_reader.iter_indexed_lines(start))
+            for line_num, (offset, length, raw_line) in enumerate(lines, 1):
+                if progress is not None and line_num % PROGRESS_REPORT_LINES == 0:
+                    progress.advance(offset, line_num)
+                classified = classifier.classify(raw_line, parse_filter)
+                if classified is None:
                     continue
+                message_type, prefix, message_specific, is_header = classified
+                if message_type not in message_headers:
+                    # The first line of a type decides its header
+                    headers, raw_header = resolve_message_header(message_type, is_header,
+                                                                 *classifier.first_line(prefix, message_specific,
+                                                                                        raw_line))
+                    message_headers[message_type] = headers
+                    if raw_header is not None:
+                        message_raw_headers[message_type] = raw_header
                 
-                parts = [p.strip() for p in line.split(delimiter)]
-                while parts and not parts[-1]:
-                    parts.pop()
-                if parts:
-                    all_data.append(parts)
-                    all_raw_data.append(original_line)
+                if not is_header:
+                    row = prefix + message_specific
+                    if parse_filter is not None and not parse_filter.keeps_row(row):
+                        continue
+                    if len(message_samples[message_type]) < 100:
+                        message_samples[message_type].append(row)
+                    message_widths[message_type] = max(message_widths[message_type], len(row))
+                    offsets, lengths = message_line_index[message_type]
+                    offsets.append(offset)
+                    lengths.append(length)
+                    n_rows += 1
+    except ParseCancelled:
+        raise
     except Exception as e:
         raise RuntimeError(f"Critical parsing error at line {line_num}: {e}")
+    report_count('tokenizing', line_num, skipped_lines=line_num - n_rows)
     
-    # Infer types
-    column_types = infer_column_types_from_data(all_data, headers)
+    message_index = {}
+    for msg_type, headers in message_headers.items():
+        if msg_type not in message_line_index:
+            if msg_type not in known_types:
+                print(f"  Warning: No data found for '{msg_type}' (only header)")
+            continue
+        
+        schema = frozen.schemas.get(msg_type)
+        if schema is None:
+            # Same schema a full parse infers: widest row overall, types from the first rows
+            with report_stage('type_inference', msg_type):
+                sample = message_samples[msg_type]
+                sample = decode_raw_rows(sample) if raw_bytes else sample
+                schema = infer_message_schema(headers, sample, message_widths[msg_type])
+        elif message_widths[msg_type] > len(schema[0]):
+            schema = (fit_headers(headers, message_widths[msg_type]),) + schema[1:]
+        frozen.schemas[msg_type] = schema
+        offsets, lengths = message_line_index[msg_type]
+        message_index[msg_type] = (schema, message_raw_headers.get(msg_type),
+                                   np.frombuffer(offsets, dtype=np.int64), np.frombuffer(lengths, dtype=np.int32))
+        print(f"  Indexed '{msg_type}': {len(offsets)} rows")
     
-    # Convert data
-    converted_data = []
-    for row in all_data:
-        converted_data.append(convert_row_values(row, column_types, headers))
+    return LazyDataFrames(file_path, delimiter, msg_type_col, timestamp_offset, message_index, parse_filter,
+                          raw_bytes)
+
+
+def parse_standard_range(file_path: str, start: int, end: int, delimiter: str, headers: List[str],
+                         column_types: Dict[str, str], column_formats: Optional[Dict[str, str]] = None,
+                         reader: Optional[LogFileReader] = None, verbose: bool = True,
+                         parse_filter: Optional[ParseFilter] = None, raw_bytes: bool = False) -> pd.DataFrame:
+    """Tokenize and type-convert the standard-format lines in one byte range of the file (undecoded with raw_bytes)."""
+    schema = (headers, column_types, column_formats or {})
+    builder = ColumnBuilder(raw_bytes=raw_bytes)
     
-    # Create DataFrame with explicit column names
-    df = pd.DataFrame(converted_data, columns=headers)
+    try:
+        with open_log_reader(file_path, reader) as log_reader:
+            lines = (log_reader.iter_indexed_raw_lines(start, end) if raw_bytes
+                     else log_reader.iter_indexed_lines(start, end))
+            split, line_delimiter = (split_raw_line, delimiter.encode()) if raw_bytes else (split_line, delimiter)
+            for offset, length, line in lines:
+                parts = split(line, line_delimiter)
+                if parts and (parse_filter is None or parse_filter.keeps_row(parts)):
+                    builder.add(parts, offset, length)
+                    if builder.block_full:
+                        builder.convert_rows(schema, parse_filter)
+    except Exception as e:
+        raise RuntimeError(f"Critical parsing error in bytes {start}-{end}: {e}")
     
-    # Add raw data column
-    raw_col_name = '__parser_raw_line__'
-    if len(all_raw_data) == len(df):
-        df[raw_col_name] = all_raw_data
+    return builder.to_dataframe(schema, file_path, parse_filter, verbose=verbose)
+
+
+def prepare_standard_format(sample: List[List[str]], reader: LogFileReader) -> Tuple:
+    """
+    Decide the layout of a standard CSV/TSV log from its sample:
+    (headers, column_types, column_formats, data_start, raw_header_line).
+    """
+    # Check if first row is header
+    first_row = sample[0]
+    if is_likely_header_row(first_row):
+        print("  Detected header row")
+        headers = first_row
+        data_sample = sample[1:]
+        # Get the raw header line and skip it
+        raw_header_line = reader.header_line()
+        data_start = reader.offset_after_lines(1)
+    else:
+        print("  No header detected, generating column names...")
+        headers = generate_column_names(len(first_row), sample)
+        data_sample = sample
+        raw_header_line = None
+        data_start = 0
     
+    # Infer types and datetime formats once from the sample so every range converts identically
+    with report_stage('type_inference', 'DATA'):
+        column_types = infer_column_types_from_data(data_sample, headers)
+        column_formats = infer_datetime_formats(data_sample, headers, column_types)
+    return headers, column_types, column_formats, data_start, raw_header_line
+
+
+def finish_standard_frame(df: pd.DataFrame, raw_header_line: Optional[str], timestamp_offset: timedelta,
+                          verbose: bool = True) -> pd.DataFrame:
+    """Attach the raw header, apply the timestamp offset and rename the time column of a standard-format frame."""
     # Store raw header line if it exists
     if raw_header_line:
         df.attrs['__parser_raw_header__'] = raw_header_line
     
-    # Apply types
-    for col_name, col_type in column_types.items():
-        if col_name in df.columns:
-            try:
-                if col_type == 'datetime':
-                    df[col_name] = pd.to_datetime(df[col_name], errors='coerce')
-                elif col_type == 'mmss_timestamp':
-                    # Convert to float (seconds) for plotting
-                    df[col_name] = pd.to_numeric(df[col_name], errors='coerce')
-                    print(f"  Converted '{col_name}' from MM:SS.s format to seconds")
-                elif col_type == 'int':
-                    df[col_name] = pd.to_numeric(df[col_name], errors='coerce').astype('Int64')
-                elif col_type == 'float':
-                    df[col_name] = pd.to_numeric(df[col_name], errors='coerce')
-                elif col_type == 'bool':
-                    df[col_name] = df[col_name].astype('bool')
-            except (ValueError, TypeError, AttributeError) as e:
-                print(f"  Warning: Could not convert column '{col_name}' to {col_type}: {e}")
-    
     df = apply_timestamp_offset(df, timestamp_offset)
     
-    # Normalize timestamp column name: recognize various time-related names and rename to 'timestamp'
-    # This helps the plotter work consistently
-    if 'timestamp' not in df.columns:
-        # Try exact matches first
-        exact_matches = ['time', 'Time', 'TIME', 'datetime', 'DateTime', 'DATETIME']
-        for col in exact_matches:
-            if col in df.columns:
-                df.rename(columns={col: 'timestamp'}, inplace=True)
-                print(f"  Renamed '{col}' column to 'timestamp' for consistency")
-                break
+    # Normalize timestamp column name so the plotter works consistently
+    with report_stage('timestamp_renaming'):
+        numeric_columns = {col for col in df.columns if pd.api.types.is_numeric_dtype(df[col])}
+        time_col = find_timestamp_column(list(df.columns), numeric_columns)
+        if time_col is not None:
+            df.rename(columns={time_col: 'timestamp'}, inplace=True)
+            if verbose:
+                print(f"  Renamed '{time_col}' column to 'timestamp' for consistency")
+    
+    return df
+
+
+def build_standard_chunk(builder: ColumnBuilder, layout: Tuple, source_path: str, timestamp_offset: timedelta,
+                         verbose: bool = True, parse_filter: Optional[ParseFilter] = None) -> pd.DataFrame:
+    """Build the typed frame for a batch of standard-format rows collected by builder (see prepare_standard_format)."""
+    headers, column_types, column_formats, _, raw_header_line = layout
+    builder.report_conversion('DATA')
+    with report_stage('conversion', 'DATA') as stats:
+        stats.count(len(builder), sum(builder.lengths))
+        df = builder.to_dataframe((headers, column_types, column_formats), source_path, parse_filter,
+                                  verbose=verbose)
+        return finish_standard_frame(df, raw_header_line, timestamp_offset, verbose=verbose)
+
+
+def iter_standard_chunks(file_path: str, delimiter: str, layout: Tuple, timestamp_offset: timedelta,
+                         reader: Optional[LogFileReader] = None, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                         parse_filter: Optional[ParseFilter] = None,
+                         progress: Optional[ParseProgress] = None,
+                         start: Optional[int] = None, end: Optional[int] = None,
+                         raw_bytes: bool = False) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """
+    Yield ('DATA', chunk) batches of at most chunk_rows rows of a standard log laid out by
+    prepare_standard_format, from byte start (default: the first data line) to end.
+    With raw_bytes, lines are tokenized without decoding them (see ColumnBuilder).
+    """
+    if parse_filter is not None and not parse_filter.keeps_name('DATA'):
+        return
+    
+    headers, column_types, column_formats, data_start, _ = layout
+    schema = (headers, column_types, column_formats)
+    from_start = start is None
+    if from_start:
+        start = data_start
+    builder = ColumnBuilder(raw_bytes=raw_bytes)
+    n_chunks = 0
+    n_rows = 0
+    
+    line_num = 0
+    try:
+        with open_log_reader(file_path, reader) as log_reader:
+            lines = (log_reader.iter_indexed_raw_lines(start, end) if raw_bytes
+                     else log_reader.iter_indexed_lines(start, end))
+            split, line_delimiter = (split_raw_line, delimiter.encode()) if raw_bytes else (split_line, delimiter)
+            for line_num, (offset, length, line) in enumerate(lines, 1):
+                if progress is not None and line_num % PROGRESS_REPORT_LINES == 0:
+                    progress.advance(offset, line_num)
+                parts = split(line, line_delimiter)
+                if not parts or (parse_filter is not None and not parse_filter.keeps_row(parts)):
+                    continue
+                builder.add(parts, offset, length)
+                n_rows += 1
+                if builder.block_full:
+                    builder.convert_rows(schema, parse_filter)
+                
+                if len(builder) >= chunk_rows:
+                    yield 'DATA', build_standard_chunk(builder, layout, file_path, timestamp_offset,
+                                                       verbose=n_chunks == 0 and from_start,
+                                                       parse_filter=parse_filter)
+                    builder = ColumnBuilder(raw_bytes=raw_bytes)
+                    n_chunks += 1
+            
+            report_count('tokenizing', line_num, skipped_lines=line_num - n_rows)
+            # The remaining rows; a header-only file still gives one (empty) frame
+            if len(builder) or (n_chunks == 0 and from_start):
+                yield 'DATA', build_standard_chunk(builder, layout, file_path, timestamp_offset,
+                                                   verbose=n_chunks == 0 and from_start,
+                                                   parse_filter=parse_filter)
+    except ParseCancelled:
+        raise
+    except Exception as e:
+        raise RuntimeError(f"Critical parsing error at line {line_num}: {e}")
+
+
+def parse_standard_format(file_path: str, delimiter: str, sample: List[List[str]], timestamp_offset: timedelta,
+                          reader: Optional[LogFileReader] = None, workers: int = 1,
+                          parse_filter: Optional[ParseFilter] = None,
+                          progress: Optional[ParseProgress] = None,
+                          frozen: Optional[FrozenSchema] = None,
+                          raw_bytes: bool = False) -> Dict[str, pd.DataFrame]:
+    """
+    Parse standard CSV/TSV format.
+    
+    With workers > 1 the file is split into newline-aligned byte ranges that are
+    parsed in separate processes and concatenated in file order; otherwise the
+    frame is assembled from the bounded batches of iter_standard_chunks.
+    The layout used is recorded in frozen. raw_bytes tokenizes without decoding the lines.
+    """
+    print("\nParsing standard CSV/TSV format...")
+    if parse_filter is not None and not parse_filter.keeps_name('DATA'):
+        return {}
+    
+    with open_log_reader(file_path, reader) as log_reader:
+        layout = prepare_standard_format(sample, log_reader)
+        if frozen is not None:
+            frozen.layout = layout
+        headers, column_types, column_formats, data_start, raw_header_line = layout
         
-        # If no exact match, try partial matches (case-insensitive)
-        if 'timestamp' not in df.columns:
-            time_patterns = ['time_sec', 'time_s', 'elapsed', 'duration', 'timestamp']
-            for col in df.columns:
-                col_lower = col.lower()
-                # Check if column name contains time-related patterns
-                if any(pattern in col_lower for pattern in time_patterns):
-                    # Also check if it's numeric (likely to be elapsed seconds)
-                    if pd.api.types.is_numeric_dtype(df[col]):
-                        df.rename(columns={col: 'timestamp'}, inplace=True)
-                        print(f"  Renamed '{col}' column to 'timestamp' for consistency")
-                        break
+        ranges = log_reader.split_ranges(data_start, workers * RANGES_PER_WORKER) if workers > 1 else []
+        if len(ranges) > 1:
+            print(f"  Parsing {len(ranges)} byte ranges with {workers} worker processes...")
+            with worker_pool(workers) as executor:
+                futures = [executor.submit(run_in_worker, parse_standard_range, file_path, start, end, delimiter,
+                                           headers, column_types, column_formats, None, False, parse_filter,
+                                           raw_bytes)
+                           for start, end in ranges]
+                frames = wait_for_ranges(futures, ranges, progress)
+            for col_name, col_type in column_types.items():
+                if col_type == 'mmss_timestamp':
+                    print(f"  Converted '{col_name}' from MM:SS.s format to seconds")
+            # Ranges were tokenized and converted in the worker processes
+            report_count('tokenizing', sum(len(frame) for frame in frames))
+            with report_stage('conversion', 'DATA'):
+                df = finish_standard_frame(concat_frames(frames), raw_header_line, timestamp_offset)
+        else:
+            df = collect_chunks(iter_standard_chunks(file_path, delimiter, layout, timestamp_offset,
+                                                     reader=log_reader, parse_filter=parse_filter,
+                                                     progress=progress, raw_bytes=raw_bytes))['DATA']
     
     return {'DATA': df}
 
 
-def parse_mixed_format(file_path: str, delimiter: str, timestamp_offset: timedelta) -> Dict[str, pd.DataFrame]:
-    """Parse mixed format, grouping by column count."""
-    print("\nParsing mixed format...")
+def find_timestamp_column(columns: List[str], numeric_columns: Set[str]) -> Optional[str]:
+    """Pick the column to rename to 'timestamp' from various time-related names, if any."""
+    if 'timestamp' in columns:
+        return None
+    
+    # Try exact matches first
+    exact_matches = ['time', 'Time', 'TIME', 'datetime', 'DateTime', 'DATETIME']
+    for col in exact_matches:
+        if col in columns:
+            return col
+    
+    # If no exact match, try partial matches (case-insensitive)
+    time_patterns = ['time_sec', 'time_s', 'elapsed', 'duration', 'timestamp']
+    for col in columns:
+        col_lower = col.lower()
+        # Check if column name contains time-related patterns
+        # Also check if it's numeric (likely to be elapsed seconds)
+        if any(pattern in col_lower for pattern in time_patterns) and col in numeric_columns:
+            return col
+    
+    return None
+
+
+def iter_mixed_chunks(file_path: str, delimiter: str, timestamp_offset: timedelta,
+                      reader: Optional[LogFileReader] = None, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                      parse_filter: Optional[ParseFilter] = None,
+                      progress: Optional[ParseProgress] = None, start: int = 0,
+                      frozen: Optional[FrozenSchema] = None,
+                      end: Optional[int] = None, raw_bytes: bool = False) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """
+    Yield ('DATA_MISC_<n>COLS', chunk) batches of a mixed log grouped by column count,
+    holding at most chunk_rows rows. Each group's schema is fixed by its first batch.
+    Groups and rows outside parse_filter are dropped before they are buffered.
+    Only bytes start to end are read; group schemas in frozen are reused and new ones added.
+    With raw_bytes, lines are tokenized without decoding them (see ColumnBuilder).
+    """
+    schemas = frozen.schemas if frozen is not None else {}
+    kept_counts = {}  # Column count -> whether parse_filter keeps its group
+    new_schemas = set()  # Column counts whose schema was inferred since their last chunk
+    buffer = RowBuffer(raw_bytes)
+    n_rows = 0
+    
+    def resolve_schema(n_cols: int, rows: List[List[str]]) -> Tuple:
+        """The group's schema, inferred from its first rows if it has none yet."""
+        schema = schemas.get(n_cols)
+        if schema is None:
+            with report_stage('type_inference', f'DATA_MISC_{n_cols}COLS'):
+                # Generate column names, then infer types (from the first 100 rows, as text)
+                rows = decode_raw_rows(rows[:100]) if raw_bytes else rows
+                headers = generate_column_names(n_cols, rows[:20])
+                column_types = infer_column_types_from_data(rows, headers)
+                schema = schemas[n_cols] = (headers, column_types,
+                                            infer_datetime_formats(rows, headers, column_types))
+            new_schemas.add(n_cols)
+        return schema
     
-    grouped_data = defaultdict(list)
-    grouped_raw_data = defaultdict(list)
+    def build_buffered_chunks():
+        for n_cols, builder in buffer.drain():
+            name = f'DATA_MISC_{n_cols}COLS'
+            schema = resolve_schema(n_cols, builder.rows)
+            builder.report_conversion(name)
+            with report_stage('conversion', name) as stats:
+                stats.count(len(builder), sum(builder.lengths))
+                df = builder.to_dataframe(schema, file_path, parse_filter, verbose=n_cols in new_schemas)
+                df = apply_timestamp_offset(df, timestamp_offset)
+            
+            new_schemas.discard(n_cols)
+            yield name, df
     
+    line_num = 0
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line_num, line in enumerate(f, 1):
-                original_line = line.rstrip('\n\r')
-                line = line.strip()
-                if not line:
+        with open_log_reader(file_path, reader) as log_reader:
+            lines = (log_reader.iter_indexed_raw_lines(start, end) if raw_bytes
+                     else log_reader.iter_indexed_lines(start, end))
+            split, line_delimiter = (split_raw_line, delimiter.encode()) if raw_bytes else (split_line, delimiter)
+            for line_num, (offset, length, line) in enumerate(lines, 1):
+                if progress is not None and line_num % PROGRESS_REPORT_LINES == 0:
+                    progress.advance(offset, line_num)
+                parts = split(line, line_delimiter)
+                if not parts:
                     continue
-                
-                parts = [p.strip() for p in line.split(delimiter)]
-                while parts and not parts[-1]:
-                    parts.pop()
-                if parts:
+                if parse_filter is not None:
                     n_cols = len(parts)
-                    grouped_data[n_cols].append(parts)
-                    grouped_raw_data[n_cols].append(original_line)
+                    if n_cols not in kept_counts:
+                        kept_counts[n_cols] = parse_filter.keeps_name(f'DATA_MISC_{n_cols}COLS')
+                    if not kept_counts[n_cols] or not parse_filter.keeps_row(parts):
+                        continue
+                builder = buffer.add(len(parts), parts, offset, length)
+                n_rows += 1
+                if builder.block_full:
+                    builder.convert_rows(resolve_schema(len(parts), builder.rows), parse_filter)
+                if buffer.total >= chunk_rows:
+                    yield from build_buffered_chunks()
+            
+            report_count('tokenizing', line_num, skipped_lines=line_num - n_rows)
+            yield from build_buffered_chunks()
+    except ParseCancelled:
+        raise
     except Exception as e:
         raise RuntimeError(f"Critical parsing error at line {line_num}: {e}")
+
+
+def parse_mixed_format(file_path: str, delimiter: str, timestamp_offset: timedelta,
+                       reader: Optional[LogFileReader] = None,
+                       parse_filter: Optional[ParseFilter] = None,
+                       progress: Optional[ParseProgress] = None,
+                       frozen: Optional[FrozenSchema] = None,
+                       raw_bytes: bool = False) -> Dict[str, pd.DataFrame]:
+    """Parse mixed format, grouping by column count; the group schemas are recorded in frozen."""
+    print("\nParsing mixed format...")
     
-    print(f"  Found {len(grouped_data)} different column counts")
+    dataframes = collect_chunks(iter_mixed_chunks(file_path, delimiter, timestamp_offset, reader=reader,
+                                                  parse_filter=parse_filter, progress=progress, frozen=frozen,
+                                                  raw_bytes=raw_bytes))
     
-    dataframes = {}
+    print(f"  Found {len(dataframes)} different column counts")
+    for df_name, df in dataframes.items():
+        print(f"  {df_name}: {len(df)} rows")
     
-    for n_cols, rows in grouped_data.items():
-        print(f"  Processing {len(rows)} rows with {n_cols} columns...")
-        
-        # Generate column names
-        headers = generate_column_names(n_cols, rows[:20])
+    return dataframes
+
+
+INCREMENTAL_MAX_FILES = 4  # Growing logs whose last parse is kept in memory for incremental reloads
+
+
+class IncrementalParseState:
+    """
+    The last parse of a (growing) log, kept so a reload only parses the appended lines.
+    
+    Records the format, delimiter and message type column that were detected, the
+    timestamp offset and filter applied, the FrozenSchema the parsers filled in,
+    the DataFrames (or LazyDataFrames index) built, and where the parse stopped
+    together with a digest of the bytes before that point. Like the parse cache,
+    the digest covers the first and last megabyte of the parsed prefix, not every byte.
+    raw_bytes records that the lines were tokenized undecoded (bytes engine).
+    """
+    
+    def __init__(self, file_path: str, format_name: str, delimiter: str, msg_type_col: Optional[int],
+                 timestamp_offset: timedelta, parse_filter: Optional[ParseFilter], frozen: FrozenSchema,
+                 dataframes: Dict[str, pd.DataFrame], reader: LogFileReader, raw_bytes: bool = False):
+        self.file_path = file_path
+        self.format_name = format_name  # 'interleaved', 'mixed' or 'standard'
+        self.delimiter = delimiter
+        self.msg_type_col = msg_type_col
+        self.timestamp_offset = timestamp_offset
+        self.parse_filter = parse_filter
+        self.frozen = frozen
+        self.dataframes = dataframes
+        self.raw_bytes = raw_bytes
+        self.mark_end(reader)
+    
+    def mark_end(self, reader: LogFileReader):
+        """Record that everything the reader maps has been parsed."""
+        self.end_offset = reader.size
+        self.ends_with_newline = reader.ends_with_newline()
+        self.prefix_digest = reader.prefix_digest(reader.size)
+    
+    def can_extend(self, reader: LogFileReader) -> bool:
+        """True if the file still starts with the bytes parsed last time, ending on a complete line."""
+        return (self.ends_with_newline and reader.size >= self.end_offset
+                and reader.prefix_digest(self.end_offset) == self.prefix_digest)
+    
+    def result(self) -> Dict[str, pd.DataFrame]:
+        """The parsed frames as returned to callers (shallow copies, so renaming columns does not touch ours)."""
+        if isinstance(self.dataframes, LazyDataFrames):
+            return self.dataframes
+        return {name: df.copy(deep=False) for name, df in self.dataframes.items()}
+
+
+# (absolute path, parse options, lazy) -> IncrementalParseState, least recently used first
+incremental_states = OrderedDict()
+
+
+def remember_parse(key: Tuple, state: IncrementalParseState):
+    """Keep state for incremental reloads, forgetting the least recently used files beyond INCREMENTAL_MAX_FILES."""
+    incremental_states[key] = state
+    incremental_states.move_to_end(key)
+    while len(incremental_states) > INCREMENTAL_MAX_FILES:
+        incremental_states.popitem(last=False)
+
+
+def describe_parse_layout(format_name: str, delimiter: str, msg_type_col: Optional[int], frozen: FrozenSchema,
+                          parse_filter: Optional[ParseFilter] = None, raw_bytes: bool = False) -> Dict:
+    """JSON form of what an IncrementalParseState needs besides the frames, stored in the parse cache."""
+    return {'format': format_name, 'delimiter': delimiter, 'msg_type_col': msg_type_col,
+            'frozen': frozen.to_json(),
+            'time_field': [parse_filter.time_field, parse_filter.time_format] if parse_filter is not None else None,
+            'raw_bytes': raw_bytes}
+
+
+def restore_parse_state(file_path: str, parse_layout: Dict, timestamp_offset: timedelta,
+                        parse_filter: Optional[ParseFilter], dataframes: Dict[str, pd.DataFrame],
+                        reader: LogFileReader) -> IncrementalParseState:
+    """Rebuild the incremental state of frames loaded from the parse cache (the file is unchanged since)."""
+    if parse_filter is not None and parse_layout['time_field'] is not None:
+        parse_filter.time_field, parse_filter.time_format = parse_layout['time_field']
+    return IncrementalParseState(file_path, parse_layout['format'], parse_layout['delimiter'],
+                                 parse_layout['msg_type_col'], timestamp_offset, parse_filter,
+                                 FrozenSchema.from_json(parse_layout['frozen']), dataframes, reader,
+                                 parse_layout.get('raw_bytes', False))
+
+
+def parse_appended_lines(file_path: str, state: IncrementalParseState, timestamp_offset: timedelta,
+                         reader: LogFileReader, parse_filter: Optional[ParseFilter] = None,
+                         progress: Optional[ParseProgress] = None):
+    """
+    Parse the lines after state.end_offset with the frozen schema and append them
+    to state.dataframes: rows of known message types are concatenated onto their
+    frames, new message types (or column counts) become new frames.
+    """
+    start = state.end_offset
+    frozen = state.frozen
+    
+    if isinstance(state.dataframes, LazyDataFrames):
+        # Extend the line index; frames are built from it on first access as usual
+        appended = index_interleaved_format(file_path, state.delimiter, state.msg_type_col, timestamp_offset,
+                                            reader=reader, parse_filter=parse_filter, progress=progress,
+                                            start=start, frozen=frozen, raw_bytes=state.raw_bytes)
+        message_index = dict(state.dataframes.message_index)
+        for msg_type, (schema, raw_header, offsets, lengths) in appended.message_index.items():
+            if msg_type in message_index:
+                _, raw_header, old_offsets, old_lengths = message_index[msg_type]
+                offsets = np.concatenate((old_offsets, offsets))
+                lengths = np.concatenate((old_lengths, lengths))
+            message_index[msg_type] = (schema, raw_header, offsets, lengths)
+        state.dataframes = LazyDataFrames(file_path, state.delimiter, state.msg_type_col, timestamp_offset,
+                                          message_index, parse_filter, state.raw_bytes)
+        state.mark_end(reader)
+        return
+    
+    if state.format_name == 'interleaved':
+        chunks = iter_interleaved_chunks(file_path, state.delimiter, state.msg_type_col, timestamp_offset,
+                                         reader=reader, parse_filter=parse_filter, progress=progress,
+                                         start=start, frozen=frozen, raw_bytes=state.raw_bytes)
+    elif state.format_name == 'mixed':
+        chunks = iter_mixed_chunks(file_path, state.delimiter, timestamp_offset, reader=reader,
+                                   parse_filter=parse_filter, progress=progress, start=start, frozen=frozen,
+                                   raw_bytes=state.raw_bytes)
+    else:
+        chunks = iter_standard_chunks(file_path, state.delimiter, frozen.layout, timestamp_offset, reader=reader,
+                                      parse_filter=parse_filter, progress=progress, start=start,
+                                      raw_bytes=state.raw_bytes)
+    
+    dataframes = dict(state.dataframes)
+    for name, df in collect_chunks(chunks).items():
+        print(f"  Appended {len(df)} rows to '{name}'")
+        dataframes[name] = concat_frames([dataframes[name], df]) if name in dataframes else df
+    state.dataframes = dataframes
+    state.mark_end(reader)
+
+
+def latest_parse_state(file_path: str) -> Optional[IncrementalParseState]:
+    """The most recent incremental parse state of file_path, whatever options it was parsed with."""
+    path = os.path.abspath(file_path)
+    for (state_path, _, _), state in reversed(incremental_states.items()):
+        if state_path == path:
+            return state
+    return None
+
+
+class LogTailer:
+    """
+    Follows a log that is still being written, like tail -f.
+    
+    Starts where an incremental parse stopped (see IncrementalParseState) and each
+    poll parses just the complete lines appended since the previous one, through
+    the same interleaved/mixed/standard line handling and a copy of that parse's
+    frozen schema. Nothing is accumulated here; the caller decides how much of
+    the returned rows to keep.
+    
+    A poll parses at most max_poll_bytes (cut at a line boundary) and leaves the
+    rest for the next one, so a burst of writes is caught up over several polls.
+    With keep_lines, the first poll starts about keep_lines lines before the end
+    instead of parsing everything appended since the state was taken.
+    """
+    
+    MAX_POLL_BYTES = 512 * 1024  # Default bytes parsed per poll (about 0.1 s of parsing)
+    
+    def __init__(self, state: IncrementalParseState, max_poll_bytes: int = MAX_POLL_BYTES,
+                 keep_lines: Optional[int] = None):
+        self.file_path = state.file_path
+        self.format_name = state.format_name
+        self.delimiter = state.delimiter
+        self.msg_type_col = state.msg_type_col
+        self.timestamp_offset = state.timestamp_offset
+        self.parse_filter = state.parse_filter
+        # New message types and wider rows seen while tailing must not leak into the reload state
+        self.frozen = copy.deepcopy(state.frozen)
+        self.offset = state.end_offset
+        # A last line still being written when the state was taken was parsed as it stood; skip its rest
+        self.skip_partial_line = not state.ends_with_newline
+        self.max_poll_bytes = max_poll_bytes
+        self.keep_lines = keep_lines
+    
+    def poll(self) -> Dict[str, pd.DataFrame]:
+        """
+        Parse up to max_poll_bytes of the complete lines appended since the last
+        poll into new rows per DataFrame name (empty if there are none). Raises
+        RuntimeError if the file shrank, i.e. it was truncated or replaced.
+        """
+        size = os.path.getsize(self.file_path)
+        if size < self.offset:
+            raise RuntimeError(f"{os.path.basename(self.file_path)} was truncated or replaced")
+        if size == self.offset:
+            return {}
         
-        # Infer types
-        column_types = infer_column_types_from_data(rows, headers)
+        with open_log_reader(self.file_path) as reader:
+            if self.skip_partial_line:
+                line_start = reader.next_line_start(self.offset)
+                if line_start is None:
+                    return {}
+                self.offset = line_start
+                self.skip_partial_line = False
+            
+            if self.keep_lines is not None:
+                # Rows further back than the caller keeps would only be parsed to be thrown away
+                end = reader.complete_lines_end(self.offset)
+                keep_bytes = int(self.keep_lines * reader.average_line_length(self.offset, end))
+                if end - self.offset > keep_bytes:
+                    self.offset = reader.line_start_before(end - keep_bytes, self.offset)
+                self.keep_lines = None
+            
+            # A line without its terminator may still be being written; the rest waits for the next poll
+            end = reader.complete_lines_end(self.offset, self.max_poll_bytes)
+            if end == self.offset:
+                return {}
+            
+            if self.format_name == 'interleaved':
+                chunks = iter_interleaved_chunks(self.file_path, self.delimiter, self.msg_type_col,
+                                                 self.timestamp_offset, reader=reader, parse_filter=self.parse_filter,
+                                                 start=self.offset, frozen=self.frozen, end=end)
+            elif self.format_name == 'mixed':
+                chunks = iter_mixed_chunks(self.file_path, self.delimiter, self.timestamp_offset, reader=reader,
+                                           parse_filter=self.parse_filter, start=self.offset, frozen=self.frozen,
+                                           end=end)
+            else:
+                chunks = iter_standard_chunks(self.file_path, self.delimiter, self.frozen.layout,
+                                              self.timestamp_offset, reader=reader, parse_filter=self.parse_filter,
+                                              start=self.offset, end=end)
+            new_rows = collect_chunks(chunks)
         
-        # Convert data
-        converted_data = []
-        for row in rows:
-            converted_data.append(convert_row_values(row, column_types, headers))
+        self.offset = end
+        return new_rows
+
+
+# Parsing engines selectable in parse_universal_log
+PARSE_ENGINES = ('pandas', 'polars', 'bytes')
+
+# Every character str.strip() removes; Polars' strip_chars() on its own keeps '\x1c'-'\x1f'
+STRIP_CHARACTERS = ('\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005'
+                    '\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000')
+
+
+def read_lines_polars(file_path: str, reader: LogFileReader) -> 'pl.DataFrame':
+    """
+    Read every line of the file into one string column with Polars' multithreaded CSV reader.
+    Each line keeps its byte offset/length so it can be re-read later.
+    """
+    lines = pl.read_csv(file_path, has_header=False, separator='\x00', quote_char=None,
+                        new_columns=['line'], schema={'line': pl.String}, encoding='utf8-lossy')
+    offsets, lengths = reader.line_index()
+    if len(offsets) == lines.height:
+        lines = lines.with_columns(pl.Series(LINE_OFFSET_COLUMN, offsets), pl.Series(LINE_LENGTH_COLUMN, lengths))
+    else:
+        print("  Warning: Line index does not match the rows Polars read; raw lines will not be available")
+    return lines
+
+
+def read_standard_rows_polars(file_path: str, delimiter: str, headers: List[str], skip_header: bool,
+                              reader: LogFileReader) -> Optional['pl.DataFrame']:
+    """
+    Read a standard log with Polars' multithreaded CSV reader on its delimiter: one string column
+    per header with the fields split_line gives, and each line's offset/length. The few lines Polars
+    splits differently (quotes, lines of only delimiters and, for whitespace delimiters, leading
+    empty fields) are re-split with split_line. None if the rows do not line up with the file's lines.
+    """
+    fields = [f'field_{i}' for i in range(len(headers))]
+    try:
+        rows = pl.read_csv(file_path, has_header=False, separator=delimiter, quote_char=None,
+                           skip_rows=int(skip_header), schema={field: pl.String for field in fields},
+                           truncate_ragged_lines=True, raise_if_empty=False, encoding='utf8-lossy')
+    except pl.exceptions.SchemaError:
+        return None  # The first line has more fields than the header
+    offsets, lengths = reader.line_index()
+    if skip_header:
+        offsets, lengths = offsets[1:], lengths[1:]
+    if len(offsets) != rows.height:
+        return None
+    rows = rows.with_columns([pl.col(field).str.strip_chars(STRIP_CHARACTERS) for field in fields]
+                             + [pl.Series(LINE_OFFSET_COLUMN, offsets), pl.Series(LINE_LENGTH_COLUMN, lengths)])
+    
+    empty = [pl.col(field).fill_null('') == '' for field in fields]
+    all_empty = pl.all_horizontal(empty)
+    resplit = all_empty | pl.any_horizontal([pl.col(field).str.contains(QUOTE_CHAR, literal=True).fill_null(False)
+                                             for field in fields])
+    if delimiter.isspace():
+        # split_line strips the whole line first, which drops the leading empty fields of such logs
+        resplit |= empty[0]
+    # Blank lines are dropped without reading them again
+    flags = rows.select(blank=all_empty & (pl.col(LINE_LENGTH_COLUMN) <= 1), resplit=resplit)
+    if not flags['resplit'].any():
+        return rows.select([pl.col(field).alias(header) for field, header in zip(fields, headers)]
+                           + [LINE_OFFSET_COLUMN, LINE_LENGTH_COLUMN])
+    
+    rows = rows.with_columns(flags)
+    regular = rows.filter(~pl.col('resplit')).drop('blank', 'resplit')
+    resplit_rows = []
+    for offset, length in rows.filter(pl.col('resplit') & ~pl.col('blank')).select(
+            LINE_OFFSET_COLUMN, LINE_LENGTH_COLUMN).iter_rows():
+        parts = split_line(reader.read_line(offset, length), delimiter)
+        if parts:
+            resplit_rows.append(parts[:len(fields)] + [None] * (len(fields) - len(parts)) + [offset, length])
+    rows = (pl.concat([regular, pl.DataFrame(resplit_rows, schema=regular.schema, orient='row')])
+            .sort(LINE_OFFSET_COLUMN))
+    return rows.select([pl.col(field).alias(header) for field, header in zip(fields, headers)]
+                       + [LINE_OFFSET_COLUMN, LINE_LENGTH_COLUMN])
+
+
+def tokenize_lines_polars(lines: 'pl.DataFrame', delimiter: str) -> 'pl.DataFrame':
+    """
+    Polars equivalent of split_line on every line. Lines without quotes are split by
+    Polars; the few with quotes go through split_line so quoted fields stay whole.
+    """
+    stripped = pl.col('line').str.strip_chars(STRIP_CHARACTERS).str.strip_chars_end(delimiter + STRIP_CHARACTERS)
+    lines = (lines.with_columns(stripped.alias('stripped'))
+             .filter(pl.col('stripped').str.len_bytes() > 0))
+    rows = (lines.with_columns(pl.col('stripped').str.split(delimiter)
+                               .list.eval(pl.element().str.strip_chars(STRIP_CHARACTERS)).alias('parts'))
+            .drop('stripped'))
+    has_quote = pl.col('line').str.contains(QUOTE_CHAR, literal=True)
+    if len(delimiter) != 1 or not rows.select(has_quote.any()).item():
+        return rows
+    
+    rows = rows.with_row_index('line_order')
+    quoted = rows.filter(has_quote)
+    parts = pl.Series('parts', [split_line(line, delimiter) for line in quoted['line']], dtype=pl.List(pl.String))
+    return (pl.concat([rows.filter(~has_quote), quoted.with_columns(parts)])
+            .sort('line_order')
+            .filter(pl.col('parts').list.len() > 0)
+            .drop('line_order'))
+
+
+def polars_strptime(values: 'pl.Expr', fmt: str) -> 'pl.Expr':
+    """Parse strings with one of DATETIME_FORMATS; time-only values get the same 1900-01-01 date as strptime."""
+    fmt = fmt.replace('.%f', '%.f')
+    if '%Y' not in fmt:
+        values, fmt = pl.lit('1900-01-01 ') + values, '%Y-%m-%d ' + fmt
+    return values.str.strptime(pl.Datetime('ns'), fmt, strict=False)
+
+
+def polars_column_expr(name: str, col_type: str, fmt: Optional[str] = None) -> 'pl.Expr':
+    """Polars expression converting one string column to the inferred type, like convert_column."""
+    values = pl.col(name)
+    if col_type == 'datetime':
+        formats = [fmt] if fmt is not None else DATETIME_FORMATS
+        return pl.coalesce([polars_strptime(values, f) for f in formats])
+    elif col_type == 'mmss_timestamp':
+        parts = values.str.extract_groups(MMSS_VALUE_PATTERN)
+        hours = parts.struct.field('1').cast(pl.Float64)
+        minutes = parts.struct.field('2').cast(pl.Float64)
+        secs = parts.struct.field('3').cast(pl.Float64)
+        # Same validation ranges as parse_mmss_timestamp
+        has_hours = hours.is_not_null()
+        valid = minutes.is_not_null() & secs.is_not_null() & (secs < 60)
+        valid &= ~has_hours | ((hours <= 99) & (minutes <= 59))
+        valid &= has_hours | (minutes <= 9999)
+        elapsed = hours.fill_null(0) * 3600 + minutes * 60 + secs
+        return pl.when(valid.fill_null(False)).then(elapsed).otherwise(values.cast(pl.Float64, strict=False))
+    elif col_type in ('int', 'float'):
+        # Integer columns are narrowed afterwards, once it is known every value is whole
+        return values.cast(pl.Float64, strict=False)
+    elif col_type == 'bool':
+        lowered = values.str.to_lowercase()
+        is_true = lowered.is_in(list(TRUE_TOKENS))
+        other = ~lowered.is_in(list(TRUE_TOKENS + FALSE_TOKENS + NULL_TOKENS)) & values.is_not_null()
+        numeric = values.cast(pl.Float64, strict=False)
+        return (is_true | (other & (numeric.is_null() | (numeric != 0)))).fill_null(False)
+    
+    # String columns keep the raw text, with null markers normalized to null
+    text = pl.when(values.str.to_lowercase().is_in(list(NULL_TOKENS))).then(None).otherwise(values)
+    return text.cast(pl.Categorical) if col_type == 'category' else text
+
+
+def build_polars_dataframe(rows: 'pl.DataFrame', headers: List[str], column_types: Dict[str, str],
+                           column_formats: Dict[str, str], timestamp_offset: timedelta,
+                           parse_filter: Optional[ParseFilter] = None) -> 'pl.DataFrame':
+    """
+    Spread the 'parts' lists (or take the string columns named by header) into typed columns,
+    short rows padded with nulls, and apply the offset. With a parse_filter only its columns
+    are built and rows outside its time window are dropped.
+    """
+    all_headers = headers
+    time_col = None
+    if parse_filter is not None:
+        if parse_filter.time_field is not None and parse_filter.time_field < len(headers):
+            time_col = headers[parse_filter.time_field]
+        columns = parse_filter.project(headers, column_types)
+        if columns is not None:
+            headers = [name for name in headers if name in columns]
+    index_cols = [col for col in (LINE_OFFSET_COLUMN, LINE_LENGTH_COLUMN) if col in rows.columns]
+    if 'parts' in rows.columns:
+        positions = {name: i for i, name in reversed(list(enumerate(all_headers)))}
+        df = rows.select([pl.col('parts').list.get(positions[name], null_on_oob=True).alias(name)
+                          for name in headers] + index_cols)
+    else:
+        df = rows.select(headers + index_cols)
+    df = df.with_columns([polars_column_expr(name, column_types.get(name, 'string'), column_formats.get(name))
+                          .alias(name) for name in headers])
+    
+    # Keep integer columns as integers only if every value is whole and fits in an Int64
+    int_cols = [name for name in headers if column_types.get(name) == 'int']
+    if int_cols and df.height:
+        whole = df.select([(((pl.col(name) % 1) == 0) & (pl.col(name).abs() < 2.0 ** 63)).all().alias(name)
+                           for name in int_cols]).row(0)
+        df = df.with_columns([pl.col(name).cast(pl.Int64) for name, is_whole in zip(int_cols, whole) if is_whole])
+    
+    # Apply timestamp offset
+    if timestamp_offset != timedelta(0):
+        df = df.with_columns([pl.col(name) + timestamp_offset for name, dtype in df.schema.items()
+                              if isinstance(dtype, pl.Datetime)])
+    
+    # The time window is checked on the converted column, where Polars compares whole columns at once
+    if time_col is not None:
+        df = filter_polars_time_window(df, time_col, parse_filter)
+    return df
+
+
+def filter_polars_time_window(df: 'pl.DataFrame', time_col: str, parse_filter: ParseFilter) -> 'pl.DataFrame':
+    """Keep the rows whose converted time column lies in the filter's window."""
+    start, end = parse_filter.time_range
+    dtype = df.schema.get(time_col)
+    if dtype is None or (dtype.is_numeric() != parse_filter.numeric_window) or \
+            (not parse_filter.numeric_window and not isinstance(dtype, pl.Datetime)):
+        print(f"  Warning: '{time_col}' does not hold the window's timestamps, time window ignored")
+        return df
+    
+    values = pl.col(time_col)
+    keep = values.is_not_null()
+    if start is not None:
+        keep &= values >= start
+    if end is not None:
+        keep &= values <= end
+    return df.filter(keep)
+
+
+def parse_standard_format_polars(file_path: str, delimiter: str, sample: List[List[str]], timestamp_offset: timedelta,
+                                 reader: LogFileReader,
+                                 parse_filter: Optional[ParseFilter] = None,
+                                 progress: Optional[ParseProgress] = None) -> Tuple[Dict[str, 'pl.DataFrame'], Dict[str, str]]:
+    """Parse standard CSV/TSV format with Polars. Returns the frames and their raw header lines."""
+    print("\nParsing standard CSV/TSV format with Polars...")
+    if parse_filter is not None and not parse_filter.keeps_name('DATA'):
+        return {}, {}
+    
+    headers, column_types, column_formats, data_start, raw_header_line = prepare_standard_format(sample, reader)
+    raw_headers = {'DATA': raw_header_line} if raw_header_line else {}
+    
+    if progress is not None:
+        progress.stage("Reading lines")
+    n_lines = len(reader.line_index()[0])
+    rows = read_standard_rows_polars(file_path, delimiter, headers, bool(data_start), reader)
+    if rows is None:
+        # Rows that cannot be matched to their lines are split from one string column per line instead
+        lines = read_lines_polars(file_path, reader)
+        if data_start:
+            lines = lines.slice(1)  # Skip the header line
+        rows = tokenize_lines_polars(lines, delimiter)
+    report_count('tokenizing', n_lines, skipped_lines=n_lines - rows.height)
+    if progress is not None:
+        progress.advance(reader.size, n_lines)
+        progress.stage("Building DataFrames")
+    with report_stage('conversion', 'DATA') as stats:
+        stats.count(rows.height, reader.size)
+        df = build_polars_dataframe(rows, headers, column_types, column_formats, timestamp_offset, parse_filter)
         
-        # Create DataFrame with explicit column names
-        df = pd.DataFrame(converted_data, columns=headers)
+        # Normalize timestamp column name so the plotter works consistently
+        with report_stage('timestamp_renaming'):
+            numeric_columns = {name for name, dtype in df.schema.items() if dtype.is_numeric()}
+            time_col = find_timestamp_column(df.columns, numeric_columns)
+            if time_col is not None:
+                df = df.rename({time_col: 'timestamp'})
+                print(f"  Renamed '{time_col}' column to 'timestamp' for consistency")
+    
+    return {'DATA': df}, raw_headers
+
+
+def polars_header_rows(rows: 'pl.DataFrame') -> Set[int]:
+    """
+    Row numbers whose message-specific fields form a header (per is_likely_header_row).
+    
+    Numeric fields always count as data, so only rows where they are a minority can be
+    headers; just those candidates are checked in Python.
+    """
+    fields = pl.col('message_specific')
+    non_empty = fields.list.eval(pl.element().str.len_bytes() > 0).list.sum()
+    numeric = fields.list.eval(pl.element().cast(pl.Float64, strict=False).is_not_null()).list.sum()
+    starts_with_time = fields.list.first().str.contains(TIMESTAMP_VALUE_PATTERN).fill_null(False)
+    candidates = rows.filter((numeric * 2 < non_empty) & ~starts_with_time).select('row', 'message_specific')
+    return {row for row, message_specific in candidates.iter_rows() if is_likely_header_row(message_specific)}
+
+
+def parse_interleaved_format_polars(file_path: str, delimiter: str, msg_type_col: int, timestamp_offset: timedelta,
+                                    reader: LogFileReader,
+                                    parse_filter: Optional[ParseFilter] = None,
+                                    progress: Optional[ParseProgress] = None) -> Tuple[Dict[str, 'pl.DataFrame'], Dict[str, str]]:
+    """
+    Parse interleaved format with Polars, partitioning rows by the message-type column.
+    Returns the frames and their raw header lines.
+    """
+    print("\nParsing interleaved format with Polars...")
+    
+    if progress is not None:
+        progress.stage("Reading lines")
+    lines = read_lines_polars(file_path, reader)
+    rows = tokenize_lines_polars(lines, delimiter)
+    if progress is not None:
+        progress.advance(reader.size, rows.height)
+        progress.stage("Splitting message types")
+    
+    # Same rules as is_message_type, applied to the whole column
+    message_type = pl.col('parts').list.get(msg_type_col, null_on_oob=True).str.to_uppercase()
+    rows = rows.with_columns(message_type.alias('message_type'))
+    rows = rows.filter(pl.col('message_type').str.contains(r'^[A-Za-z0-9_-]{2,25}$')
+                       & pl.col('message_type').cast(pl.Float64, strict=False).is_null()
+                       & ~pl.col('message_type').str.contains(r'^\d{4}-\d{2}-\d{2}'))
+    if parse_filter is not None and parse_filter.message_types is not None:
+        rows = rows.filter(pl.col('message_type').is_in(list(parse_filter.message_types)))
+    rows = rows.with_row_index('row').with_columns(
+        pl.col('parts').list.slice(msg_type_col + 1).alias('message_specific'))
+    
+    # Header-like rows are never data; the first line of each type decides its header
+    header_rows = polars_header_rows(rows)
+    rows = rows.with_columns(pl.col('row').is_in(list(header_rows)).alias('is_header'))
+    
+    message_headers = {}
+    raw_headers = {}
+    first_lines = rows.unique(subset='message_type', keep='first', maintain_order=True)
+    for msg_type, parts, message_specific, is_header, line in first_lines.select(
+            'message_type', 'parts', 'message_specific', 'is_header', 'line').iter_rows():
+        headers, raw_header = resolve_message_header(msg_type, is_header, parts[:msg_type_col],
+                                                     message_specific, line)
+        message_headers[msg_type] = headers
+        if raw_header is not None:
+            raw_headers[msg_type] = raw_header
+    
+    # Data rows without the message-type field, partitioned by type in file order
+    data = rows.filter(~pl.col('is_header')).with_columns(
+        pl.concat_list(pl.col('parts').list.head(msg_type_col), pl.col('message_specific')).alias('parts'))
+    partitions = {key[0]: part for key, part in data.partition_by('message_type', as_dict=True,
+                                                                  maintain_order=True).items()}
+    report_count('tokenizing', lines.height, skipped_lines=lines.height - data.height)
+    
+    if progress is not None:
+        progress.stage("Building DataFrames")
+    dataframes = {}
+    for msg_type, headers in message_headers.items():
+        if progress is not None:
+            progress.check()
+        part = partitions.get(msg_type)
+        if part is None:
+            print(f"  Warning: No data found for '{msg_type}' (only header)")
+            continue
         
-        # Add raw data column
-        raw_col_name = '__parser_raw_line__'
-        if n_cols in grouped_raw_data and len(grouped_raw_data[n_cols]) == len(df):
-            df[raw_col_name] = grouped_raw_data[n_cols]
+        with report_stage('type_inference', msg_type):
+            headers = fit_headers(headers, part['parts'].list.len().max())
+            
+            # Infer types (short rows count as nulls, as in the converted frame)
+            type_sample = [row + [''] * (len(headers) - len(row)) for row in part['parts'].head(100).to_list()]
+            column_types = infer_column_types_from_data(type_sample, headers)
+            column_formats = infer_datetime_formats(type_sample, headers, column_types)
         
-        # Apply types
-        for col_name, col_type in column_types.items():
-            if col_name in df.columns:
-                try:
-                    if col_type == 'datetime':
-                        df[col_name] = pd.to_datetime(df[col_name], errors='coerce')
-                    elif col_type == 'mmss_timestamp':
-                        # Convert to float (seconds) for plotting
-                        df[col_name] = pd.to_numeric(df[col_name], errors='coerce')
-                        print(f"  Converted '{col_name}' from MM:SS.s format to seconds")
-                    elif col_type == 'int':
-                        df[col_name] = pd.to_numeric(df[col_name], errors='coerce').astype('Int64')
-                    elif col_type == 'float':
-                        df[col_name] = pd.to_numeric(df[col_name], errors='coerce')
-                    elif col_type == 'bool':
-                        df[col_name] = df[col_name].astype('bool')
-                except (ValueError, TypeError, AttributeError) as e:
-                    print(f"  Warning: Could not convert column '{col_name}' to {col_type}: {e}")
-        
-        df = apply_timestamp_offset(df, timestamp_offset)
-        
-        df_name = f'DATA_MISC_{n_cols}COLS'
-        dataframes[df_name] = df
+        with report_stage('conversion', msg_type) as stats:
+            stats.count(part.height, part[LINE_LENGTH_COLUMN].sum() if LINE_LENGTH_COLUMN in part.columns else 0)
+            df = build_polars_dataframe(part, headers, column_types, column_formats, timestamp_offset,
+                                        parse_filter)
+        dataframes[msg_type] = df
+        print(f"  Created DataFrame for '{msg_type}': {df.height} rows × {len(headers)} columns")
     
+    return dataframes, raw_headers
+
+
+def parse_with_polars(file_path: str, delimiter: str, sample: List[List[str]], msg_type_col: Optional[int],
+                      timestamp_offset: timedelta, reader: LogFileReader,
+                      parse_filter: Optional[ParseFilter] = None,
+                      progress: Optional[ParseProgress] = None) -> Optional[Dict[str, pd.DataFrame]]:
+    """Parse an interleaved or standard log with the Polars engine; None means use the pandas path."""
+    try:
+        if msg_type_col is not None:
+            polars_dfs, raw_headers = parse_interleaved_format_polars(file_path, delimiter, msg_type_col,
+                                                                      timestamp_offset, reader, parse_filter, progress)
+        elif len(set(len(row) for row in sample)) == 1:
+            polars_dfs, raw_headers = parse_standard_format_polars(file_path, delimiter, sample,
+                                                                   timestamp_offset, reader, parse_filter, progress)
+        else:
+            return None
+    except pl.exceptions.DuplicateError:
+        # Polars needs unique column names; the pandas path allows repeated headers
+        print("  Repeated column names are not supported by the Polars engine, using the pandas engine")
+        return None
+    
+    return polars_to_pandas(polars_dfs, raw_headers, file_path)
+
+
+def arrow_types_mapper(arrow_type: 'pyarrow.DataType') -> Optional[pd.api.extensions.ExtensionDtype]:
+    """
+    pandas dtype for an Arrow column of a Polars result: integers become Int64 as the plotter and
+    concat_frames expect, dictionary columns use the default (pd.Categorical), the rest stay Arrow.
+    """
+    if pyarrow.types.is_dictionary(arrow_type):
+        return None
+    if arrow_type == pyarrow.int64():
+        return pd.Int64Dtype()
+    return pd.ArrowDtype(arrow_type)
+
+
+def polars_to_pandas(polars_dfs: Dict[str, 'pl.DataFrame'], raw_headers: Dict[str, str],
+                     source_path: str) -> Dict[str, pd.DataFrame]:
+    """
+    Hand Polars results to pandas without copying: columns stay Arrow-backed (pd.ArrowDtype)
+    except integers (Int64), categoricals (pd.Categorical, as in the pandas engine) and the line
+    index, which raw-line lookups read as NumPy arrays. Raw headers are kept in attrs.
+    """
+    dataframes = {}
+    for name, frame in polars_dfs.items():
+        df = frame.to_pandas(types_mapper=arrow_types_mapper)
+        df = restore_text_columns(df, [col for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)])
+        if LINE_OFFSET_COLUMN in df.columns:
+            df[LINE_OFFSET_COLUMN] = df[LINE_OFFSET_COLUMN].to_numpy(np.int64)
+            df[LINE_LENGTH_COLUMN] = df[LINE_LENGTH_COLUMN].to_numpy(np.int32)
+            df.attrs[SOURCE_FILE_ATTR] = os.path.abspath(source_path)
+        if name in raw_headers:
+            df.attrs['__parser_raw_header__'] = raw_headers[name]
+        dataframes[name] = df
     return dataframes
 
 
@@ -907,13 +4052,273 @@ def convert_to_polars(pandas_dfs: Dict[str, pd.DataFrame]) -> Dict:
     return polars_dfs
 
 
-def parse_log_file(file_path: str = None, timestamp_offset: timedelta = timedelta(hours=5, minutes=30)) -> Tuple[Dict[str, pd.DataFrame], str]:
+# Separates the file label from the message type in the frames of a multi-file parse
+FILE_NAMESPACE_SEPARATOR = ':'
+
+
+def file_label(file_path: str, taken: Set[str]) -> str:
+    """Short unique name for a file: its base name without extensions, with no '.' (used in 'frame.column')."""
+    name = os.path.basename(file_path)
+    for extension in ('.gz', '.bz2', '.xz', '.zst'):
+        if name.endswith(extension):
+            name = name[:-len(extension)]
+    label = os.path.splitext(name)[0].replace('.', '_').replace(FILE_NAMESPACE_SEPARATOR, '_') or 'log'
+    unique_label, n = label, 1
+    while unique_label in taken:
+        n += 1
+        unique_label = f"{label}_{n}"
+    taken.add(unique_label)
+    return unique_label
+
+
+def parse_log_file_worker(file_path: str, options: Dict[str, Any],
+                          report: Optional[ParseReport] = None) -> Tuple[Dict[str, pd.DataFrame], str, Any]:
+    """Parse one file of a multi-file load in a worker process; the filled-in report is sent back."""
+    dataframes, filename = parse_universal_log(file_path, report=report, **options)
+    return dict(dataframes), filename, report
+
+
+def parse_log_files(file_paths: List[str], timestamp_offset: timedelta = timedelta(hours=5, minutes=30),
+                    workers: Optional[int] = None, use_cache: bool = True,
+                    cache_dir: Optional[str] = None, engine: str = 'pandas',
+                    filter: Optional[ParseFilter] = None, progress: Optional[ParseProgress] = None,
+                    compact: bool = False, memory_budget_mb: Optional[float] = None,
+                    report: Optional[ParseReport] = None) -> Tuple[Dict[str, pd.DataFrame], List[str]]:
+    """
+    Parse several log files concurrently, one worker process per file, into one dict of
+    '<file label>:<DataFrame name>' frames; files that fail or hold no data are skipped.
+    Options are as in parse_universal_log; memory_budget_mb covers all files together and
+    report gets every file's stages plus the pool's wall time as its file_pool stage.
+    """
+    options = dict(timestamp_offset=timestamp_offset, workers=1, use_cache=use_cache, cache_dir=cache_dir,
+                   engine=engine, filter=filter, compact=compact or memory_budget_mb is not None)
+    n_workers = min(len(file_paths), workers or os.cpu_count() or 1)
+    
+    # Progress counts whole files, weighted by their size on disk
+    bounds = np.cumsum([0] + [os.path.getsize(path) for path in file_paths]).tolist()
+    file_ranges = list(zip(bounds[:-1], bounds[1:]))
+    if progress is not None:
+        progress.stage(f"Parsing {len(file_paths)} files", bounds[-1])
+    
+    print(f"Parsing {len(file_paths)} files with {n_workers} worker processes...")
+    pool_stage = report.stage('file_pool') if report is not None else nullcontext(StageStats())
+    with pool_stage as pool_stats, worker_pool(n_workers) as executor:
+        pool_stats.count(n_bytes=bounds[-1])
+        futures = [executor.submit(run_in_worker, parse_log_file_worker, path, options,
+                                   ParseReport(report.trace_memory) if report is not None else None)
+                   for path in file_paths]
+        for future, (_, end) in zip(futures, file_ranges):
+            # Cancel is noticed while a file is still being parsed; failures are reported below
+            wait_for_future(future, progress)
+            if progress is not None:
+                progress.advance(end)
+    
+    dataframes = {}
+    filenames = []
+    labels = set()
+    for path, future in zip(file_paths, futures):
+        try:
+            file_dataframes, filename, file_report = worker_result(future, report)
+        except Exception as e:
+            print(f"Error: Failed to parse {os.path.basename(path)}: {e}")
+            continue
+        if not file_dataframes:
+            print(f"  Warning: No data loaded from {filename}")
+            continue
+        label = file_label(path, labels)
+        for df_name, df in file_dataframes.items():
+            dataframes[f"{label}{FILE_NAMESPACE_SEPARATOR}{df_name}"] = df
+        filenames.append(filename)
+        if report is not None:
+            report.add_file(file_report, label)
+        print(f"  {label}: {filename} ({len(file_dataframes)} DataFrames)")
+    
+    if memory_budget_mb is not None and dataframes:
+        # Each file was compacted on its own; only the combined frames can be held to the budget
+        with report.activate() if report is not None else nullcontext():
+            with report_stage('compaction'):
+                dataframes = compact_dataframes(dataframes, memory_budget_mb)
+    if report is not None:
+        report.file_path = ", ".join(filenames)
+    return dataframes, filenames
+
+
+def parse_log_file(file_path: str = None, timestamp_offset: timedelta = timedelta(hours=5, minutes=30),
+                   workers: Optional[int] = None, use_cache: bool = True,
+                   cache_dir: Optional[str] = None, engine: str = 'pandas',
+                   filter: Optional[ParseFilter] = None, lazy: bool = False,
+                   progress: Optional[ParseProgress] = None,
+                   incremental: bool = False, compact: bool = False,
+                   memory_budget_mb: Optional[float] = None,
+                   report: Optional[ParseReport] = None) -> Tuple[Dict[str, pd.DataFrame], str]:
     """Wrapper for log_plotter.py compatibility."""
-    return parse_universal_log(file_path=file_path, timestamp_offset=timestamp_offset)
+    return parse_universal_log(file_path=file_path, timestamp_offset=timestamp_offset, workers=workers,
+                               use_cache=use_cache, cache_dir=cache_dir, engine=engine,
+                               filter=filter, lazy=lazy, progress=progress, incremental=incremental,
+                               compact=compact, memory_budget_mb=memory_budget_mb, report=report)
+
+
+# Columnar export written by the command-line converter (see convert_log_files)
+CONVERTED_MANIFEST_NAME = 'clan_manifest.json'
+CONVERT_FORMATS = ('parquet', 'feather', 'dataset')
+
+
+def write_columnar(dataframes: Dict[str, pd.DataFrame], output_dir: str, fmt: str = 'parquet',
+                   source_path: str = '', rows_per_file: Optional[int] = None) -> str:
+    """
+    Write each DataFrame to output_dir as a Parquet or Feather file, or as a
+    partitioned Parquet dataset (a directory of files of up to rows_per_file rows),
+    plus a manifest with the frame names and attrs. Returns the manifest path,
+    which load_columnar (and parse_universal_log) open directly.
+    """
+    if fmt not in CONVERT_FORMATS:
+        raise ValueError(f"Unknown output format '{fmt}', expected one of {CONVERT_FORMATS}")
+    if not HAS_PYARROW:
+        raise ImportError("Writing Parquet/Feather files requires pyarrow")
+    
+    os.makedirs(output_dir, exist_ok=True)
+    frames = []
+    for name, df in dataframes.items():
+        base_name = re.sub(r'[^\w.-]', '_', name)
+        if fmt == 'feather':
+            file_name = f'{base_name}.feather'
+            df.to_feather(os.path.join(output_dir, file_name))
+        elif fmt == 'parquet':
+            file_name = f'{base_name}.parquet'
+            df.to_parquet(os.path.join(output_dir, file_name), index=False)
+        else:
+            # Zero-padded part numbers keep the row order when the directory is read back
+            import pyarrow.parquet
+            file_name = base_name
+            dataset_dir = os.path.join(output_dir, file_name)
+            shutil.rmtree(dataset_dir, ignore_errors=True)
+            os.makedirs(dataset_dir)
+            table = pyarrow.Table.from_pandas(df, preserve_index=False)
+            part_rows = rows_per_file or max(1, table.num_rows)
+            for part, start in enumerate(range(0, max(1, table.num_rows), part_rows)):
+                pyarrow.parquet.write_table(table.slice(start, part_rows),
+                                            os.path.join(dataset_dir, f'part-{part:05d}.parquet'))
+        frames.append({'name': name, 'file': file_name, 'attrs': df.attrs})
+    
+    manifest_path = os.path.join(output_dir, CONVERTED_MANIFEST_NAME)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump({'source': source_path, 'format': fmt, 'frames': frames}, f)
+    return manifest_path
+
+
+def load_columnar(manifest_path: str) -> Tuple[Dict[str, pd.DataFrame], str]:
+    """Load DataFrames written by write_columnar, named after the log they were converted from."""
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    
+    output_dir = os.path.dirname(manifest_path)
+    dataframes = {}
+    for frame in manifest['frames']:
+        path = os.path.join(output_dir, frame['file'])
+        df = pd.read_feather(path) if manifest['format'] == 'feather' else pd.read_parquet(path)
+        df.attrs.update(frame['attrs'])
+        dataframes[frame['name']] = df
+    
+    filename = os.path.basename(manifest['source']) if manifest['source'] else os.path.basename(output_dir)
+    print(f"Loaded {len(dataframes)} converted DataFrames of {filename}")
+    return dataframes, filename
+
+
+def convert_log_files(file_paths: List[str], output_dir: str, fmt: str = 'parquet', workers: Optional[int] = None,
+                      rows_per_file: Optional[int] = None, quiet: bool = False, report_path: Optional[str] = None,
+                      trace_memory: bool = False, **parse_options) -> int:
+    """
+    Parse each log and write its DataFrames to <output_dir>/<file label>/ (see write_columnar),
+    printing per-file throughput. Returns the number of files that could not be converted.
+    With report_path, the ParseReport of every log is written there as a JSON list ('-' prints it).
+    """
+    failed = 0
+    labels = set()
+    reports = []
+    for file_path in file_paths:
+        label = file_label(file_path, labels)
+        start = time.perf_counter()
+        report = ParseReport(trace_memory) if report_path else None
+        try:
+            with contextlib.redirect_stdout(io.StringIO()) if quiet else nullcontext():
+                dataframes, _ = parse_universal_log(file_path, workers=workers, report=report, **parse_options)
+                if report is not None:
+                    reports.append(report.to_dict())
+                if not dataframes:
+                    raise ValueError("no data parsed")
+                manifest_path = write_columnar(dataframes, os.path.join(output_dir, label), fmt,
+                                               source_path=os.path.abspath(file_path), rows_per_file=rows_per_file)
+        except Exception as e:
+            failed += 1
+            print(f"FAILED {file_path}: {e}", file=sys.stderr)
+            continue
+        
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        size_mb = os.path.getsize(file_path) / (1024 * 1024)
+        n_rows = sum(len(df) for df in dataframes.values())
+        print(f"{file_path}: {len(dataframes)} DataFrames, {n_rows:,} rows, {size_mb:.1f} MB in {elapsed:.2f}s "
+              f"({size_mb / elapsed:.1f} MB/s, {n_rows / elapsed:,.0f} rows/s) -> {manifest_path}")
+    
+    if report_path == '-':
+        print(json.dumps(reports, indent=2))
+    elif report_path:
+        with open(report_path, 'w') as f:
+            json.dump(reports, f, indent=2)
+        print(f"Parse report written to {report_path}")
+    return failed
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    arg_parser = argparse.ArgumentParser(
+        description="Convert logs to Parquet/Feather files, one per message type. "
+                    "Without paths, pick a file interactively and print the parsed DataFrames.")
+    arg_parser.add_argument('paths', nargs='*', help="Log files or glob patterns (e.g. 'dumps/**/*.log.gz')")
+    arg_parser.add_argument('-o', '--output-dir', default='converted',
+                            help="Directory for the converted files (default: %(default)s)")
+    arg_parser.add_argument('-f', '--format', choices=CONVERT_FORMATS, default='parquet',
+                            help="Output format; 'dataset' writes a directory of Parquet files per message type")
+    arg_parser.add_argument('--rows-per-file', type=int, help="Maximum rows per file of a 'dataset' output")
+    arg_parser.add_argument('-w', '--workers', type=int,
+                            help="Parser processes per file (default: all cores for large files)")
+    arg_parser.add_argument('--engine', choices=PARSE_ENGINES, default='pandas')
+    arg_parser.add_argument('--offset-hours', type=float, default=5.5,
+                            help="Offset added to parsed timestamps (default: %(default)s)")
+    arg_parser.add_argument('--message-types', help="Comma-separated DataFrame names to keep")
+    arg_parser.add_argument('--columns', help="Comma-separated columns to keep (the timestamp is always kept)")
+    arg_parser.add_argument('--compact', action='store_true',
+                            help="Store columns in the smallest dtypes that keep their values")
+    arg_parser.add_argument('--memory-budget-mb', type=float,
+                            help="Round floats to float32 if a log's frames need more memory (implies --compact)")
+    arg_parser.add_argument('--cache', action='store_true',
+                            help="Also store the parse in the parse cache, so the GUI opens the original logs instantly")
+    arg_parser.add_argument('--report', metavar='PATH',
+                            help="Write the time, lines and memory of each parse stage and message type "
+                                 "of every log to PATH as JSON ('-' prints it)")
+    arg_parser.add_argument('--trace-memory', action='store_true',
+                            help="Add Python allocation peaks (tracemalloc) to --report (slows parsing)")
+    arg_parser.add_argument('-q', '--quiet', action='store_true', help="Only print one line per file")
+    return arg_parser
+
+
+def parse_name_list(names: Optional[str]) -> Optional[Set[str]]:
+    """Split a comma-separated command-line list into a set (None if not given)."""
+    if not names:
+        return None
+    return {name.strip() for name in names.split(',') if name.strip()}
+
 
+def expand_log_paths(patterns: List[str]) -> List[str]:
+    """Expand glob patterns (shells on Windows do not), keeping order and dropping duplicates and directories."""
+    paths = []
+    for pattern in patterns:
+        is_pattern = any(char in pattern for char in '*?[')
+        matches = sorted(glob.glob(pattern, recursive=True)) if is_pattern else [pattern]
+        paths.extend(path for path in matches if path not in paths and not os.path.isdir(path))
+    return paths
 
-def main():
-    """Main function for testing"""
+
+def interactive_main():
+    """Pick a log with a file dialog and print its parsed DataFrames"""
     print("Universal CSV/TSV/Log Parser - FIXED VERSION")
     print("Handles: Interleaved, Standard CSV, TSV, Mixed formats")
     print("="*70)
@@ -941,7 +4346,32 @@ def main():
     return dataframes, polars_dataframes
 
 
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point: convert the given logs, or parse one interactively if none are given."""
+    args = build_arg_parser().parse_args(argv)
+    
+    if not args.paths:
+        pandas_dfs, _ = interactive_main()
+        if pandas_dfs:
+            print("\n✓ Parsing completed successfully!")
+        return 0 if pandas_dfs else 1
+    
+    file_paths = expand_log_paths(args.paths)
+    if not file_paths:
+        print("No log files matched", file=sys.stderr)
+        return 2
+    
+    failed = convert_log_files(file_paths, args.output_dir, fmt=args.format, workers=args.workers,
+                               rows_per_file=args.rows_per_file, quiet=args.quiet,
+                               report_path=args.report, trace_memory=args.trace_memory,
+                               timestamp_offset=timedelta(hours=args.offset_hours), use_cache=args.cache,
+                               engine=args.engine,
+                               filter=ParseFilter(parse_name_list(args.message_types), parse_name_list(args.columns)),
+                               compact=args.compact,
+                               memory_budget_mb=args.memory_budget_mb)
+    print(f"Converted {len(file_paths) - failed} of {len(file_paths)} files to {args.output_dir}")
+    return 1 if failed else 0
+
+
 if __name__ == "__main__":
-    pandas_dfs, polars_dfs = main()
-    if pandas_dfs:
-        print("\n✓ Parsing completed successfully!")
+    sys.exit(main())